@@ -12,6 +12,7 @@ from ravendb.documents.commands.batches import (
     DeleteCompareExchangeCommandData,
 )
 from ravendb.documents.commands.crud import DeleteDocumentCommand, PutDocumentCommand
+from ravendb.documents.commands.stream import StreamResultResponse, StreamResult
 from ravendb.documents.indexes.analysis.definitions import AnalyzerDefinition
 from ravendb.documents.indexes.definitions import (
     IndexDeploymentMode,
@@ -35,6 +36,7 @@ from ravendb.documents.operations.attachments import (
     DeleteAttachmentOperation,
     PutAttachmentOperation,
     GetAttachmentOperation,
+    GetAttachmentsOperation,
     AttachmentRequest,
 )
 from ravendb.documents.operations.backups.settings import (
@@ -178,6 +180,7 @@ from ravendb.documents.queries.suggestions import (
 )
 from ravendb.documents.session.cluster_transaction_operation import ClusterTransactionOperations
 from ravendb.documents.session.document_info import DocumentInfo
+from ravendb.documents.session.async_document_session import AsyncDocumentSession
 from ravendb.documents.session.document_session import DocumentSession
 from ravendb.documents.session.entity_to_json import EntityToJson
 from ravendb.documents.session.document_session_operations.in_memory_document_session_operations import (
@@ -199,7 +202,9 @@ from ravendb.documents.session.misc import (
     DocumentQueryCustomization,
     ResponseTimeInformation,
     TransactionMode,
+    ChangeTrackingMode,
     SessionOptions,
+    StreamQueryStatistics,
 )
 from ravendb.documents.session.operations.lazy import (
     LazySessionOperations,
@@ -211,7 +216,11 @@ from ravendb.documents.session.operations.lazy import (
     LazyConditionalLoadOperation,
 )
 from ravendb.documents.session.operations.load_operation import LoadOperation
-from ravendb.documents.session.operations.operations import LoadStartingWithOperation, MultiGetOperation
+from ravendb.documents.session.operations.operations import (
+    LoadStartingWithOperation,
+    MultiGetOperation,
+    StreamOperation,
+)
 from ravendb.documents.session.operations.query import QueryOperation
 from ravendb.documents.session.query import (
     AbstractDocumentQuery,
@@ -223,11 +232,19 @@ from ravendb.documents.session.query import (
 from ravendb.documents.session.query_group_by import GroupByDocumentQuery, GroupByField
 from ravendb.documents.session.utils.document_query import DocumentQueryHelper
 from ravendb.documents.session.utils.includes_util import IncludesUtil
-from ravendb.documents.store.definition import DocumentStore, DocumentStoreBase
+from ravendb.documents.store.definition import AsyncDocumentStore, DocumentStore, DocumentStoreBase
 from ravendb.documents.store.lazy import Lazy
 from ravendb.documents.session.conditional_load import ConditionalLoadResult
-from ravendb.documents.store.misc import IdTypeAndName
-from ravendb.http.misc import AggressiveCacheOptions, Broadcast, LoadBalanceBehavior, ReadBalanceBehavior
+from ravendb.documents.store.misc import IdTypeAndName, AggressiveCacheScope
+from ravendb.http.misc import (
+    AggressiveCacheMode,
+    AggressiveCacheOptions,
+    Broadcast,
+    LoadBalanceBehavior,
+    ReadBalanceBehavior,
+)
+from ravendb.http.compression import HttpCompression, HttpCompressionAlgorithm
+from ravendb.http.async_request_executor import AsyncRequestExecutor
 from ravendb.http.raven_command import RavenCommand
 from ravendb.http.request_executor import ClusterRequestExecutor, RequestExecutor
 from ravendb.http.server_node import ServerNode
@@ -236,6 +253,7 @@ from ravendb.http.topology import (
     CurrentIndexAndNode,
     CurrentIndexAndNodeAndEtag,
     RaftCommand,
+    NodeLatency,
     NodeSelector,
     Topology,
     UpdateTopologyParameters,
@@ -245,6 +263,7 @@ from ravendb.http.topology import (
 # UriUtility
 # ServerWide
 # CompactSettings
+from ravendb.json.json_codec import JsonCodec, StdlibJsonCodec, OrjsonCodec
 from ravendb.json.metadata_as_dictionary import MetadataAsDictionary
 from ravendb.json.result import BatchCommandResult
 from ravendb.serverwide.commands import GetDatabaseTopologyCommand, GetClusterTopologyCommand
@@ -356,8 +375,6 @@ from ravendb.documents.identity.hilo import (
 # GetConflictsCommand
 # PutAttachmentCommandHelper
 # SetupDocumentBase
-# StreamResultResponse
-# StreamResult
 # GetRevisionOperation
 # GetRevisionsCountOperation
 # IEagerSessionOperations
@@ -366,7 +383,6 @@ from ravendb.documents.identity.hilo import (
 # LazyGetCompareExchangeValuesOperation
 # LazyRevisionOperation
 # LazyRevisionOperations
-# StreamOperation
 # ConfigureRevisionsOperation
 # GetRevisionsOperation
 # RevisionsResult
@@ -475,7 +491,6 @@ from ravendb.documents.identity.hilo import (
 # IQueryBase
 # QueryEvents
 # QueryOptions
-# StreamQueryStatistics
 # SessionEvents
 # ILazyClusterTransactionOperations
 # ISessionDocumentAppendTimeSeriesBase
@@ -5,6 +5,7 @@ from typing import TYPE_CHECKING, Dict, Optional, Callable, Any, List
 
 from websocket import WebSocket
 
+from ravendb.changes.dispatch import ChangesOverflowPolicy, DispatchStats
 from ravendb.changes.observers import Observable
 from ravendb.changes.types import (
     DocumentChange,
@@ -23,7 +24,7 @@ from ravendb.exceptions.exceptions import ChangeProcessingException
 from ravendb.tools.utils import Utils
 import copy
 from time import sleep
-from concurrent.futures import ThreadPoolExecutor, TimeoutError, Future
+from concurrent.futures import Executor, ThreadPoolExecutor, TimeoutError, Future
 import logging
 import sys
 
@@ -39,6 +40,9 @@ class DatabaseChanges:
         on_close: Callable[[str], None],
         on_error: Optional[Callable[[Exception], None]] = None,
         executor: Optional[ThreadPoolExecutor] = None,
+        dispatch_executor: Optional[Executor] = None,
+        max_queued_changes: int = 1024,
+        overflow_policy: ChangesOverflowPolicy = ChangesOverflowPolicy.BLOCK,
     ):
         self._request_executor = request_executor
         self._conventions = request_executor.conventions
@@ -52,6 +56,10 @@ class DatabaseChanges:
         self._observables_by_group: Dict[str, Dict[str, Observable[DatabaseChange]]] = {}
 
         self._executor = executor if executor else ThreadPoolExecutor(max_workers=10)
+        # the subscribers are called from here, so a slow one doesn't hold up receiving the changes
+        self._dispatch_executor = dispatch_executor if dispatch_executor else self._executor
+        self._max_queued_changes = max_queued_changes
+        self._overflow_policy = overflow_policy
         self._worker = self._executor.submit(self.do_work)
         self.send_lock = Lock()
         self._confirmations_lock = Lock()
@@ -154,7 +162,7 @@ class DatabaseChanges:
                 else:
                     change_json_dict: Optional[Dict[str, Any]] = response.get("Value", None)
                     self._notify_subscribers(
-                        response_type, change_json_dict, copy.copy(self._observables_by_group[response_type])
+                        response_type, change_json_dict, copy.copy(self._observables_by_group.get(response_type, {}))
                     )
             except Exception as e:
                 self.notify_about_error(e)
@@ -180,6 +188,18 @@ class DatabaseChanges:
         for observable in observables.values():
             observable.send(result)
 
+    @property
+    def dispatch_stats(self) -> DispatchStats:
+        """
+        Changes waiting for the subscribers, delivered and dropped by the overflow policy, summed over the observables,
+        and the longest time a change waited to be delivered
+        """
+        stats = DispatchStats()
+        for observables in list(self._observables_by_group.values()):
+            for observable in list(observables.values()):
+                stats += observable.dispatch_stats
+        return stats
+
     def close(self):
         self._closed = True
         self.client_websocket.close()
@@ -214,7 +234,7 @@ class DatabaseChanges:
 
     def for_all_operations(self) -> Observable[OperationStatusChange]:
         observable = self.get_or_add_observable(
-            "OperationsStatusChange",
+            "OperationStatusChange",
             "all-operations",
             "watch-operations",
             "unwatch-operations",
@@ -239,12 +259,12 @@ class DatabaseChanges:
 
     def for_operation_id(self, operation_id: int) -> Observable[OperationStatusChange]:
         observable = self.get_or_add_observable(
-            "OperationsStatusChange",
+            "OperationStatusChange",
             "operations/" + str(operation_id),
             "watch-operation",
             "unwatch-operation",
             str(operation_id),
-        )(lambda x: x.operation_id == str(operation_id))
+        )(lambda x: str(x.operation_id) == str(operation_id))
         return observable
 
     def for_document(self, doc_id: str) -> Observable[DocumentChange]:
@@ -402,6 +422,9 @@ class DatabaseChanges:
                 on_connect=on_connect,
                 on_disconnect=on_disconnect,
                 executor=self._executor,
+                dispatch_executor=self._dispatch_executor,
+                max_queued_changes=self._max_queued_changes,
+                overflow_policy=self._overflow_policy,
             )
             self._observables_by_group[group][name] = observable
             if self._immediate_connection != 0:
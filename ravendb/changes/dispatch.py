@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import datetime
+import time
+from collections import deque
+from concurrent.futures import Executor
+from enum import Enum
+from threading import Condition
+from typing import Callable, Deque, Generic, Optional, Tuple, TypeVar
+
+_T_Change = TypeVar("_T_Change")
+
+
+class ChangesOverflowPolicy(Enum):
+    # the receiving thread waits until the subscribers catch up - nothing is lost, but the other observables wait too
+    BLOCK = "Block"
+    DROP_OLDEST = "DropOldest"
+    # keeps only the latest change of a document (counter and time series changes go by their document), falls back
+    # to DROP_OLDEST for changes of other documents or without one
+    COALESCE = "Coalesce"
+
+
+class DispatchStats:
+    def __init__(self, queued: int = 0, delivered: int = 0, dropped: int = 0, max_lag: datetime.timedelta = None):
+        self.queued = queued
+        self.delivered = delivered
+        self.dropped = dropped
+        self.max_lag = max_lag or datetime.timedelta()
+
+    def __add__(self, other: DispatchStats) -> DispatchStats:
+        return DispatchStats(
+            self.queued + other.queued,
+            self.delivered + other.delivered,
+            self.dropped + other.dropped,
+            max(self.max_lag, other.max_lag),
+        )
+
+
+class DispatchQueue(Generic[_T_Change]):
+    """
+    Hands the changes received by DatabaseChanges over to the subscribers of one observable.
+    The changes are delivered one by one in the order of arrival by a task of the executor, which is started when the
+    queue stops being empty.
+    """
+
+    def __init__(
+        self,
+        deliver: Callable[[_T_Change], None],
+        executor: Executor,
+        capacity: int = 1024,
+        overflow_policy: ChangesOverflowPolicy = ChangesOverflowPolicy.BLOCK,
+    ):
+        if capacity <= 0:
+            raise ValueError("Capacity must be positive")
+        self._deliver = deliver
+        self._executor = executor
+        self._capacity = capacity
+        self._overflow_policy = overflow_policy
+
+        self._condition = Condition()
+        self._queue: Deque[Tuple[float, _T_Change]] = deque()
+        self._draining = False
+        self._closed = False
+
+        self._delivered = 0
+        self._dropped = 0
+        self._max_lag = 0.0
+
+    @property
+    def stats(self) -> DispatchStats:
+        with self._condition:
+            return DispatchStats(
+                len(self._queue), self._delivered, self._dropped, datetime.timedelta(seconds=self._max_lag)
+            )
+
+    def put(self, change: _T_Change) -> None:
+        with self._condition:
+            if len(self._queue) >= self._capacity:
+                if self._overflow_policy == ChangesOverflowPolicy.BLOCK:
+                    self._condition.wait_for(lambda: self._closed or len(self._queue) < self._capacity)
+                elif self._overflow_policy != ChangesOverflowPolicy.COALESCE or not self._coalesce(change):
+                    self._queue.popleft()
+                    self._dropped += 1
+
+            if self._closed:
+                return
+
+            self._queue.append((time.perf_counter(), change))
+            if self._draining:
+                return
+            self._draining = True
+
+        try:
+            self._executor.submit(self._drain)
+        except RuntimeError:  # executor was shut down
+            self.close()
+
+    def _coalesce(self, change: _T_Change) -> bool:
+        key = self._coalesce_key(change)
+        if key is None:
+            return False
+
+        for index, (_, queued) in enumerate(self._queue):
+            if self._coalesce_key(queued) == key:
+                del self._queue[index]
+                self._dropped += 1
+                return True
+        return False
+
+    @staticmethod
+    def _coalesce_key(change: _T_Change) -> Optional[str]:
+        key = getattr(change, "key", None) or getattr(change, "document_id", None)
+        return key.casefold() if key else None
+
+    def _drain(self) -> None:
+        while True:
+            with self._condition:
+                if not self._queue or self._closed:
+                    self._draining = False
+                    return
+                enqueued_at, change = self._queue.popleft()
+                self._max_lag = max(self._max_lag, time.perf_counter() - enqueued_at)
+                self._condition.notify_all()
+
+            self._deliver(change)
+
+            with self._condition:
+                self._delivered += 1
+
+    def close(self) -> None:
+        with self._condition:
+            self._closed = True
+            self._queue.clear()
+            self._condition.notify_all()
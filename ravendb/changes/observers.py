@@ -1,8 +1,9 @@
 from __future__ import annotations
-from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
 from threading import Lock
 from typing import Callable, Generic, TypeVar, Optional
 
+from ravendb.changes.dispatch import ChangesOverflowPolicy, DispatchQueue, DispatchStats
 from ravendb.tools.concurrentset import ConcurrentSet
 
 _T_Change = TypeVar("_T_Change")
@@ -14,7 +15,14 @@ class Observable(Generic[_T_Change]):
         on_connect: Optional[Callable[[], None]] = None,
         on_disconnect: Optional[Callable[[], None]] = None,
         executor: Optional[ThreadPoolExecutor] = None,
+        dispatch_executor: Optional[Executor] = None,
+        max_queued_changes: Optional[int] = None,
+        overflow_policy: ChangesOverflowPolicy = ChangesOverflowPolicy.BLOCK,
     ):
+        """
+        Given a dispatch_executor the changes are queued (up to max_queued_changes, then the overflow_policy applies)
+        and delivered to the subscribers by the executor, otherwise send calls the subscribers right away.
+        """
         self.on_connect = on_connect
         self._on_disconnect = on_disconnect
         self.last_exception = None
@@ -24,6 +32,11 @@ class Observable(Generic[_T_Change]):
         self._future_set = Future()
         self._subscribers = ConcurrentSet()
         self._executor = executor
+        self._dispatch_queue: Optional[DispatchQueue[_T_Change]] = (
+            DispatchQueue(self._deliver, dispatch_executor, max_queued_changes or 1024, overflow_policy)
+            if dispatch_executor is not None
+            else None
+        )
 
     def __call__(self, filter_method):
         self._filter = filter_method
@@ -32,7 +45,7 @@ class Observable(Generic[_T_Change]):
     def on_document_change_notification(self, value: _T_Change):
         try:
             if self._filter(value):
-                for subscriber in self._subscribers:
+                for subscriber in list(self._subscribers):
                     subscriber.on_next(value)
         except Exception as e:
             self.error(e)
@@ -88,7 +101,7 @@ class Observable(Generic[_T_Change]):
                     if f.cancelled():
                         self._future_set.cancel()
                     elif f.exception():
-                        self._future_set.set_exception(f.exception)
+                        self._future_set.set_exception(f.exception())
                     else:
                         self._future_set.set_result(None)
                 except Exception:
@@ -106,6 +119,9 @@ class Observable(Generic[_T_Change]):
             subscriber.on_error(exception)
 
     def close(self):
+        if self._dispatch_queue is not None:
+            self._dispatch_queue.close()
+
         future = Future()
         self.set(future)
         future.cancel()
@@ -113,18 +129,40 @@ class Observable(Generic[_T_Change]):
         for subscriber in self._subscribers:
             subscriber.on_completed()
 
+    def add_on_subscribed(self, callback: Callable[[], None]) -> None:
+        """
+        @param func callback: Called once the server confirmed watching the changes (or failed to), right away if it
+        already did
+        """
+        self._future_set.add_done_callback(lambda _: callback())
+
     def ensure_subscribe_now(self):
         self._future.result() if self._future else self._future_set.result()
 
+    @property
+    def dispatch_stats(self) -> DispatchStats:
+        return self._dispatch_queue.stats if self._dispatch_queue is not None else DispatchStats()
+
     def send(self, msg: _T_Change):
         try:
-            if self._filter(msg):
-                for subscriber in self._subscribers:
-                    subscriber.on_next(msg)
+            if not self._filter(msg):
+                return
         except Exception as e:
             self.error(e)
             return
 
+        if self._dispatch_queue is not None:
+            self._dispatch_queue.put(msg)
+        else:
+            self._deliver(msg)
+
+    def _deliver(self, msg: _T_Change):
+        try:
+            for subscriber in list(self._subscribers):
+                subscriber.on_next(msg)
+        except Exception as e:
+            self.error(e)
+
 
 class ActionObserver:
     def __init__(
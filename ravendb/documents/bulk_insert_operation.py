@@ -1,16 +1,29 @@
 from __future__ import annotations
 
-from datetime import datetime
+from datetime import datetime, timedelta
 from abc import ABC
 
-import _queue
 import concurrent
-import json
-from concurrent.futures import Future
-from copy import deepcopy
-from queue import Queue
-from threading import Lock, Semaphore
-from typing import Optional, TYPE_CHECKING, List, TypeVar, Type, Generic, Callable
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from queue import Full, Queue
+from threading import Condition, Lock
+from json.encoder import encode_basestring
+from typing import (
+    Optional,
+    TYPE_CHECKING,
+    List,
+    TypeVar,
+    Type,
+    Generic,
+    Callable,
+    Deque,
+    Generator,
+    Iterable,
+    Union,
+    Tuple,
+)
 
 import requests
 
@@ -22,6 +35,7 @@ from ravendb.documents.session.time_series import (
 from ravendb.documents.time_series import TimeSeriesOperations
 from ravendb.primitives import constants
 from ravendb.exceptions.raven_exceptions import RavenException
+from ravendb.http.compression import HttpCompression, HttpCompressionAlgorithm
 from ravendb.http.server_node import ServerNode
 from ravendb.http.raven_command import RavenCommand
 from ravendb.documents.operations.misc import GetOperationStateOperation
@@ -43,34 +57,88 @@ _T_TS_Bindable = TypeVar("_T_TS_Bindable", bound=ITimeSeriesValuesBindable)
 
 class BulkInsertOperation:
     class _BufferExposer:
-        def __init__(self):
+        """
+        Hands the buffers filled by the bulk insert operation over to the request body generator.
+
+        At most max_buffers_in_flight filled buffers are waiting for the connection - a producer that gets ahead
+        of the network blocks until one of them is sent. Sent buffers are cleared and reused, the pool never
+        grows beyond the buffers in flight plus the ones being filled and sent.
+        """
+
+        def __init__(self, max_buffers_in_flight: int = 8, statistics: BulkInsertStatistics = None):
             self._ongoing_operation = Future()  # todo: is there any reason to use Futures? (look at error handling)
-            self._yield_buffer_semaphore = Semaphore(1)
-            self._buffers_to_flush_queue = Queue()
+            self._max_buffers_in_flight = max_buffers_in_flight
+            self._buffers_to_flush: Deque[Union[bytearray, memoryview]] = deque()
+            self._free_buffers: List[bytearray] = []
+            self._condition = Condition()
+            self._closed = False
+            self._statistics = statistics or BulkInsertStatistics()
             self.output_stream_mock = Future()
 
-        def enqueue_buffer_for_flush(self, buffer: bytearray):
-            self._buffers_to_flush_queue.put(bytes(buffer))
+        def rent_buffer(self) -> bytearray:
+            with self._condition:
+                return self._free_buffers.pop() if self._free_buffers else bytearray()
 
-        # todo: blocking semaphore acquired and released on enter and exit from bulk insert operation context manager
-        def send_data(self):
-            while True:
-                try:
-                    buffer_to_flush = self._buffers_to_flush_queue.get(timeout=0.05)  # todo: adjust this pooling time
-                    yield buffer_to_flush
-                except Exception as e:
-                    if not isinstance(e, _queue.Empty) or self.is_operation_finished():
-                        break
-                    continue  # expected Empty exception coming from queue, operation isn't finished yet
+        def enqueue_buffer_for_flush(self, buffer: Union[bytearray, memoryview]) -> None:
+            with self._condition:
+                if len(self._buffers_to_flush) >= self._max_buffers_in_flight and not self._closed:
+                    stall_start = time.perf_counter()
+                    while len(self._buffers_to_flush) >= self._max_buffers_in_flight and not self._closed:
+                        self._condition.wait()
+                    self._statistics._stalled_seconds += time.perf_counter() - stall_start
+
+                if self._closed:
+                    # the request is gone, its error is raised from the bulk insert execute task
+                    return
+
+                self._buffers_to_flush.append(buffer)
+                self._condition.notify_all()
+
+        def send_data(self) -> Generator[memoryview, None, None]:
+            try:
+                while True:
+                    with self._condition:
+                        while not self._buffers_to_flush and not self.is_operation_finished():
+                            self._condition.wait()
+
+                        if not self._buffers_to_flush:
+                            return
+
+                        buffer = self._buffers_to_flush.popleft()
+                        self._condition.notify_all()
+
+                    # the connection writes the view out before asking for the next chunk,
+                    # so the buffer can be reused as soon as the generator is resumed
+                    with memoryview(buffer) as view:
+                        yield view
+
+                    with self._condition:
+                        self._statistics._bytes_sent += len(buffer)
+                        # large payloads (attachments) are enqueued as views of the caller's data, never reuse them
+                        if isinstance(buffer, bytearray):
+                            buffer.clear()
+                            self._free_buffers.append(buffer)
+            finally:
+                self.close()
+
+        def close(self) -> None:
+            with self._condition:
+                self._closed = True
+                self._buffers_to_flush.clear()
+                self._condition.notify_all()
 
         def is_operation_finished(self) -> bool:
             return self._ongoing_operation.done()
 
         def finish_operation(self):
-            self._ongoing_operation.set_result(None)
+            with self._condition:
+                self._ongoing_operation.set_result(None)
+                self._condition.notify_all()
 
         def error_on_processing_request(self, exception: Exception):
-            self._ongoing_operation.set_exception(exception)
+            with self._condition:
+                self._ongoing_operation.set_exception(exception)
+                self._condition.notify_all()
 
         def error_on_request_start(self, exception: Exception):
             self.output_stream_mock.set_exception(exception)
@@ -82,6 +150,7 @@ class BulkInsertOperation:
             buffer_exposer: BulkInsertOperation._BufferExposer,
             node_tag: str,
             skip_overwrite_if_unchanged: bool,
+            compression_algorithm: HttpCompressionAlgorithm = HttpCompressionAlgorithm.GZIP,
         ):
             super().__init__(requests.Response)
             self._buffer_exposer = buffer_exposer
@@ -89,15 +158,23 @@ class BulkInsertOperation:
             self._selected_node_tag = node_tag
             self.use_compression = False
             self._skip_overwrite_if_unchanged = skip_overwrite_if_unchanged
+            self._compression_algorithm = compression_algorithm
 
         def create_request(self, node: ServerNode) -> requests.Request:
-            return requests.Request(
+            request = requests.Request(
                 "POST",
                 f"{node.url}/databases/{node.database}/bulk_insert?id={self._key}"
                 f"&skipOverwriteIfUnchanged={'true' if self._skip_overwrite_if_unchanged else 'false'}",
                 data=self._buffer_exposer.send_data(),
             )
 
+            if self.use_compression:
+                # buffers are compressed as they are handed over to the connection, the stream is never held in memory
+                request.data = HttpCompression.compress_stream(request.data, self._compression_algorithm)
+                request.headers[constants.Headers.CONTENT_ENCODING] = str(self._compression_algorithm)
+
+            return request
+
         def set_response(self, response: Optional[str], from_cache: bool) -> None:
             raise NotImplementedError("Not Implemented")
 
@@ -110,14 +187,20 @@ class BulkInsertOperation:
             except Exception as e:
                 self._buffer_exposer.error_on_request_start(e)
 
-    def __init__(self, database: str = None, store: "DocumentStore" = None, options: BulkInsertOptions = None):
-        self.use_compression = False
+    def __init__(
+        self,
+        database: str = None,
+        store: "DocumentStore" = None,
+        options: BulkInsertOptions = None,
+        node_tag: Optional[str] = None,
+    ):
+        self.use_compression = bool(options.use_compression) if options else False
 
         self._ongoing_bulk_insert_execute_task: Optional[Future] = None
         self._first = True
         self._in_progress_command: Optional[CommandType] = None
         self._operation_id = -1
-        self._node_tag = None
+        self._node_tag = node_tag
         self._concurrent_check_flag = 0
         self._concurrent_check_lock = Lock()
 
@@ -126,19 +209,18 @@ class BulkInsertOperation:
         if not database or database.isspace():
             self._throw_no_database()
 
-        self._use_compression = options.use_compression if options else False
         self._options = options or BulkInsertOptions()
         self._request_executor = store.get_request_executor(database)
 
-        self._enqueue_current_buffer_async = Future()
-        self._enqueue_current_buffer_async.set_result(None)
-
-        self._max_size_in_buffer = 1024 * 1024
-
-        self._current_data_buffer = bytearray()
+        self._flush_threshold = self._options.flush_threshold or BulkInsertOptions.DEFAULT_FLUSH_THRESHOLD
+        self._json_codec = self._conventions.json_codec
+        self._statistics = BulkInsertStatistics()
 
         self._time_series_batch_size = self._conventions.time_series_batch_size
-        self._buffer_exposer = BulkInsertOperation._BufferExposer()
+        self._buffer_exposer = BulkInsertOperation._BufferExposer(
+            self._options.max_buffers_in_flight or BulkInsertOptions.DEFAULT_MAX_BUFFERS_IN_FLIGHT, self._statistics
+        )
+        self._current_data_buffer = self._buffer_exposer.rent_buffer()
 
         self._generate_entity_id_on_the_client = GenerateEntityIdOnTheClient(
             self._request_executor.conventions,
@@ -160,12 +242,10 @@ class BulkInsertOperation:
             return
 
         # process the leftovers and finish the stream
-        if self._current_data_buffer:
+        if self._ongoing_bulk_insert_execute_task is not None:
             try:
                 self._write_string_no_escape("]")
-                self._enqueue_current_buffer_async.result()  # wait for enqueue
-                buffer = self._current_data_buffer
-                self._buffer_exposer.enqueue_buffer_for_flush(buffer)
+                self._buffer_exposer.enqueue_buffer_for_flush(self._current_data_buffer)
             except Exception as e:
                 flush_ex = e
 
@@ -180,6 +260,9 @@ class BulkInsertOperation:
                 self._ongoing_bulk_insert_execute_task.result()
             except Exception as e:
                 self._throw_bulk_insert_aborted(e, flush_ex)
+            finally:
+                # the elapsed time includes draining the buffers still in flight
+                self._statistics._stop()
 
     def _throw_bulk_insert_aborted(self, e: Exception, flush_ex: Optional[Exception]):
         error_from_server = None
@@ -204,7 +287,8 @@ class BulkInsertOperation:
         if self._operation_id != -1:
             return
 
-        bulk_insert_get_id_request = GetNextOperationIdCommand()
+        # the operation lives on the node that gave out its id, all the commands of the stream go there
+        bulk_insert_get_id_request = GetNextOperationIdCommand(self._node_tag)
         self._request_executor.execute_command(bulk_insert_get_id_request)
         self._operation_id = bulk_insert_get_id_request.result
         self._node_tag = bulk_insert_get_id_request.node_tag
@@ -232,39 +316,76 @@ class BulkInsertOperation:
         self.store_as(entity, key, metadata or MetadataAsDictionary())
         return key
 
-    def store_as(
-        self, entity: object, key: str, metadata: Optional[MetadataAsDictionary] = MetadataAsDictionary()
-    ) -> None:
+    def store_as(self, entity: object, key: str, metadata: Optional[MetadataAsDictionary] = None) -> None:
         try:
             self._concurrency_check()
             self._verify_valid_key(key)
             self._ensure_ongoing_operation()
 
+            metadata = metadata if metadata is not None else MetadataAsDictionary()
             self._fill_metadata_if_needed(entity, metadata)
             self._end_previous_command_if_needed()  # counters & time series commands shall end before pushing docs
 
             try:
-                if not self._first:
-                    self._write_comma()
+                self._write_put_command(entity, key, metadata)
+            except Exception as e:
+                self._handle_errors(key, e)
+        finally:
+            with self._concurrent_check_lock:
+                self._concurrent_check_flag = 0
 
-                self._first = False
-                self._in_progress_command = CommandType.NONE
+    def store_many(self, entities: Iterable[object]) -> List[str]:
+        """
+        Stores the entities like store() does, checking the operation state once for the whole batch.
+        Returns the ids of the stored documents.
+        """
+        keys = []
 
-                self._write_string_no_escape('{"Id":"')
-                self._write_string(key)
-                self._write_string_no_escape('","Type":"PUT","Document":')
+        def __documents():
+            for entity in entities:
+                key = self._get_id(entity)
+                keys.append(key)
+                yield entity, key, None
 
-                self._flush_if_needed()
+        self._store_all(__documents())
+        return keys
 
-                self._write_document(entity, metadata)
-                self._write_string_no_escape("}")
-                # todo: self._flush_if_needed() - causes error - https://issues.hibernatingrhinos.com/issue/RDBC-701
-            except Exception as e:
-                self._handle_errors(key, e)
+    def _store_all(self, documents: Iterable[Tuple[object, str, Optional[MetadataAsDictionary]]]) -> None:
+        try:
+            self._concurrency_check()
+            self._ensure_ongoing_operation()
+            self._end_previous_command_if_needed()
+
+            for entity, key, metadata in documents:
+                self._verify_valid_key(key)
+
+                metadata = metadata if metadata is not None else MetadataAsDictionary()
+                self._fill_metadata_if_needed(entity, metadata)
+
+                try:
+                    self._write_put_command(entity, key, metadata)
+                except Exception as e:
+                    self._handle_errors(key, e)
         finally:
             with self._concurrent_check_lock:
                 self._concurrent_check_flag = 0
 
+    def _write_put_command(self, entity: object, key: str, metadata: MetadataAsDictionary) -> None:
+        if not self._first:
+            self._current_data_buffer += b","
+
+        self._first = False
+        self._in_progress_command = CommandType.NONE
+
+        self._current_data_buffer += b'{"Id":"' + self._escape(key) + b'","Type":"PUT","Document":'
+
+        self._flush_if_needed()
+
+        self._write_document(entity, metadata)
+        self._current_data_buffer += b"}"
+        self._statistics._documents_count += 1
+        # todo: self._flush_if_needed() - causes error - https://issues.hibernatingrhinos.com/issue/RDBC-701
+
     def _handle_errors(self, document_id: str, e: Exception) -> None:
         error = self._get_exception_from_operation()
         if error is not None:
@@ -285,19 +406,15 @@ class BulkInsertOperation:
 
         return __return_func
 
-    def _flush_if_needed(self) -> None:
-        if len(self._current_data_buffer) > self._max_size_in_buffer or self._enqueue_current_buffer_async.done():
-            self._enqueue_current_buffer_async.result()  # wait
-
-            buffer = deepcopy(self._current_data_buffer)
-            self._current_data_buffer.clear()
-
-            # todo: check if it's better to create a new bytearray of max size instead of clearing it (possible dealloc)
+    @property
+    def statistics(self) -> BulkInsertStatistics:
+        return self._statistics
 
-            def __enqueue_buffer_for_flush(flushed_buffer: bytearray):
-                self._buffer_exposer.enqueue_buffer_for_flush(flushed_buffer)
-
-            self._enqueue_current_buffer_async = self._thread_pool_executor.submit(__enqueue_buffer_for_flush, buffer)
+    def _flush_if_needed(self) -> None:
+        if len(self._current_data_buffer) >= self._flush_threshold:
+            # blocks while the connection is max_buffers_in_flight buffers behind
+            self._buffer_exposer.enqueue_buffer_for_flush(self._current_data_buffer)
+            self._current_data_buffer = self._buffer_exposer.rent_buffer()
 
     def _end_previous_command_if_needed(self) -> None:
         if self._in_progress_command == CommandType.COUNTERS:
@@ -305,25 +422,36 @@ class BulkInsertOperation:
         elif self._in_progress_command == CommandType.TIME_SERIES:
             self.TimeSeriesBulkInsert._throw_already_running_time_series()
 
-    def _write_string(self, input_string: str) -> None:
-        for i in range(len(input_string)):
-            c = input_string[i]
-            if '"' == c:
-                if i == 0 or input_string[i - 1] != "\\":
-                    self._current_data_buffer += bytearray("\\", encoding="utf-8")
+    @staticmethod
+    def _escape(input_string: str) -> bytes:
+        # json string escaping without the surrounding quotes
+        return encode_basestring(input_string)[1:-1].encode("utf-8")
 
-            self._current_data_buffer += bytearray(c, encoding="utf-8")
+    def _write_string(self, input_string: str) -> None:
+        self._current_data_buffer += self._escape(input_string)
 
     def _write_comma(self) -> None:
-        self._current_data_buffer += bytearray(",", encoding="utf-8")
+        self._current_data_buffer += b","
 
     def _write_string_no_escape(self, data: str) -> None:
-        self._current_data_buffer += bytearray(data, encoding="utf-8")
+        self._current_data_buffer += data.encode("utf-8")
+
+    def _write_bytes(self, data: bytes) -> None:
+        if len(data) < self._flush_threshold:
+            self._current_data_buffer += data
+            return
+
+        # large payloads are handed over to the connection as they are instead of being copied into the buffer
+        if self._current_data_buffer:
+            self._buffer_exposer.enqueue_buffer_for_flush(self._current_data_buffer)
+            self._current_data_buffer = self._buffer_exposer.rent_buffer()
+        self._buffer_exposer.enqueue_buffer_for_flush(memoryview(data))
 
     def _write_document(self, entity: object, metadata: MetadataAsDictionary):
         document_info = DocumentInfo(metadata_instance=metadata)
         json_dict = EntityToJson.convert_entity_to_json_internal_static(entity, self._conventions, document_info, True)
-        self._current_data_buffer += bytearray(json.dumps(json_dict), encoding="utf-8")
+        data = self._json_codec.dumps(json_dict, self._conventions.json_default_method)
+        self._current_data_buffer += data.encode("utf-8") if isinstance(data, str) else data
 
     def _ensure_ongoing_operation(self) -> None:
         if self._ongoing_bulk_insert_execute_task is None:
@@ -363,13 +491,22 @@ class BulkInsertOperation:
     def _start_executing_bulk_insert_command(self) -> None:
         try:
             bulk_command = BulkInsertOperation._BulkInsertCommand(
-                self._operation_id, self._buffer_exposer, self._node_tag, self._options.skip_overwrite_if_unchanged
+                self._operation_id,
+                self._buffer_exposer,
+                self._node_tag,
+                self._options.skip_overwrite_if_unchanged,
+                self._conventions.http_compression_algorithm,
             )
             bulk_command.use_compression = self.use_compression
 
             def __execute_bulk_insert_raven_command():
-                self._request_executor.execute_command(bulk_command)
+                try:
+                    self._request_executor.execute_command(bulk_command)
+                finally:
+                    # unblock the writers if the request ended before consuming the whole stream
+                    self._buffer_exposer.close()
 
+            self._statistics._start()
             self._ongoing_bulk_insert_execute_task = self._thread_pool_executor.submit(
                 __execute_bulk_insert_raven_command
             )
@@ -449,29 +586,17 @@ class BulkInsertOperation:
 
                     self._first = False
 
-                    self._operation._write_string_no_escape("[")
-
-                    self._operation._write_string_no_escape(str(Utils.get_unix_time_in_ms(timestamp)))
-                    self._operation._write_comma()
-
-                    self._operation._write_string_no_escape(str(len(values)))
-                    self._operation._write_comma()
-
-                    first_value = True
-
-                    for value in values:
-                        if not first_value:
-                            self._operation._write_comma()
-
-                        first_value = False
-                        self._operation._write_string_no_escape(str(value) if value is not None else "null")
+                    values_string = ",".join(str(value) if value is not None else "null" for value in values)
+                    self._operation._write_string_no_escape(
+                        f"[{Utils.get_unix_time_in_ms(timestamp)},{len(values)},{values_string}"
+                        if values
+                        else f"[{Utils.get_unix_time_in_ms(timestamp)},0"
+                    )
 
                     if tag is not None:
-                        self._operation._write_string_no_escape(',"')
-                        self._operation._write_string(tag)
-                        self._operation._write_string_no_escape('"')
-
-                    self._operation._write_string_no_escape("]")
+                        self._operation._current_data_buffer += b',"' + self._operation._escape(tag) + b'"]'
+                    else:
+                        self._operation._current_data_buffer += b"]"
 
                     self._operation._flush_if_needed()
                 except Exception as e:
@@ -483,11 +608,13 @@ class BulkInsertOperation:
             self._first = True
             self._time_series_in_batch = 0
 
-            self._operation._write_string_no_escape('{"Id":"')
-            self._operation._write_string(self._id)
-            self._operation._write_string_no_escape('","Type":"TimeSeriesBulkInsert","TimeSeries":{"Name":"')
-            self._operation._write_string(self._name)
-            self._operation._write_string_no_escape('","TimeFormat":"UnixTimeInMs","Appends":[')
+            self._operation._current_data_buffer += (
+                b'{"Id":"'
+                + self._operation._escape(self._id)
+                + b'","Type":"TimeSeriesBulkInsert","TimeSeries":{"Name":"'
+                + self._operation._escape(self._name)
+                + b'","TimeFormat":"UnixTimeInMs","Appends":['
+            )
 
         @staticmethod
         def _throw_already_running_time_series():
@@ -557,11 +684,13 @@ class BulkInsertOperation:
 
                     self._first = False
 
-                    self._operation._write_string_no_escape('{"Type":"Increment","CounterName":"')
-                    self._operation._write_string(name)
-                    self._operation._write_string_no_escape('","Delta":')
-                    self._operation._write_string_no_escape(str(delta))
-                    self._operation._write_string_no_escape("}")
+                    self._operation._current_data_buffer += (
+                        b'{"Type":"Increment","CounterName":"'
+                        + self._operation._escape(name)
+                        + b'","Delta":'
+                        + str(delta).encode("utf-8")
+                        + b"}"
+                    )
 
                     self._operation._flush_if_needed()
 
@@ -584,11 +713,14 @@ class BulkInsertOperation:
             self._first = True
             self._counters_in_batch = 0
 
-            self._operation._write_string_no_escape('{"Id":"')
-            self._operation._write_string(str(self._id))
-            self._operation._write_string_no_escape('","Type":"Counters","Counters":{"DocumentId":"')
-            self._operation._write_string(str(self._id))
-            self._operation._write_string_no_escape('","Operations":[')
+            escaped_id = self._operation._escape(str(self._id))
+            self._operation._current_data_buffer += (
+                b'{"Id":"'
+                + escaped_id
+                + b'","Type":"Counters","Counters":{"DocumentId":"'
+                + escaped_id
+                + b'","Operations":['
+            )
 
     class TimeSeriesBulkInsert(TimeSeriesBulkInsertBase):
         def __init__(self, operation: BulkInsertOperation, id_: str, name: str):
@@ -625,35 +757,39 @@ class BulkInsertOperation:
             self.operation = operation
 
         def store(self, key: str, name: str, attachment_bytes: bytes, content_type: Optional[str] = None):
-            self.operation._concurrency_check()
-            self.operation._end_previous_command_if_needed()
-            self.operation._ensure_ongoing_operation()
-
+            check_exit_callback = self.operation._concurrency_check()
             try:
-                if not self.operation._first:
-                    self.operation._write_comma()
+                self.operation._end_previous_command_if_needed()
+                self.operation._ensure_ongoing_operation()
 
-                self.operation._write_string_no_escape('{"Id":"')
-                self.operation._write_string(key)
-                self.operation._write_string_no_escape('","Type":"AttachmentPUT","Name":"')
-                self.operation._write_string(name)
+                try:
+                    if not self.operation._first:
+                        self.operation._write_comma()
 
-                if content_type:
-                    self.operation._write_string_no_escape('","ContentType:"')
-                    self.operation._write_string(content_type)
+                    self.operation._first = False
+                    self.operation._in_progress_command = CommandType.NONE
 
-                self.operation._write_string_no_escape('","ContentLength":')
-                self.operation._write_string_no_escape(str(len(attachment_bytes)))
-                self.operation._write_string_no_escape("}")
+                    header = (
+                        b'{"Id":"'
+                        + self.operation._escape(key)
+                        + b'","Type":"AttachmentPUT","Name":"'
+                        + self.operation._escape(name)
+                    )
+                    if content_type:
+                        header += b'","ContentType":"' + self.operation._escape(content_type)
+                    header += b'","ContentLength":' + str(len(attachment_bytes)).encode("utf-8") + b"}"
+                    self.operation._current_data_buffer += header
 
-                self.operation._flush_if_needed()
+                    self.operation._flush_if_needed()
 
-                self.operation._current_data_buffer += bytearray(attachment_bytes)
+                    self.operation._write_bytes(attachment_bytes)
 
-                self.operation._flush_if_needed()
+                    self.operation._flush_if_needed()
 
-            except Exception as e:
-                self.operation._handle_errors(key, e)
+                except Exception as e:
+                    self.operation._handle_errors(key, e)
+            finally:
+                check_exit_callback()
 
     def attachments_for(self, key: str) -> BulkInsertOperation.AttachmentsBulkInsert:
         if not key or key.isspace():
@@ -692,7 +828,254 @@ class BulkInsertOperation:
         return self.TimeSeriesBulkInsert(self, id_, name)
 
 
+class ParallelBulkInsertOperation:
+    """
+    Spreads documents over several bulk insert streams, each one sent on its own connection and, when the
+    topology has more than one node, to a different node of the cluster.
+
+    Ids are generated on the calling thread, the documents are queued in batches and every stream has a writer
+    thread serializing the batches it takes from the queue - a slower stream just takes fewer of them.
+    The first failure aborts all the streams and is raised from the store methods or when the operation is closed.
+
+    Only documents are supported. Attachments, counters and time series have to be written to the stream
+    their document went to - use a regular bulk insert for them.
+    """
+
+    DEFAULT_BATCH_SIZE = 256
+
+    def __init__(
+        self,
+        database: str = None,
+        store: "DocumentStore" = None,
+        options: BulkInsertOptions = None,
+        parallelism: int = 2,
+        batch_size: int = None,
+    ):
+        if parallelism is None or parallelism <= 0:
+            raise ValueError("Parallelism must be positive")
+        if batch_size is not None and batch_size <= 0:
+            raise ValueError("Batch size must be positive")
+
+        self._operations = [BulkInsertOperation(database, store, options) for _ in range(parallelism)]
+
+        node_tags = [
+            node.cluster_tag for node in self._operations[0]._request_executor.topology_nodes or [] if node.cluster_tag
+        ]
+        if len(node_tags) > 1:
+            for index, operation in enumerate(self._operations):
+                operation._node_tag = node_tags[index % len(node_tags)]
+
+        # every stream keeps one thread busy sending it and another one writing to it for its whole lifetime,
+        # the store's pool is shared with other work and could run out of threads
+        self._executor = ThreadPoolExecutor(max_workers=2 * parallelism, thread_name_prefix="bulk-insert")
+        for operation in self._operations:
+            operation._thread_pool_executor = self._executor
+
+        self._batch_size = batch_size or ParallelBulkInsertOperation.DEFAULT_BATCH_SIZE
+        self._batches: Queue[Optional[List[Tuple[object, str, Optional[MetadataAsDictionary]]]]] = Queue(
+            2 * parallelism
+        )
+        self._pending_batch: List[Tuple[object, str, Optional[MetadataAsDictionary]]] = []
+        self._writers: List[Future] = []
+
+        self._error: Optional[Exception] = None
+        self._error_lock = Lock()
+        self._statistics = BulkInsertStatistics()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        try:
+            if self._pending_batch and self._error is None:
+                self._dispatch_pending_batch()
+        finally:
+            for _ in self._writers:
+                self._batches.put(None)
+            for writer in self._writers:
+                writer.result()
+
+            if self._error is not None:
+                # streams opened by batches that were already being written when the operation failed
+                self._abort_streams()
+
+            for operation in self._operations:
+                try:
+                    operation.__exit__(None, None, None)
+                except Exception as e:
+                    self._fail(e)
+
+            self._executor.shutdown()
+            self._statistics._stop()
+
+        self._throw_if_failed()
+
+    @property
+    def parallelism(self) -> int:
+        return len(self._operations)
+
+    @property
+    def statistics(self) -> BulkInsertStatistics:
+        """
+        Totals of all the streams. Stalled time is the time the store methods waited for every stream to be busy.
+        """
+        self._statistics._documents_count = sum(s.documents_count for s in self.streams_statistics)
+        self._statistics._bytes_sent = sum(s.bytes_sent for s in self.streams_statistics)
+        return self._statistics
+
+    @property
+    def streams_statistics(self) -> List[BulkInsertStatistics]:
+        return [operation.statistics for operation in self._operations]
+
+    def store(self, entity: object, metadata: Optional[MetadataAsDictionary] = None) -> str:
+        key = (
+            self._operations[0]._get_id(entity)
+            if metadata is None or constants.Documents.Metadata.ID not in metadata
+            else metadata[constants.Documents.Metadata.ID]
+        )
+
+        self.store_as(entity, key, metadata)
+        return key
+
+    def store_as(self, entity: object, key: str, metadata: Optional[MetadataAsDictionary] = None) -> None:
+        BulkInsertOperation._verify_valid_key(key)
+
+        self._pending_batch.append((entity, key, metadata))
+        if len(self._pending_batch) >= self._batch_size:
+            self._dispatch_pending_batch()
+
+    def store_many(self, entities: Iterable[object]) -> List[str]:
+        return [self.store(entity) for entity in entities]
+
+    def abort(self) -> None:
+        self._fail(BulkInsertAbortedException("Bulk insert was aborted"))
+
+    def _dispatch_pending_batch(self) -> None:
+        self._throw_if_failed()
+
+        if not self._writers:
+            self._statistics._start()
+            self._writers = [self._executor.submit(self._write_batches, operation) for operation in self._operations]
+
+        batch, self._pending_batch = self._pending_batch, []
+        try:
+            self._batches.put_nowait(batch)
+        except Full:
+            # all the streams are behind
+            stall_start = time.perf_counter()
+            self._batches.put(batch)
+            self._statistics._stalled_seconds += time.perf_counter() - stall_start
+
+    def _write_batches(self, operation: BulkInsertOperation) -> None:
+        while True:
+            batch = self._batches.get()
+            if batch is None:
+                return
+
+            if self._error is not None:
+                continue  # keep draining the queue, so the store methods never wait for a failed operation
+
+            try:
+                operation._store_all(batch)
+            except Exception as e:
+                self._fail(e)
+
+    def _fail(self, error: Exception) -> None:
+        with self._error_lock:
+            if self._error is not None:
+                return
+            self._error = error
+
+        self._abort_streams()
+
+    def _abort_streams(self) -> None:
+        for operation in self._operations:
+            if operation._operation_id == -1:
+                continue
+            try:
+                operation.abort()
+            except Exception:
+                pass  # stream is already gone, the original error is what matters
+
+    def _throw_if_failed(self) -> None:
+        if self._error is None:
+            return
+
+        if isinstance(self._error, BulkInsertAbortedException):
+            raise self._error
+
+        raise BulkInsertAbortedException("Failed to execute bulk insert", self._error)
+
+
 class BulkInsertOptions:
-    def __init__(self, use_compression: bool = None, skip_overwrite_if_unchanged: bool = None):
+    DEFAULT_FLUSH_THRESHOLD = 64 * 1024
+    DEFAULT_MAX_BUFFERS_IN_FLIGHT = 8
+
+    def __init__(
+        self,
+        use_compression: bool = None,
+        skip_overwrite_if_unchanged: bool = None,
+        flush_threshold: int = None,
+        max_buffers_in_flight: int = None,
+    ):
+        """
+        :param flush_threshold: size in bytes after which the buffer being written is handed over to the connection
+        :param max_buffers_in_flight: number of filled buffers that can wait for the connection before
+                                      the store methods block
+        """
+        if flush_threshold is not None and flush_threshold <= 0:
+            raise ValueError("Flush threshold must be positive")
+        if max_buffers_in_flight is not None and max_buffers_in_flight <= 0:
+            raise ValueError("Max buffers in flight must be positive")
+
         self.use_compression = use_compression
         self.skip_overwrite_if_unchanged = skip_overwrite_if_unchanged
+        self.flush_threshold = flush_threshold
+        self.max_buffers_in_flight = max_buffers_in_flight
+
+
+class BulkInsertStatistics:
+    def __init__(self):
+        self._documents_count = 0
+        self._bytes_sent = 0
+        self._stalled_seconds = 0.0
+        self._started_at: Optional[float] = None
+        self._stopped_at: Optional[float] = None
+
+    def _start(self) -> None:
+        self._started_at = time.perf_counter()
+
+    def _stop(self) -> None:
+        if self._started_at is not None and self._stopped_at is None:
+            self._stopped_at = time.perf_counter()
+
+    @property
+    def documents_count(self) -> int:
+        return self._documents_count
+
+    @property
+    def bytes_sent(self) -> int:
+        return self._bytes_sent
+
+    @property
+    def elapsed(self) -> timedelta:
+        if self._started_at is None:
+            return timedelta()
+        return timedelta(seconds=(self._stopped_at or time.perf_counter()) - self._started_at)
+
+    @property
+    def stalled_time(self) -> timedelta:
+        """
+        Time the store methods spent waiting for the connection to catch up.
+        """
+        return timedelta(seconds=self._stalled_seconds)
+
+    @property
+    def documents_per_second(self) -> float:
+        elapsed = self.elapsed.total_seconds()
+        return self._documents_count / elapsed if elapsed else 0.0
+
+    @property
+    def bytes_per_second(self) -> float:
+        elapsed = self.elapsed.total_seconds()
+        return self._bytes_sent / elapsed if elapsed else 0.0
@@ -1,10 +1,9 @@
 from __future__ import annotations
 
 import datetime
-import json
 from abc import abstractmethod
 from enum import Enum
-from typing import Callable, Union, Optional, TYPE_CHECKING, List, Set, Dict
+from typing import Callable, Union, Optional, TYPE_CHECKING, List, Set, Dict, Iterator
 
 import requests
 
@@ -15,6 +14,7 @@ from ravendb.documents.operations.counters import (
 )
 from ravendb.documents.operations.time_series import TimeSeriesOperation
 from ravendb.documents.session.misc import TransactionMode, ForceRevisionStrategy
+from ravendb.http.multipart import DEFAULT_CHUNK_SIZE, MultipartFormStream, ReplayableStream, StreamSource, is_in_memory
 from ravendb.http.raven_command import RavenCommand
 from ravendb.http.server_node import ServerNode
 from ravendb.json.result import BatchCommandResult
@@ -110,7 +110,8 @@ class SingleNodeBatchCommand(RavenCommand):
         self.__commands = commands
         self.__options = options
         self.__mode = mode
-        self.__attachment_streams: List[bytes] = list()
+        self.__attachment_streams: List[StreamSource] = list()
+        self.__replayable_streams: Dict[int, ReplayableStream] = {}
 
         for command in commands:
             if isinstance(command, PutAttachmentCommandData):
@@ -123,6 +124,7 @@ class SingleNodeBatchCommand(RavenCommand):
                         "Use a unique stream per put attachment command."
                     )
                 self.__attachment_streams.append(stream)
+                self.__replayable_streams[id(command)] = ReplayableStream(stream)
 
     def __enter__(self):
         return self
@@ -142,7 +144,7 @@ class SingleNodeBatchCommand(RavenCommand):
                 command: PutAttachmentCommandData
                 files[command.name] = (
                     command.name,
-                    command.stream,
+                    self.__replayable_streams[id(command)].open(),  # rewound for a retry, or raises when it can't be
                     command.content_type,
                     {"Command-Type": "AttachmentStream"},
                 )
@@ -155,10 +157,29 @@ class SingleNodeBatchCommand(RavenCommand):
             if files:
                 request.use_stream = True
 
+        # documents are already converted to plain json trees by the session,
+        # so the body is encoded once here, without re-checking them for circular references
+        stream_body = self.__conventions.stream_batch_requests and isinstance(request.data, dict)
+        if stream_body:
+            request.data = self.__encode_body(request.data)
+        elif request.data is not None:
+            request.data = self.__conventions.json_codec.dumps(
+                request.data, self.__conventions.json_default_method, check_circular=False
+            )
+
         if len(files) > 1:
-            files["main"] = json.dumps(request.data, default=self.__conventions.json_default_method)
-            request.files = files
-            request.data = None
+            if not stream_body and all(is_in_memory(file[1]) for name, file in files.items() if name != "main"):
+                files["main"] = request.data
+                request.files = files
+                request.data = None
+            else:
+                # attachments given as files or iterators are sent while they are read
+                body = MultipartFormStream()
+                body.add_part("main", request.data.encode("utf-8") if isinstance(request.data, str) else request.data)
+                for name, (_, stream, content_type, headers) in list(files.items())[1:]:
+                    body.add_part(name, stream, content_type, headers)
+                request.headers["Content-Type"] = body.content_type
+                request.data = iter(body)
 
         sb = [f"{node.url}/databases/{node.database}/bulk_docs?"]
         self._append_options(sb)
@@ -167,6 +188,31 @@ class SingleNodeBatchCommand(RavenCommand):
 
         return request
 
+    def __encode_body(self, body: dict) -> Iterator[bytes]:
+        # the commands are encoded one at a time and sent in chunks, the whole body is never held in memory
+        codec = self.__conventions.json_codec
+        default = self.__conventions.json_default_method
+
+        def _encode(value) -> bytes:
+            encoded = codec.dumps(value, default, check_circular=False)
+            return encoded.encode("utf-8") if isinstance(encoded, str) else encoded
+
+        buffer = bytearray(b'{"Commands":[')
+        for index, command in enumerate(body["Commands"]):
+            if index:
+                buffer += b","
+            buffer += _encode(command)
+            if len(buffer) >= DEFAULT_CHUNK_SIZE:
+                yield bytes(buffer)
+                buffer.clear()
+        buffer += b"]"
+
+        for key, value in body.items():
+            if key != "Commands":
+                buffer += b"," + _encode(key) + b":" + _encode(value)
+        buffer += b"}"
+        yield bytes(buffer)
+
     def _append_options(self, sb: List[str]) -> None:
         if self.__options is None:
             return
@@ -199,7 +245,7 @@ class SingleNodeBatchCommand(RavenCommand):
                 "Got None response from the server after doing a batch, something is very wrong."
                 " Probably a garbled response."
             )
-        self.result = Utils.initialize_object(json.loads(response), self._result_class, True)
+        self.result = Utils.initialize_object(self.json_codec.loads(response), self._result_class, True)
 
 
 class ClusterWideBatchCommand(SingleNodeBatchCommand):
@@ -527,7 +573,7 @@ class CountersBatchCommandData(CommandData):
 
 
 class PutAttachmentCommandData(CommandData):
-    def __init__(self, document_id: str, name: str, stream: bytes, content_type: str, change_vector: str):
+    def __init__(self, document_id: str, name: str, stream: StreamSource, content_type: str, change_vector: str):
         if not document_id:
             raise ValueError(document_id)
         if not name:
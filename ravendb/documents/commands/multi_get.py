@@ -1,8 +1,12 @@
+from __future__ import annotations
+
 import datetime
 import http
-import json
+import time
 from abc import abstractmethod
-from typing import Union, List, Optional, Tuple
+from concurrent.futures import Future
+from threading import Lock
+from typing import Union, List, Optional, Tuple, Dict, TYPE_CHECKING
 
 import requests
 
@@ -10,11 +14,15 @@ from ravendb.primitives import constants
 from ravendb.http.misc import AggressiveCacheOptions, AggressiveCacheMode
 from ravendb.http.request_executor import RequestExecutor
 from ravendb.extensions.http_extensions import HttpExtensions
-from ravendb.http.http_cache import HttpCache, ReleaseCacheItem
+from ravendb.http.http_cache import HttpCache, ReleaseCacheItem, ItemFlags
 from ravendb.http.raven_command import RavenCommand, RavenCommandResponseType
 from ravendb.http.server_node import ServerNode
+from ravendb.json.json_codec import JsonCodec, DEFAULT_JSON_CODEC
 from ravendb.tools.utils import CaseInsensitiveDict
 
+if TYPE_CHECKING:
+    from ravendb.documents.session.misc import SessionInfo
+
 
 class Content:
     @abstractmethod
@@ -44,7 +52,7 @@ class GetResponse:
     def __init__(self):
         self.headers = CaseInsensitiveDict()
         self.elapsed: Union[None, datetime.timedelta] = None
-        self.result: Union[None, str] = None
+        self.result: Union[None, str, bytes] = None
         self.status_code: Union[None, int] = None
         self.force_retry: Union[None, bool] = None
 
@@ -64,7 +72,7 @@ class GetResponse:
 class Cached:
     def __init__(self, size: int):
         self.__size = size
-        self.values: Union[None, List[Tuple[ReleaseCacheItem, str]]] = None
+        self.values: Union[None, List[Tuple[ReleaseCacheItem, str]]] = [None] * size
 
     def __enter__(self):
         return self
@@ -111,71 +119,99 @@ class MultiGetCommand(RavenCommand):
         self.aggressively_cached: Union[None, bool] = None
         self.__base_url: str = ""
         self.__cached: Union[None, Cached] = None
+        self.__cached_responses: List[Optional[GetResponse]] = []
+        self.__sent_indexes: List[int] = []
+        self.__if_none_match_indexes: List[int] = []
 
     def create_request(self, node: ServerNode) -> Optional[requests.Request]:
         self.__base_url = f"{node.url}/databases/{node.database}"
+
+        if self.__read_from_cache(self.__request_executor.aggressive_caching):
+            self.aggressively_cached = True
+            return None
+
         url = self.__base_url + "/multi_get"
         request = requests.Request("POST", url)
 
+        # requests answered from the aggressive cache are left out, the server only gets the rest
         request.data = {
             "Requests": [
                 {
-                    "Url": f"/databases/{node.database}{command.url}",
-                    "Query": command.query,
-                    "Method": command.method,
-                    "Headers": command.headers,
-                    "Content": command.content.write_content() if command.content else None,
+                    "Url": f"/databases/{node.database}{self.__commands[index].url}",
+                    "Query": self.__commands[index].query,
+                    "Method": self.__commands[index].method,
+                    "Headers": self.__commands[index].headers,
+                    "Content": (
+                        self.__commands[index].content.write_content() if self.__commands[index].content else None
+                    ),
                 }
-                for command in self.__commands
+                for index in self.__sent_indexes
             ]
         }
 
         return request
 
-    def __maybe_read_all_from_cache(self, options: AggressiveCacheOptions):
+    def __read_from_cache(self, options: AggressiveCacheOptions) -> bool:
         self.close_cache()
 
-        read_all_from_cache = options is not None
-        track_changes = read_all_from_cache and options.mode == AggressiveCacheMode.TRACK_CHANGES
-        for command in self.__commands:
+        self.__cached_responses = [None] * len(self.__commands)
+        self.__sent_indexes = []
+
+        track_changes = options is not None and options.mode == AggressiveCacheMode.TRACK_CHANGES
+        for index, command in enumerate(self.__commands):
             cache_key = self.__get_cache_key(command)[0]
-            cached_item, change_vector, cached_ref = self.__http_cache.get(cache_key, "", "")
+            cached_item, change_vector, cached_ref = self.__http_cache.get(cache_key)
             cached_item: ReleaseCacheItem
             if cached_item.item is None:
-                try:
-                    read_all_from_cache = False
-                    continue
-                finally:
-                    cached_item.close()
-
-            if read_all_from_cache and (
-                track_changes
-                and cached_item.might_have_been_modified
-                or cached_item.age > options.duration
-                or not command.can_cache_aggressively
-            ):
-                read_all_from_cache = False
+                cached_item.close()
+                self.__sent_indexes.append(index)
+                continue
+
+            if self.__can_serve_aggressively(options, track_changes, command, cached_item):
+                cached_item.close()
+                get_response = GetResponse()
+                get_response.result = cached_ref
+                get_response.status_code = (
+                    http.HTTPStatus.NOT_FOUND
+                    if ItemFlags.NOT_FOUND in cached_item.item.flags
+                    else http.HTTPStatus.NOT_MODIFIED
+                )
+                self.__cached_responses[index] = get_response
+                continue
 
             command.headers[constants.Headers.IF_NONE_MATCH] = change_vector
+            self.__if_none_match_indexes.append(index)
             if self.__cached is None:
                 self.__cached = Cached(len(self.__commands))
 
-            self.__cached.values[self.__commands.index(command)] = (cached_item, cached_ref)
+            self.__cached.values[index] = (cached_item, cached_ref)
+            self.__sent_indexes.append(index)
 
-        if read_all_from_cache:
-            with self.__cached as context:
-                self.result = []
-                for i in range(len(self.__commands)):
-                    item_and_cached = self.__cached.values[i]
-                    get_response = GetResponse()
-                    get_response.result = item_and_cached[1]
-                    get_response.status_code = http.HTTPStatus.NOT_MODIFIED
+        if self.__sent_indexes:
+            return False
 
-                    self.result.append(get_response)
+        self.result = self.__cached_responses
+        return True
 
-            self.__cached = None
-
-        return read_all_from_cache
+    @staticmethod
+    def __can_serve_aggressively(
+        options: Optional[AggressiveCacheOptions],
+        track_changes: bool,
+        command: GetRequest,
+        cached_item: ReleaseCacheItem,
+    ) -> bool:
+        if (
+            options is None
+            or not command.can_cache_aggressively
+            or cached_item.age > options.duration
+            or (track_changes and cached_item.might_have_been_modified)
+        ):
+            return False
+
+        # a cached 404 is only served when it was itself stored under aggressive caching
+        return (
+            ItemFlags.NOT_FOUND not in cached_item.item.flags or ItemFlags.AGGRESSIVELY_CACHED in cached_item.item.flags
+        )
 
     def __get_cache_key(self, command: GetRequest) -> (str, str):
         req_url = self.__base_url + command.url_and_query
@@ -184,26 +220,25 @@ class MultiGetCommand(RavenCommand):
     def set_response_raw(self, response: requests.Response, stream: bytes) -> None:
         try:
             try:
-                response_temp = response.json()
+                response_temp = self.json_codec.loads(stream)
                 if "Results" not in response_temp:
                     self._throw_invalid_response()
 
-                i = 0
-                self.result = []
+                self.result = list(self.__cached_responses)
 
-                for get_response in self.read_responses(response_temp):
-                    command = self.__commands[i]
-                    self.__maybe_set_cache(get_response, command, i)
+                for index, get_response in zip(
+                    self.__sent_indexes, self.read_responses(response_temp, self.json_codec)
+                ):
+                    self.__maybe_set_cache(get_response, self.__commands[index], index)
 
-                    if self.__cached is not None and get_response.status_code == http.HTTPStatus.NOT_MODIFIED:
+                    cached = self.__cached.values[index] if self.__cached is not None else None
+                    if cached is not None and get_response.status_code == http.HTTPStatus.NOT_MODIFIED:
                         cloned_response = GetResponse()
-                        cloned_response.result = self.__cached.values[i][1]
+                        cloned_response.result = cached[1]
                         cloned_response.status_code = http.HTTPStatus.NOT_MODIFIED
-                        self.result.append(cloned_response)
+                        self.result[index] = cloned_response
                     else:
-                        self.result.append(get_response)
-
-                    i += 1
+                        self.result[index] = get_response
             finally:
                 if self.__cached is not None:
                     self.__cached.close()
@@ -213,7 +248,7 @@ class MultiGetCommand(RavenCommand):
     def __maybe_set_cache(self, get_response: GetResponse, command: GetRequest, cached_index: int):
         if get_response.status_code == http.HTTPStatus.NOT_MODIFIED:
             # if not modified - update age
-            if self.__cached is not None:
+            if self.__cached is not None and self.__cached.values[cached_index] is not None:
                 self.__cached.values[cached_index][0].not_modified()
             return
 
@@ -231,16 +266,17 @@ class MultiGetCommand(RavenCommand):
         self.__http_cache.set(cache_key, change_vector, result)
 
     @staticmethod
-    def read_responses(response_json: dict) -> List[GetResponse]:
+    def read_responses(response_json: dict, json_codec: JsonCodec = DEFAULT_JSON_CODEC) -> List[GetResponse]:
         responses = []
         for response in response_json["Results"]:
-            responses.append(MultiGetCommand.read_response(response))
+            responses.append(MultiGetCommand.read_response(response, json_codec))
         return responses
 
     @staticmethod
-    def read_response(response_json: dict) -> GetResponse:
+    def read_response(response_json: dict, json_codec: JsonCodec = DEFAULT_JSON_CODEC) -> GetResponse:
         get_response = GetResponse()
-        get_response.result = json.dumps(response_json["Result"])  # todo: perf - redundant dump after response.json()
+        # todo: perf - redundant dump after parsing the whole response
+        get_response.result = json_codec.dumps(response_json["Result"])
         get_response.headers = CaseInsensitiveDict(response_json["Headers"])
         if response_json["StatusCode"] == -1:
             MultiGetCommand._throw_invalid_response()
@@ -267,5 +303,68 @@ class MultiGetCommand(RavenCommand):
         # (include the IP and port of the old node), because of that the client
         # needs to get those docs again from the new node.
 
-        for command in self.__commands:
-            command.headers.remove(constants.Headers.IF_NONE_MATCH)
+        # headers set by the requests themselves (conditional load) are kept
+        for index in self.__if_none_match_indexes:
+            self.__commands[index].headers.remove(constants.Headers.IF_NONE_MATCH)
+        self.__if_none_match_indexes = []
+
+
+class MultiGetBatcher:
+    """
+    Coalesces the lazy operations that sessions of one store execute at about the same time into a single
+    /multi_get request.
+
+    The first session opens a batch and waits for the window to pass, sessions coming in the meantime add their
+    requests to it. The first session then sends the whole batch and every session gets back its own responses.
+    """
+
+    class _Batch:
+        def __init__(self):
+            self.requests: List[GetRequest] = []
+            self.responses: Future = Future()
+
+    def __init__(self, window: datetime.timedelta):
+        self.__window = window
+        self.__lock = Lock()
+        self.__open_batches: Dict[tuple, MultiGetBatcher._Batch] = {}
+
+    @property
+    def window(self) -> datetime.timedelta:
+        return self.__window
+
+    def execute(
+        self, request_executor: RequestExecutor, get_requests: List[GetRequest], session_info: SessionInfo = None
+    ) -> Tuple[List[GetResponse], bool]:
+        """
+        Returns the responses to get_requests and whether the whole batch was served from the aggressive cache.
+        """
+        # aggressive caching is scoped to the calling thread, only requests made under the same options can share
+        aggressive_caching = request_executor.aggressive_caching
+        key = (
+            request_executor,
+            (aggressive_caching.duration, aggressive_caching.mode) if aggressive_caching is not None else None,
+        )
+
+        with self.__lock:
+            batch = self.__open_batches.get(key)
+            is_first = batch is None
+            if is_first:
+                batch = MultiGetBatcher._Batch()
+                self.__open_batches[key] = batch
+            offset = len(batch.requests)
+            batch.requests.extend(get_requests)
+
+        if is_first:
+            time.sleep(self.__window.total_seconds())
+            with self.__lock:
+                del self.__open_batches[key]
+
+            try:
+                with MultiGetCommand(request_executor, batch.requests) as command:
+                    request_executor.execute_command(command, session_info)
+                    batch.responses.set_result((command.result, bool(command.aggressively_cached)))
+            except Exception as e:
+                batch.responses.set_exception(e)
+
+        responses, aggressively_cached = batch.responses.result()
+        return responses[offset : offset + len(get_requests)], aggressively_cached
@@ -5,11 +5,13 @@ import threading
 from abc import abstractmethod, ABC
 from datetime import timedelta, datetime
 from enum import Enum
-from typing import Dict, List, Tuple, Callable, Union, Optional, Generic, Type
+from typing import Dict, List, Tuple, Callable, Union, Optional, Generic, Type, Iterable
 
 import inflect
 
 from typing import TypeVar
+from ravendb.http.compression import HttpCompressionAlgorithm
+from ravendb.json.json_codec import JsonCodec, DEFAULT_JSON_CODEC
 from ravendb.json.metadata_as_dictionary import MetadataAsDictionary
 from ravendb.primitives import constants
 from ravendb.documents.operations.configuration.definitions import (
@@ -43,6 +45,9 @@ class DocumentConventions(object):
         self._max_http_cache_size = 128 * 1024 * 1024
         self.max_length_of_query_using_get_url = 1024 + 512
         self.time_series_batch_size = 1024
+        self.async_http_connection_limit = 100
+        # share of a hilo range left when the next range is requested in the background, 0 disables prefetching
+        self.hilo_prefetch_threshold = 0.25
 
         # Flags
         self.disable_topology_updates = False
@@ -51,9 +56,14 @@ class DocumentConventions(object):
         self._send_application_identifier = True
         self._save_enums_as_integers: Optional[bool] = None
         self._disable_atomic_document_writes_in_cluster_wide_transaction: Optional[bool] = None
+        self._use_http_compression = False
+        self._stream_batch_requests = False
 
         # Configuration
         self.json_default_method = DocumentConventions.json_default
+        self._json_codec: JsonCodec = DEFAULT_JSON_CODEC
+        self._http_compression_algorithm = HttpCompressionAlgorithm.GZIP
+        self._http_compression_command_types: Optional[Tuple[Type, ...]] = None
         self._original_configuration: Optional[ClientConfiguration] = None
         self._should_ignore_entity_changes: Optional[ShouldIgnoreEntityChanges] = None
 
@@ -81,6 +91,8 @@ class DocumentConventions(object):
         self.wait_for_indexes_after_save_changes_timeout = timedelta(seconds=15)
         self.wait_for_replication_after_save_changes_timeout = timedelta(seconds=15)
         self.wait_for_non_stale_results_timeout = timedelta(seconds=15)
+        # lazy operations of sessions executed within this window share one multi get request, None disables it
+        self.lazy_operations_coalescing_window: Optional[timedelta] = None
 
         # Balancing
         self._load_balancer_context_seed: Optional[int] = None
@@ -153,6 +165,68 @@ class DocumentConventions(object):
     def max_http_cache_size(self, value: int):
         self._max_http_cache_size = value
 
+    @property
+    def json_codec(self) -> JsonCodec:
+        return self._json_codec
+
+    @json_codec.setter
+    def json_codec(self, value: JsonCodec):
+        self.__assert_not_frozen()
+        if value is None:
+            raise ValueError("Json codec cannot be None")
+        self._json_codec = value
+
+    @property
+    def stream_batch_requests(self) -> bool:
+        """
+        save_changes encodes its commands one by one straight into the request body, sent while it's being
+        encoded, instead of building the whole body first. Lowers the memory used to save many documents at once.
+        A retry encodes the body again, its attachments are resent only if they can be (see ReplayableStream).
+        """
+        return self._stream_batch_requests
+
+    @stream_batch_requests.setter
+    def stream_batch_requests(self, value: bool):
+        self.__assert_not_frozen()
+        self._stream_batch_requests = value
+
+    @property
+    def use_http_compression(self) -> bool:
+        return self._use_http_compression
+
+    @use_http_compression.setter
+    def use_http_compression(self, value: bool):
+        self.__assert_not_frozen()
+        self._use_http_compression = value
+
+    @property
+    def http_compression_algorithm(self) -> HttpCompressionAlgorithm:
+        return self._http_compression_algorithm
+
+    @http_compression_algorithm.setter
+    def http_compression_algorithm(self, value: HttpCompressionAlgorithm):
+        self.__assert_not_frozen()
+        self._http_compression_algorithm = value
+
+    @property
+    def http_compression_command_types(self) -> Optional[Tuple[Type, ...]]:
+        """
+        Command types (e.g. SingleNodeBatchCommand) whose request bodies are compressed when use_http_compression
+        is enabled. None means every command that sends a body.
+        """
+        return self._http_compression_command_types
+
+    @http_compression_command_types.setter
+    def http_compression_command_types(self, value: Optional[Iterable[Type]]):
+        self.__assert_not_frozen()
+        self._http_compression_command_types = tuple(value) if value is not None else None
+
+    def should_compress_request(self, command: object) -> bool:
+        if not self._use_http_compression:
+            return False
+        command_types = self._http_compression_command_types
+        return command_types is None or isinstance(command, command_types)
+
     @property
     def save_enums_as_integers(self) -> bool:
         return self._save_enums_as_integers
@@ -369,6 +443,8 @@ class DocumentConventions(object):
         cloned._original_configuration = self._original_configuration
         cloned._save_enums_as_integers = self._save_enums_as_integers
         cloned.identity_parts_separator = self.identity_parts_separator
+        cloned.hilo_prefetch_threshold = self.hilo_prefetch_threshold
+        cloned.lazy_operations_coalescing_window = self.lazy_operations_coalescing_window
         cloned.disable_topology_updates = self.disable_topology_updates
         cloned._find_identity_property = self._find_identity_property
 
@@ -383,7 +459,13 @@ class DocumentConventions(object):
 
         cloned._read_balance_behavior = self._read_balance_behavior
         cloned._load_balance_behavior = self._load_balance_behavior
-        self._max_http_cache_size = self._max_http_cache_size
+        cloned._max_http_cache_size = self._max_http_cache_size
+        cloned._json_codec = self._json_codec
+        cloned._use_http_compression = self._use_http_compression
+        cloned._stream_batch_requests = self._stream_batch_requests
+        cloned._http_compression_algorithm = self._http_compression_algorithm
+        cloned._http_compression_command_types = self._http_compression_command_types
+        return cloned
 
     def update_from(self, configuration: ClientConfiguration):
         if configuration.disabled and self._original_configuration is None:
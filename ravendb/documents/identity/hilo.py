@@ -1,5 +1,9 @@
 from __future__ import annotations
 import datetime
+import itertools
+import math
+import time
+from concurrent.futures import Future
 from threading import Lock
 from typing import Any, Union, Optional, Iterable, Dict, Tuple, Callable
 
@@ -146,17 +150,30 @@ class MultiTypeHiLoGenerator:
 
 
 class HiLoIdGenerator:
-    def __init__(self, tag: str, store: DocumentStore, db_name: str, identity_parts_separator: str):
+    def __init__(
+        self,
+        tag: str,
+        store: DocumentStore,
+        db_name: str,
+        identity_parts_separator: str,
+        prefetch_threshold: Optional[float] = None,
+    ):
         self.__store = store
         self.__tag = tag
         self.__db_name = db_name
         self.__identity_parts_separator = identity_parts_separator
+        self.__prefetch_threshold = (
+            prefetch_threshold if prefetch_threshold is not None else store.conventions.hilo_prefetch_threshold
+        )
         self.__range = self.RangeValue(1, 0)
+        self.__next_range: Optional[Future[HiLoResult]] = None
 
         self.__generator_lock = Lock()
 
         self.__last_batch_size: Union[None, int] = None
         self.__last_range_date: Union[None, datetime.datetime] = None
+        self.__last_request_seconds: Optional[float] = None
+        self.__ids_per_second: Optional[float] = None
         self._prefix: Union[None, str] = None
         self._server_tag: Union[None, str] = None
 
@@ -172,10 +189,26 @@ class HiLoIdGenerator:
         self.__range = value
 
     class RangeValue:
-        def __init__(self, min_val: int, max_val: int):
+        def __init__(self, min_val: int, max_val: int, prefetch_at: Optional[int] = None):
             self.min_val = min_val
             self.max_val = max_val
-            self.current = min_val - 1
+            # the first id whose use requests the next range in the background, None if prefetching is disabled
+            self.prefetch_at = prefetch_at
+            self.prefetch_requested = False
+            self.created_at = time.monotonic()
+            # next() on itertools.count is atomic, threads take ids from the range without locking
+            self.__ids = itertools.count(min_val)
+
+        def next_id(self) -> int:
+            return next(self.__ids)
+
+        def close(self) -> int:
+            """
+            Stops handing out ids from this range and returns the last id that was handed out.
+            """
+            last = min(next(self.__ids) - 1, self.max_val)
+            self.max_val = last
+            return last
 
     def generate_document_id(self, entity: object) -> str:
         return self._get_document_id_from_id(self.next_id())
@@ -184,40 +217,99 @@ class HiLoIdGenerator:
         while True:
             range = self.__range
 
-            range.current += 1
-            key = range.current
-
+            key = range.next_id()
             if key <= range.max_val:
+                if range.prefetch_at is not None and key >= range.prefetch_at and not range.prefetch_requested:
+                    self.__prefetch_next_range(range)
                 return key
 
             # local range is exhausted, need to get a new range
             with self.__generator_lock:
-                key = self.__range.current
-                if key <= self.__range.max_val:
-                    return key
+                if self.__range is range:
+                    self.__take_next_range()
+
+    def __prefetch_next_range(self, range: HiLoIdGenerator.RangeValue) -> None:
+        with self.__generator_lock:
+            if range.prefetch_requested or self.__range is not range or self.__next_range is not None:
+                return
+
+            range.prefetch_requested = True
+            self.__next_range = self.__store.thread_pool_executor.submit(self.__request_next_range, range.max_val)
+
+    def __take_next_range(self) -> None:
+        next_range, self.__next_range = self.__next_range, None
 
-                self.__get_next_range()
+        result = None
+        if next_range is not None and not next_range.cancel():
+            # still waiting in the thread pool queue means it was cancelled above and is requested right here,
+            # otherwise the request is on its way
+            try:
+                result = next_range.result()
+            except Exception:
+                pass  # the range is requested again below, so the error reaches the caller
+
+        if result is None:
+            result = self.__request_next_range(self.__range.max_val)
+
+        previous = self.__range
+        if previous.max_val >= previous.min_val:
+            self.__ids_per_second = (previous.max_val - previous.min_val + 1) / max(
+                time.monotonic() - previous.created_at, 1e-6
+            )
+
+        self._prefix = result.prefix
+        self._server_tag = result.server_tag
+        self.__range = HiLoIdGenerator.RangeValue(result.low, result.high, self.__get_prefetch_at(result))
 
-    def __get_next_range(self) -> None:
+    def __get_prefetch_at(self, result: HiLoResult) -> Optional[int]:
+        if not self.__prefetch_threshold or self.__prefetch_threshold <= 0:
+            return None
+
+        size = result.high - result.low + 1
+        low_water_mark = math.ceil(size * self.__prefetch_threshold)
+        if self.__ids_per_second and self.__last_request_seconds:
+            # leave enough ids to cover twice the time the server needs to hand out a range
+            low_water_mark = max(low_water_mark, math.ceil(self.__ids_per_second * self.__last_request_seconds * 2))
+
+        return max(result.high - low_water_mark + 1, result.low)
+
+    def __request_next_range(self, last_range_max: int) -> HiLoResult:
         hilo_command = commands_crud.NextHiLoCommand(
             self.__tag,
             self.__last_batch_size,
             self.__last_range_date,
             self.__identity_parts_separator,
-            self.__range.max_val,
+            last_range_max,
         )
 
         re = self.__store.get_request_executor(self.__db_name)
+        start = time.monotonic()
         re.execute_command(hilo_command)
+        self.__last_request_seconds = time.monotonic() - start
 
-        self._prefix = hilo_command.result.prefix
-        self._server_tag = hilo_command.result.server_tag
         self.__last_range_date = hilo_command.result.last_range_at
         self.__last_batch_size = hilo_command.result.last_size
-        self.__range = HiLoIdGenerator.RangeValue(hilo_command.result.low, hilo_command.result.high)
+        return hilo_command.result
 
     def return_unused_range(self) -> None:
-        return_command = commands_crud.HiLoReturnCommand(self.__tag, self.__range.current, self.__range.max_val)
+        with self.__generator_lock:
+            next_range, self.__next_range = self.__next_range, None
+            end = self.__range.max_val
+            last = self.__range.close()
+
+            prefetched = None
+            if next_range is not None:
+                try:
+                    prefetched = next_range.result()
+                except Exception:
+                    pass
+
+        # the server remembers the end of the last range it handed out, so when a range was prefetched
+        # that's the one to return - the remainder of the current range can't be returned anymore
+        if prefetched is not None:
+            last, end = prefetched.low - 1, prefetched.high
+
+        return_command = commands_crud.HiLoReturnCommand(self.__tag, last, end)
 
         re = self.__store.get_request_executor(self.__db_name)
         re.execute_command(return_command)
@@ -2,7 +2,9 @@ from __future__ import annotations
 
 import http
 import json
-from typing import Optional, TYPE_CHECKING, List
+import mmap
+import re
+from typing import Optional, TYPE_CHECKING, List, Iterator, BinaryIO
 
 import requests
 
@@ -11,7 +13,8 @@ from ravendb.data.operation import AttachmentType
 from ravendb.documents.operations.definitions import IOperation, VoidOperation
 from ravendb.http.http_cache import HttpCache
 from ravendb.http.misc import ResponseDisposeHandling
-from ravendb.http.raven_command import RavenCommand, RavenCommandResponseType, VoidRavenCommand
+from ravendb.http.multipart import DEFAULT_CHUNK_SIZE, ReplayableStream, StreamSource, is_in_memory, iter_chunks
+from ravendb.http.raven_command import RavenCommand, VoidRavenCommand
 from ravendb.http.server_node import ServerNode
 from ravendb.tools.utils import Utils
 
@@ -53,6 +56,11 @@ class AttachmentDetails(AttachmentName):
 
 
 class CloseableAttachmentResult:
+    """
+    The attachment is received as it's read - with iter_content, copy_to or to_memory_map it doesn't have to fit in
+    memory. data reads the whole attachment at once.
+    """
+
     def __init__(self, response: requests.Response, details: AttachmentDetails):
         self.__details = details
         self.__response = response
@@ -64,9 +72,52 @@ class CloseableAttachmentResult:
         self.close()
 
     @property
-    def data(self):
+    def data(self) -> bytes:
         return self.__response.content
 
+    def iter_content(self, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[bytes]:
+        return self.__response.iter_content(chunk_size)
+
+    def copy_to(self, destination: BinaryIO, chunk_size: int = DEFAULT_CHUNK_SIZE) -> int:
+        """
+        Writes the attachment to the binary file-like destination, returns the number of bytes written
+        """
+        written = 0
+        for chunk in self.iter_content(chunk_size):
+            destination.write(chunk)
+            written += len(chunk)
+        return written
+
+    def to_memory_map(self, path: Optional[str] = None, chunk_size: int = DEFAULT_CHUNK_SIZE) -> mmap.mmap:
+        """
+        Writes the attachment to a memory map of the file at path (created or truncated), or to an anonymous one
+        without a path. The memory map belongs to the caller, who should close it.
+        """
+        size = self.__details.size
+        if not size:
+            raise ValueError("Cannot memory map an empty attachment or one of unknown size")
+
+        if path is None:
+            memory_map = mmap.mmap(-1, size)
+        else:
+            with open(path, "w+b") as file:
+                file.truncate(size)
+                memory_map = mmap.mmap(file.fileno(), size)
+
+        try:
+            position = 0
+            for chunk in self.iter_content(chunk_size):
+                if position + len(chunk) > size:
+                    raise ValueError(f"Attachment is larger than its size {size}")
+                memory_map[position : position + len(chunk)] = chunk
+                position += len(chunk)
+            if position != size:
+                raise ValueError(f"Received {position} bytes of the attachment of size {size}")
+        except BaseException:
+            memory_map.close()
+            raise
+        return memory_map
+
     @property
     def details(self):
         return self.__details
@@ -75,6 +126,147 @@ class CloseableAttachmentResult:
         self.__response.close()
 
 
+class AttachmentIteratorResult:
+    """
+    An attachment of GetAttachmentsOperation. It's read from the response shared by all the attachments, so it's
+    available until the next attachment is requested from the iterator.
+    """
+
+    def __init__(self, details: AttachmentDetails, reader: _AttachmentsResponseReader):
+        self.__details = details
+        self.__reader = reader
+        self.__remaining = details.size
+
+    @property
+    def details(self) -> AttachmentDetails:
+        return self.__details
+
+    @property
+    def data(self) -> bytes:
+        return self.read()
+
+    def read(self, size: int = -1) -> bytes:
+        if size < 0:
+            return b"".join(self.iter_content())
+        size = min(size, self.__remaining)
+        chunk = self.__reader.read(size)
+        while len(chunk) < size:
+            chunk += self.__reader.read(size - len(chunk))
+        self.__remaining -= size
+        return chunk
+
+    def iter_content(self, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[bytes]:
+        return iter_chunks(self, chunk_size)
+
+    def copy_to(self, destination: BinaryIO, chunk_size: int = DEFAULT_CHUNK_SIZE) -> int:
+        written = 0
+        for chunk in self.iter_content(chunk_size):
+            destination.write(chunk)
+            written += len(chunk)
+        return written
+
+    def _skip(self) -> None:
+        while self.__remaining:
+            self.read(DEFAULT_CHUNK_SIZE)
+
+
+class _AttachmentsResponseReader:
+    # the response is the attachments metadata json followed by the attachments, one after another
+    _JSON_STRUCTURE = re.compile(rb'["\\{}\[\]]')
+
+    def __init__(self, raw, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        self.__raw = raw
+        self.__chunk_size = chunk_size
+        self.__buffer = b""
+
+    def __read_chunk(self) -> bytes:
+        chunk = self.__raw.read(self.__chunk_size)
+        if not chunk:
+            raise RuntimeError("Unexpected end of the attachments stream")
+        return chunk
+
+    def read_json(self) -> dict:
+        # only the json is buffered, it's found by matching its brackets outside of strings
+        depth = 0
+        in_string = False
+        escaped_position = -1
+        position = 0
+        while True:
+            for match in self._JSON_STRUCTURE.finditer(self.__buffer, position):
+                char = match.group()
+                if match.start() == escaped_position:
+                    continue
+                if in_string:
+                    if char == b"\\":
+                        escaped_position = match.end()
+                    elif char == b'"':
+                        in_string = False
+                elif char == b'"':
+                    in_string = True
+                elif char in (b"{", b"["):
+                    depth += 1
+                else:
+                    depth -= 1
+                    if depth == 0:
+                        end = match.end()
+                        json_bytes, self.__buffer = self.__buffer[:end], self.__buffer[end:]
+                        return json.loads(json_bytes)
+            position = len(self.__buffer)
+            self.__buffer += self.__read_chunk()
+
+    def read(self, size: int) -> bytes:
+        if size <= 0:
+            return b""
+        if not self.__buffer:
+            self.__buffer = self.__read_chunk()
+        chunk, self.__buffer = self.__buffer[:size], self.__buffer[size:]
+        return chunk
+
+
+class AttachmentsIterator:
+    """
+    The attachments of GetAttachmentsOperation, yielded as they are received. Close it (or use it as a context
+    manager) to release the connection.
+    """
+
+    def __init__(self, response: requests.Response):
+        self.__response = response
+        response.raw.decode_content = True
+        self.__reader = _AttachmentsResponseReader(response.raw)
+        self.__attachments_metadata: Optional[List[AttachmentDetails]] = None
+        self.__current: Optional[AttachmentIteratorResult] = None
+        self.__index = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def __iter__(self) -> Iterator[AttachmentIteratorResult]:
+        return self
+
+    def __next__(self) -> AttachmentIteratorResult:
+        if self.__attachments_metadata is None:
+            self.__attachments_metadata = [
+                AttachmentDetails.from_json(details) for details in self.__reader.read_json()["AttachmentsMetadata"]
+            ]
+
+        if self.__current is not None:
+            self.__current._skip()
+            self.__current = None
+
+        if self.__index >= len(self.__attachments_metadata):
+            raise StopIteration
+
+        self.__current = AttachmentIteratorResult(self.__attachments_metadata[self.__index], self.__reader)
+        self.__index += 1
+        return self.__current
+
+    def close(self):
+        self.__response.close()
+
+
 class AttachmentRequest:
     def __init__(self, document_id: str, name: str):
         if document_id.isspace():
@@ -91,10 +283,14 @@ class PutAttachmentOperation(IOperation[AttachmentDetails]):
         self,
         document_id: str,
         name: str,
-        stream: bytes,
+        stream: StreamSource,
         content_type: Optional[str] = None,
         change_vector: Optional[str] = None,
     ):
+        """
+        The stream can be bytes, a binary file or an iterable of bytes chunks - the last two are sent as they are read.
+        A seekable file is rewound when the request is retried, an iterable or a non seekable file can't be resent.
+        """
         super().__init__()
         self.__document_id = document_id
         self.__name = name
@@ -112,7 +308,7 @@ class PutAttachmentOperation(IOperation[AttachmentDetails]):
         )
 
     class __PutAttachmentCommand(RavenCommand[AttachmentDetails]):
-        def __init__(self, document_id: str, name: str, stream: bytes, content_type: str, change_vector: str):
+        def __init__(self, document_id: str, name: str, stream: StreamSource, content_type: str, change_vector: str):
             super().__init__(AttachmentDetails)
 
             if not document_id:
@@ -123,7 +319,7 @@ class PutAttachmentOperation(IOperation[AttachmentDetails]):
 
             self.__document_id = document_id
             self.__name = name
-            self.__stream = stream
+            self.__stream = ReplayableStream(stream)
             self.__content_type = content_type
             self.__change_vector = change_vector
 
@@ -133,14 +329,17 @@ class PutAttachmentOperation(IOperation[AttachmentDetails]):
                 f"&name={Utils.escape(self.__name, True,False)}"
             )
 
-            if not self.__content_type.isspace():
+            if self.__content_type and not self.__content_type.isspace():
                 url += f"&contentType={Utils.escape(self.__content_type, True, False)}"
 
             request = requests.Request("PUT", url)
-            if isinstance(self.__stream, (bytes, bytearray)):
-                request.files = {self.__name: (self.__name, self.__stream, self.__content_type)}
+            stream = self.__stream.open()  # rewound for a retry, or raises when it can't be
+            if is_in_memory(stream):
+                request.files = {self.__name: (self.__name, stream, self.__content_type)}
+            elif hasattr(stream, "read"):
+                request.data = stream
             else:
-                request.data = self.__stream
+                request.data = iter_chunks(stream)
             self._add_change_vector_if_not_none(self.__change_vector, request)
             return request
 
@@ -198,6 +397,17 @@ class GetAttachmentOperation(IOperation):
                 }
             return requests.Request(method, url, data=data)
 
+        def send(self, session: requests.Session, request: requests.Request) -> requests.Response:
+            # the attachment is read by the caller, as it's consumed
+            return session.request(
+                request.method,
+                url=request.url,
+                data=request.data,
+                cert=session.cert,
+                headers=request.headers,
+                stream=True,
+            )
+
         def is_read_request(self) -> bool:
             return True
 
@@ -205,7 +415,7 @@ class GetAttachmentOperation(IOperation):
             content_type = response.headers.get("Content-Type")
             change_vector = response.headers.get(constants.Headers.ETAG)
             hash = response.headers.get("Attachment-Hash")
-            size = response.headers.get("Attachment-Size", 0)
+            size = int(response.headers.get("Attachment-Size", 0))
             attachment_details = AttachmentDetails(
                 self.__name, hash, content_type, size, change_vector, self.__document_id
             )
@@ -213,23 +423,22 @@ class GetAttachmentOperation(IOperation):
             return ResponseDisposeHandling.MANUALLY
 
 
-class GetAttachmentsOperation(IOperation[CloseableAttachmentResult]):  # unfinished
-    def __init__(self, attachments: List[AttachmentRequest], attachment_type: AttachmentType):
+class GetAttachmentsOperation(IOperation[AttachmentsIterator]):
+    def __init__(self, attachments: List[AttachmentRequest], attachment_type: AttachmentType = AttachmentType.document):
+        super().__init__()
         self.__attachment_type = attachment_type
         self.__attachments = attachments
 
     def get_command(
         self, store: DocumentStore, conventions: DocumentConventions, cache: HttpCache
-    ) -> RavenCommand[CloseableAttachmentResult]:
+    ) -> RavenCommand[AttachmentsIterator]:
         return self.__GetAttachmentsCommand(self.__attachments, self.__attachment_type)
 
-    class __GetAttachmentsCommand(RavenCommand[CloseableAttachmentResult]):
+    class __GetAttachmentsCommand(RavenCommand[AttachmentsIterator]):
         def __init__(self, attachments: List[AttachmentRequest], attachment_type: AttachmentType):
-            super().__init__(CloseableAttachmentResult)
+            super().__init__(AttachmentsIterator)
             self.__attachment_type = attachment_type
             self.__attachments = attachments
-            self._response_type = RavenCommandResponseType.EMPTY
-            self.__attachments_metadata = []
 
         def create_request(self, node: ServerNode) -> requests.Request:
             return requests.Request(
@@ -244,12 +453,23 @@ class GetAttachmentsOperation(IOperation[CloseableAttachmentResult]):  # unfinis
                 },
             )
 
+        def send(self, session: requests.Session, request: requests.Request) -> requests.Response:
+            # the attachments are read by the caller, as they are consumed
+            return session.request(
+                request.method,
+                url=request.url,
+                data=request.data,
+                cert=session.cert,
+                headers=request.headers,
+                stream=True,
+            )
+
         def is_read_request(self) -> bool:
             return True
 
         def process_response(self, cache: HttpCache, response: requests.Response, url) -> ResponseDisposeHandling:
-            raise NotImplementedError("Fetching multiple attachments is yet to be implemented")
-            # todo: we can't decode it - maybe split bytes (part 1 is json, second part is binary attachments data) -
+            self.result = AttachmentsIterator(response)
+            return ResponseDisposeHandling.MANUALLY
 
 
 class DeleteAttachmentOperation(VoidOperation):
@@ -1,5 +1,4 @@
-import json
-from typing import Dict, Type, TypeVar, Optional
+from typing import Dict, Type, TypeVar, Optional, Union
 
 from ravendb.primitives import constants
 from ravendb.documents.conventions import DocumentConventions
@@ -13,12 +12,15 @@ _T = TypeVar("_T")
 class CompareExchangeValueResultParser:
     @staticmethod
     def get_values(
-        object_type: Type[_T], response: str, materialize_metadata: bool, conventions: DocumentConventions
+        object_type: Type[_T],
+        response: Union[str, bytes],
+        materialize_metadata: bool,
+        conventions: DocumentConventions,
     ) -> Dict[str, CompareExchangeValue[_T]]:
         results = CaseInsensitiveDict()
         if not response:
             return results
-        items = json.loads(response)["Results"]
+        items = conventions.json_codec.loads(response)["Results"]
         if not items:
             raise ValueError("Response is invalid. Results is missing.")
 
@@ -35,9 +37,13 @@ class CompareExchangeValueResultParser:
     # todo: check if we can't set object type as optional
     @staticmethod
     def get_value(
-        object_type: Type[_T], response: str, materialize_metadata: bool, conventions: DocumentConventions
+        object_type: Type[_T],
+        response: Union[str, bytes],
+        materialize_metadata: bool,
+        conventions: DocumentConventions,
     ) -> Optional[CompareExchangeValue[_T]]:
-        if not response or response == "null":
+        # the response is bytes when read straight from the http response or the multi get
+        if not response or response in ("null", b"null"):
             return None
 
         values = CompareExchangeValueResultParser.get_values(object_type, response, materialize_metadata, conventions)
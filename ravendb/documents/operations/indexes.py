@@ -68,8 +68,8 @@ class PutIndexesOperation(MaintenanceOperation):
 
         def set_response(self, response: str, from_cache: bool) -> None:
             self.result = json.loads(response)  # todo: PutIndexResult instead of dict
-            if "Error" in response:
-                raise ErrorResponseException(response["Error"])
+            if "Error" in self.result:
+                raise ErrorResponseException(self.result["Error"])
 
 
 class GetIndexNamesOperation(MaintenanceOperation):
@@ -1,21 +1,85 @@
-# todo: DatabaseChanges class
+from __future__ import annotations
+
+import heapq
+import itertools
 import time
-from typing import Callable, TYPE_CHECKING, Optional
+from concurrent.futures import Future
+from datetime import timedelta
+from threading import Condition, Lock, Thread
+from typing import Callable, TYPE_CHECKING, Optional, List, Tuple
+
+import requests
 
 from ravendb.documents.operations.definitions import OperationExceptionResult
 from ravendb.exceptions.exception_dispatcher import ExceptionDispatcher
+from ravendb.exceptions.exceptions import AllTopologyNodesDownException, RequestedNodeUnavailableException
 from ravendb.http.raven_command import RavenCommand
 from ravendb.primitives.exceptions import OperationCancelledException
 from ravendb.tools.utils import Utils
 from ravendb.documents.operations.misc import GetOperationStateOperation
 
 if TYPE_CHECKING:
+    from ravendb.changes.types import OperationStatusChange
     from ravendb.documents.conventions import DocumentConventions
     from ravendb.http.request_executor import RequestExecutor
     from ravendb.changes.database_changes import DatabaseChanges
 
 
+class _OperationStatusPoller:
+    """
+    Polls the state of every awaited operation from a single thread, in the order they are due.
+    """
+
+    def __init__(self):
+        self.__condition = Condition()
+        self.__due: List[Tuple[float, int, Operation, bool]] = []
+        self.__sequence = itertools.count()
+        self.__thread: Optional[Thread] = None
+
+    def schedule(self, operation: Operation, delay: timedelta, reschedule: bool) -> None:
+        with self.__condition:
+            heapq.heappush(
+                self.__due,
+                (time.monotonic() + delay.total_seconds(), next(self.__sequence), operation, reschedule),
+            )
+            if self.__thread is None:
+                self.__thread = Thread(target=self.__run, name="operation-status-poller", daemon=True)
+                self.__thread.start()
+            self.__condition.notify()
+
+    def __run(self) -> None:
+        while True:
+            with self.__condition:
+                while not self.__due or self.__due[0][0] > time.monotonic():
+                    self.__condition.wait(max(self.__due[0][0] - time.monotonic(), 0) if self.__due else None)
+                _, _, operation, reschedule = heapq.heappop(self.__due)
+
+            try:
+                operation._poll(reschedule)
+            except Exception:
+                pass  # the thread is shared by all the awaited operations, one of them failing can't stop it
+
+
 class Operation:
+    """
+    Long running server operation (delete/patch by query, compact, import...).
+
+    Completion is pushed by the changes api, the state is polled only as a fallback - often when the changes
+    aren't available, and rarely as a safety net for notifications lost on a reconnection.
+    """
+
+    # polling without the changes api, doubled after every poll
+    MIN_POLL_INTERVAL = timedelta(milliseconds=50)
+    MAX_POLL_INTERVAL = timedelta(milliseconds=500)
+
+    # polling next to the changes api
+    SAFETY_POLL_INTERVAL = timedelta(seconds=1)
+    MAX_SAFETY_POLL_INTERVAL = timedelta(seconds=10)
+
+    _poller = _OperationStatusPoller()
+
+    _TRANSIENT_ERRORS = (requests.RequestException, AllTopologyNodesDownException, RequestedNodeUnavailableException)
+
     def __init__(
         self,
         request_executor: "RequestExecutor",
@@ -25,10 +89,31 @@ class Operation:
         node_tag: str = None,
     ):
         self.__request_executor = request_executor
+        self.__changes = changes
         self.__conventions = conventions
         self.__key = key
         self.node_tag = node_tag
 
+        self.__lock = Lock()
+        self.__result: Optional[Future] = None
+        self.__unsubscribe: Optional[Callable[[], None]] = None
+        self.__poll_interval: Optional[timedelta] = None
+        self.__on_progress: List[Callable[[dict], None]] = []
+
+    @property
+    def key(self) -> int:
+        return self.__key
+
+    def add_on_progress(self, callback: Callable[[dict], None]) -> None:
+        """
+        The callback gets the progress of the operation every time the server reports it.
+        It runs on the thread delivering the change, so it should return quickly.
+        """
+        self.__on_progress.append(callback)
+
+    def remove_on_progress(self, callback: Callable[[dict], None]) -> None:
+        self.__on_progress.remove(callback)
+
     def fetch_operations_status(self) -> dict:
         command = self._get_operation_state_command(self.__conventions, self.__key, self.node_tag)
         self.__request_executor.execute_command(command)
@@ -40,23 +125,129 @@ class Operation:
     ) -> RavenCommand[dict]:
         return GetOperationStateOperation.GetOperationStateCommand(self.__key, node_tag)
 
-    def wait_for_completion(self) -> None:
-        while True:
-            status = self.fetch_operations_status()
-            operation_status = status.get("Status")
+    def wait_for_completion(self, timeout: Optional[timedelta] = None) -> Optional[dict]:
+        """
+        Blocks until the operation completes and returns its result.
+        Raises OperationCancelledException or the error of the operation if it didn't succeed,
+        concurrent.futures.TimeoutError when it didn't complete within the timeout (an alias of the builtin
+        TimeoutError since Python 3.11).
+        """
+        return self.wait_for_completion_async().result(timeout.total_seconds() if timeout is not None else None)
+
+    def wait_for_completion_async(self) -> Future:
+        """
+        Future completed with the result of the operation, no thread is held while waiting for it.
+        Use asyncio.wrap_future() to await it from a coroutine.
+        """
+        with self.__lock:
+            if self.__result is not None:
+                return self.__result
+            self.__result = Future()
 
-            if operation_status == "Completed":
+        self.__subscribe_to_changes()
+        Operation._poller.schedule(self, timedelta(), True)
+        return self.__result
+
+    def __subscribe_to_changes(self) -> None:
+        changes = self.__get_changes()
+        if changes is None:
+            self.__poll_interval = Operation.MIN_POLL_INTERVAL
+            return
+
+        from ravendb.changes.observers import ActionObserver
+
+        observable = changes.for_operation_id(self.__key)
+        self.__unsubscribe = observable.subscribe_with_observer(
+            ActionObserver(self.__on_status_change, on_error=self.__on_changes_error)
+        )
+        self.__poll_interval = Operation.SAFETY_POLL_INTERVAL
+
+        # the operation might have completed before the server started sending its changes
+        observable.add_on_subscribed(lambda: Operation._poller.schedule(self, timedelta(), False))
+
+    def __get_changes(self) -> Optional["DatabaseChanges"]:
+        if self.__changes is None:
+            return None
+
+        try:
+            changes = self.__changes()
+            if changes is None:
+                return None
+
+            # the state of the operation is only reported by the node running it
+            preferred_node = self.__request_executor.preferred_node.current_node
+            if self.node_tag and preferred_node.cluster_tag and self.node_tag != preferred_node.cluster_tag:
+                return None
+
+            return changes
+        except Exception:
+            return None  # polling still works
+
+    def __on_status_change(self, change: OperationStatusChange) -> None:
+        self.__on_state(change.state)
+
+    def __on_changes_error(self, exception: Exception) -> None:
+        with self.__lock:
+            self.__poll_interval = Operation.MIN_POLL_INTERVAL
+        Operation._poller.schedule(self, timedelta(), False)
+
+    def _poll(self, reschedule: bool) -> None:
+        if self.__result.done():
+            return
+
+        try:
+            state = self.fetch_operations_status()
+            if state is None:
+                raise RuntimeError(f"Operation {self.__key} doesn't exist on the server")
+            self.__on_state(state)
+        except Exception as e:
+            # next to the changes api a network failure is retried by the next poll, anything else fails the operation
+            if self.__unsubscribe is None or not isinstance(e, Operation._TRANSIENT_ERRORS):
+                self.__complete(exception=e)
                 return
-            elif operation_status == "Canceled":
-                raise OperationCancelledException()
-            elif operation_status == "Faulted":
-                result = status.get("Result")
-                exception_result: OperationExceptionResult = Utils.initialize_object(
-                    result, OperationExceptionResult, True
-                )
-                schema = ExceptionDispatcher.ExceptionSchema(
-                    self.__request_executor.url, exception_result.type, exception_result.message, exception_result.error
+
+        if reschedule and not self.__result.done():
+            with self.__lock:
+                interval = self.__poll_interval
+                max_interval = (
+                    Operation.MAX_SAFETY_POLL_INTERVAL
+                    if self.__unsubscribe is not None
+                    else Operation.MAX_POLL_INTERVAL
                 )
-                raise ExceptionDispatcher.get(schema, exception_result.status_code)
+                self.__poll_interval = min(interval * 2, max_interval)
+            Operation._poller.schedule(self, interval, True)
+
+    def __on_state(self, state: dict) -> None:
+        operation_status = state.get("Status")
+
+        if operation_status == "InProgress":
+            progress = state.get("Progress")
+            if progress is not None:
+                for callback in self.__on_progress:
+                    callback(progress)
+        elif operation_status == "Completed":
+            self.__complete(result=state.get("Result"))
+        elif operation_status == "Canceled":
+            self.__complete(exception=OperationCancelledException())
+        elif operation_status == "Faulted":
+            result = state.get("Result")
+            exception_result: OperationExceptionResult = Utils.initialize_object(result, OperationExceptionResult, True)
+            schema = ExceptionDispatcher.ExceptionSchema(
+                self.__request_executor.url, exception_result.type, exception_result.message, exception_result.error
+            )
+            self.__complete(exception=ExceptionDispatcher.get(schema, exception_result.status_code))
+
+    def __complete(self, result: Optional[dict] = None, exception: Optional[Exception] = None) -> None:
+        with self.__lock:
+            if self.__result.done():
+                return
+
+            unsubscribe, self.__unsubscribe = self.__unsubscribe, None
+
+            if exception is not None:
+                self.__result.set_exception(exception)
+            else:
+                self.__result.set_result(result)
 
-            time.sleep(0.5)
+        if unsubscribe is not None:
+            unsubscribe()
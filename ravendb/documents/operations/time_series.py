@@ -7,7 +7,7 @@ import requests
 
 from ravendb.primitives.constants import int_max
 from ravendb.documents.session.loaders.include import TimeSeriesIncludeBuilder
-from ravendb.documents.session.time_series import TimeSeriesEntry, AbstractTimeSeriesRange
+from ravendb.documents.session.time_series import TimeSeriesEntry, AbstractTimeSeriesRange, TimeSeriesArrays
 from ravendb.http.http_cache import HttpCache
 from ravendb.http.server_node import ServerNode
 from ravendb.http.topology import RaftCommand
@@ -427,19 +427,41 @@ class TimeSeriesRangeResult:
     ):
         self.from_date = from_date
         self.to_date = to_date
-        self.entries = entries if entries else []
+        self._entries = entries if entries else []
+        self._entries_json: Optional[List[Dict[str, Any]]] = None
         self.total_results = total_results
         self.includes = includes
 
+    @property
+    def entries(self) -> List[TimeSeriesEntry]:
+        # entries received from the server are turned into objects on first use, to_arrays doesn't need them
+        if self._entries is None:
+            self._entries = [TimeSeriesEntry.from_json(entry_json) for entry_json in self._entries_json]
+            self._entries_json = None
+        return self._entries
+
+    @entries.setter
+    def entries(self, value: List[TimeSeriesEntry]):
+        self._entries = value
+        self._entries_json = None
+
+    def to_arrays(self) -> TimeSeriesArrays:
+        if self._entries is None:
+            return TimeSeriesArrays.from_json(self._entries_json)
+        return TimeSeriesArrays.from_entries(self._entries)
+
     @classmethod
     def from_json(cls, json_dict: Dict[str, Any]) -> TimeSeriesRangeResult:
-        return cls(
+        result = cls(
             Utils.string_to_datetime(json_dict["From"]),
             Utils.string_to_datetime(json_dict["To"]),
-            [TimeSeriesEntry.from_json(entry_json) for entry_json in json_dict["Entries"]],
+            None,
             json_dict["TotalResults"] if "TotalResults" in json_dict else None,
             json_dict.get("Includes", None),
         )
+        result._entries = None
+        result._entries_json = json_dict["Entries"]
+        return result
 
 
 class GetTimeSeriesOperation(IOperation[TimeSeriesRangeResult]):
@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Optional, Type, TypeVar, Union, List, Dict, Callable
+
+from ravendb.documents.operations.batch import BatchOperation
+from ravendb.documents.session.loaders.include import IncludeBuilder
+from ravendb.documents.session.operations.load_operation import LoadOperation
+from ravendb.documents.session.operations.operations import LoadStartingWithOperation
+from ravendb.documents.session.query import AbstractDocumentQuery, DocumentQuery
+
+if TYPE_CHECKING:
+    from ravendb.documents.queries.misc import Query
+    from ravendb.documents.session.document_session import DocumentSession
+    from ravendb.documents.session.misc import SessionInfo
+    from ravendb.documents.conventions import DocumentConventions
+    from ravendb.http.async_request_executor import AsyncRequestExecutor
+    from ravendb.http.raven_command import RavenCommand
+
+_T = TypeVar("_T")
+
+
+class AsyncDocumentSession:
+    """
+    Asyncio facade over a DocumentSession.
+
+    Unit of work operations (store, delete, query building, advanced) are in-memory and stay synchronous,
+    every operation that talks to the server is a coroutine executed by the AsyncRequestExecutor.
+    """
+
+    def __init__(self, session: DocumentSession):
+        self._session = session
+        self._request_executor: AsyncRequestExecutor = session.request_executor
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self) -> None:
+        self._session.close()
+
+    @property
+    def session(self) -> DocumentSession:
+        return self._session
+
+    @property
+    def advanced(self) -> DocumentSession._Advanced:
+        return self._session.advanced
+
+    @property
+    def conventions(self) -> DocumentConventions:
+        return self._session.conventions
+
+    @property
+    def session_info(self) -> SessionInfo:
+        return self._session.session_info
+
+    @property
+    def request_executor(self) -> AsyncRequestExecutor:
+        return self._request_executor
+
+    def store(self, entity: object, key: Optional[str] = None, change_vector: Optional[str] = None) -> None:
+        self._session.store(entity, key, change_vector)
+
+    def delete(self, key_or_entity: Union[str, object], expected_change_vector: Optional[str] = None) -> None:
+        self._session.delete(key_or_entity, expected_change_vector)
+
+    def query(self, source: Optional[Query] = None, object_type: Optional[Type[_T]] = None) -> DocumentQuery[_T]:
+        return self._session.query(source, object_type)
+
+    def query_collection(self, collection_name: str, object_type: Optional[Type[_T]] = None) -> DocumentQuery[_T]:
+        return self._session.query_collection(collection_name, object_type)
+
+    def query_index(self, index_name: str, object_type: Optional[Type[_T]] = None) -> DocumentQuery[_T]:
+        return self._session.query_index(index_name, object_type)
+
+    async def execute_command(self, command: RavenCommand) -> None:
+        await self._request_executor.execute_command_async(command, self.session_info)
+
+    async def load(
+        self,
+        key_or_keys: Union[List[str], str],
+        object_type: Optional[Type[_T]] = None,
+        includes: Callable[[IncludeBuilder], None] = None,
+    ) -> Union[Dict[str, _T], _T]:
+        if key_or_keys is None:
+            return None
+
+        keys = [key_or_keys] if isinstance(key_or_keys, str) else key_or_keys
+        load_operation = LoadOperation(self._session).by_keys(keys)
+
+        if includes is not None:
+            include_builder = IncludeBuilder(self.conventions)
+            includes(include_builder)
+
+            load_operation.with_includes(include_builder.documents_to_include)
+            if include_builder.is_all_counters:
+                load_operation.with_all_counters()
+            else:
+                load_operation.with_counters(include_builder.counters_to_include)
+            load_operation.with_time_series(include_builder.time_series_to_include)
+            load_operation.with_compare_exchange(include_builder.compare_exchange_values_to_include)
+
+        command = load_operation.create_request()
+        if command is not None:
+            await self.execute_command(command)
+            load_operation.set_result(command.result)
+
+        result = load_operation.get_documents(object_type)
+        return result.popitem()[1] if len(result) == 1 else result if result else None
+
+    async def load_starting_with(
+        self,
+        id_prefix: str,
+        object_type: Optional[Type[_T]] = None,
+        matches: Optional[str] = None,
+        start: Optional[int] = None,
+        page_size: Optional[int] = None,
+        exclude: Optional[str] = None,
+        start_after: Optional[str] = None,
+    ) -> List[_T]:
+        operation = LoadStartingWithOperation(self._session)
+        operation.with_start_with(id_prefix, matches, start, page_size, exclude, start_after)
+        command = operation.create_request()
+        if command is not None:
+            await self.execute_command(command)
+            operation.set_result(command.result)
+        return operation.get_documents(object_type)
+
+    async def save_changes(self) -> None:
+        save_changes_operation = BatchOperation(self._session)
+        command = save_changes_operation.create_request()
+        if command is None:
+            return
+
+        with command:
+            if self._session.no_tracking:
+                raise RuntimeError("Cannot execute save_changes when entity tracking is disabled.")
+
+            await self.execute_command(command)
+            self._session.update_session_after_save_changes(command.result)
+            save_changes_operation.set_result(command.result)
+
+    async def to_list(self, query: AbstractDocumentQuery[_T]) -> List[_T]:
+        query_operation = query.initialize_query_operation()
+        query_operation.enter_query_context()
+        command = query_operation.create_request()
+        await self.execute_command(command)
+        query_operation.set_result(command.result)
+        query.invoke_after_query_executed(query_operation.current_query_results)
+        return query_operation.complete(query.query_class)
+
+    async def first(self, query: AbstractDocumentQuery[_T]) -> Optional[_T]:
+        query._take(1)
+        results = await self.to_list(query)
+        return results[0] if results else None
+
+    async def single(self, query: AbstractDocumentQuery[_T]) -> _T:
+        query._take(2)
+        results = await self.to_list(query)
+        if len(results) != 1:
+            raise ValueError(f"Expected single result, got: {len(results)} ")
+        return results[0]
+
+    async def count(self, query: AbstractDocumentQuery[_T]) -> int:
+        query._take(0)
+        query_operation = query.initialize_query_operation()
+        query_operation.enter_query_context()
+        command = query_operation.create_request()
+        await self.execute_command(command)
+        query_operation.set_result(command.result)
+        return query_operation.current_query_results.total_results
@@ -1,5 +1,7 @@
 from __future__ import annotations
-from typing import Any, Dict
+
+import json
+from typing import Any, Dict, Optional
 
 from ravendb.primitives import constants
 from ravendb.documents.session.concurrency_check_mode import ConcurrencyCheckMode
@@ -25,12 +27,39 @@ class DocumentInfo:
         self.concurrency_check_mode = concurrency_check_mode
         self.ignore_changes = ignore_changes
         self.metadata = metadata
-        self.document = document
+        self._document = document
+        self._document_snapshot: Optional[str] = None
         self.metadata_instance = metadata_instance
         self.entity = entity
         self.new_document = new_document
         self.collection = collection
 
+    @property
+    def document(self) -> Optional[dict]:
+        if self._document is None and self._document_snapshot is not None:
+            self._document = json.loads(self._document_snapshot)
+        return self._document
+
+    @document.setter
+    def document(self, value: Optional[dict]):
+        self._document = value
+        self._document_snapshot = None
+
+    @property
+    def document_snapshot(self) -> Optional[str]:
+        return self._document_snapshot
+
+    def take_document_snapshot(self) -> None:
+        """
+        Replaces the document with its serialized form.
+        Used when the entity was built without copying the document, so both share nested containers -
+        the document is parsed back from the snapshot on first access.
+        """
+        if self._document is None:
+            return
+        self._document_snapshot = json.dumps(self._document)
+        self._document = None
+
     @classmethod
     def get_new_document_info(cls, document: Dict) -> DocumentInfo:
         metadata = document.get(constants.Documents.Metadata.KEY)
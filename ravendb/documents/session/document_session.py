@@ -8,7 +8,21 @@ import json
 import os
 import time
 import uuid
-from typing import Union, Callable, TYPE_CHECKING, Optional, Dict, List, Type, TypeVar, Tuple, Generic, Set
+from typing import (
+    Union,
+    Callable,
+    TYPE_CHECKING,
+    Optional,
+    Dict,
+    List,
+    Type,
+    TypeVar,
+    Tuple,
+    Generic,
+    Set,
+    Iterator,
+    BinaryIO,
+)
 
 from ravendb.documents.session.document_session_revisions import DocumentSessionRevisions
 from ravendb.primitives import constants
@@ -38,7 +52,10 @@ from ravendb.data.operation import AttachmentType
 from ravendb.documents.indexes.definitions import AbstractCommonApiForIndexes
 from ravendb.documents.operations.attachments import (
     GetAttachmentOperation,
+    GetAttachmentsOperation,
     AttachmentName,
+    AttachmentRequest,
+    AttachmentsIterator,
     CloseableAttachmentResult,
 )
 from ravendb.documents.operations.batch import BatchOperation
@@ -57,7 +74,13 @@ from ravendb.documents.session.document_session_operations.in_memory_document_se
 from ravendb.documents.session.loaders.include import IncludeBuilder
 from ravendb.documents.session.loaders.loaders import LoaderWithInclude, MultiLoaderWithInclude
 from ravendb.documents.session.operations.lazy import LazyLoadOperation, LazySessionOperations
-from ravendb.documents.session.operations.operations import MultiGetOperation, LoadStartingWithOperation
+from ravendb.documents.commands.stream import StreamResult
+from ravendb.documents.session.operations.operations import (
+    MultiGetOperation,
+    LoadStartingWithOperation,
+    StreamOperation,
+)
+from ravendb.documents.session.operations.query import QueryOperation
 from ravendb.documents.session.misc import (
     SessionOptions,
     ResponseTimeInformation,
@@ -66,6 +89,7 @@ from ravendb.documents.session.misc import (
     DocumentsChanges,
     SessionInfo,
     TransactionMode,
+    StreamQueryStatistics,
 )
 from ravendb.documents.session.query import DocumentQuery, RawDocumentQuery
 from ravendb.json.metadata_as_dictionary import MetadataAsDictionary
@@ -100,6 +124,7 @@ from ravendb.documents.store.misc import IdTypeAndName
 if TYPE_CHECKING:
     from ravendb.documents.conventions import DocumentConventions
     from ravendb.documents.operations.lazy.definition import LazyOperation
+    from ravendb.http.multipart import StreamSource
     from ravendb.http.request_executor import RequestExecutor
     from ravendb.documents.store.definition import DocumentStore
 
@@ -170,22 +195,29 @@ class DocumentSession(InMemoryDocumentSessionOperations):
         return self.conventions.generate_document_id(self.database_name, entity)
 
     def execute_all_pending_lazy_operations(self) -> ResponseTimeInformation:
-        requests = []
-        for i in range(len(self._pending_lazy_operations)):
-            # todo: pending lazy operation create request - WIP
-            req = self._pending_lazy_operations[i].create_request()
-            if req is None:
-                self._pending_lazy_operations.pop(i)
-                i -= 1
-                continue
-            requests.append(req)
-        if not requests:
+        pending = []
+        for operation in self._pending_lazy_operations:
+            request = operation.create_request()
+            if request is None:
+                continue  # answered by the session itself, the result is already set
+            pending.append((operation, request))
+
+        self._pending_lazy_operations = [operation for operation, _ in pending]
+        if not pending:
             return ResponseTimeInformation()
 
         sw = Stopwatch.create_started()
         response_time_duration = ResponseTimeInformation()
-        while self._execute_lazy_operations_single_step(response_time_duration, requests, sw):
-            time.sleep(0.1)
+        retries = 0
+        while True:
+            pending = self._execute_lazy_operations_single_step(response_time_duration, pending, sw)
+            if not pending:
+                break
+
+            # only the operations that asked for it are sent again, backing off a little more every time
+            if retries:
+                time.sleep(min(0.01 * 2 ** (retries - 1), 1))
+            retries += 1
         response_time_duration.compute_server_total()
 
         for pending_lazy_operation in self._pending_lazy_operations:
@@ -201,38 +233,52 @@ class DocumentSession(InMemoryDocumentSessionOperations):
         return response_time_duration
 
     def _execute_lazy_operations_single_step(
-        self, response_time_information: ResponseTimeInformation, get_requests: List[GetRequest], sw: Stopwatch
-    ) -> bool:
-        multi_get_operation = MultiGetOperation(self)
-        with multi_get_operation.create_request(get_requests) as multi_get_command:
-            self._request_executor.execute_command(multi_get_command, self.session_info)
-
-            responses = multi_get_command.result
-
-            if not multi_get_command.aggressively_cached:
-                self.increment_requests_count()
+        self,
+        response_time_information: ResponseTimeInformation,
+        pending: List[Tuple[LazyOperation, GetRequest]],
+        sw: Stopwatch,
+    ) -> List[Tuple[LazyOperation, GetRequest]]:
+        """
+        Executes the requests and hands the responses to their operations.
+        Returns the operations that have to be retried.
+        """
+        get_requests = [request for _, request in pending]
+        batcher = self._document_store.multi_get_batcher
+        if (
+            batcher is not None
+            and not self.session_info.can_use_load_balance_behavior
+            and self.session_info.last_cluster_transaction_index is None
+        ):
+            responses, aggressively_cached = batcher.execute(self._request_executor, get_requests, self.session_info)
+        else:
+            multi_get_operation = MultiGetOperation(self)
+            with multi_get_operation.create_request(get_requests) as multi_get_command:
+                self._request_executor.execute_command(multi_get_command, self.session_info)
+                responses, aggressively_cached = multi_get_command.result, multi_get_command.aggressively_cached
 
-            for i in range(len(self._pending_lazy_operations)):
-                response = responses[i]
+        if not aggressively_cached:
+            self.increment_requests_count()
 
-                temp_req_time = response.headers.get(constants.Headers.REQUEST_TIME)
-                response.elapsed = sw.elapsed()
-                total_time = temp_req_time if temp_req_time is not None else 0
+        operations_to_retry = []
+        for (operation, request), response in zip(pending, responses):
+            temp_req_time = response.headers.get(constants.Headers.REQUEST_TIME)
+            response.elapsed = sw.elapsed()
+            total_time = temp_req_time if temp_req_time is not None else 0
 
-                time_item = ResponseTimeInformation.ResponseTimeItem(get_requests[i].url_and_query, total_time)
+            time_item = ResponseTimeInformation.ResponseTimeItem(request.url_and_query, total_time)
 
-                response_time_information.duration_breakdown.append(time_item)
+            response_time_information.duration_breakdown.append(time_item)
 
-                if response.request_has_errors:
-                    raise RuntimeError(
-                        f"Got an error from server, status code: {response.status_code}{os.linesep}{response.result}"
-                    )
+            if response.request_has_errors:
+                raise RuntimeError(
+                    f"Got an error from server, status code: {response.status_code}{os.linesep}{response.result}"
+                )
 
-                self._pending_lazy_operations[i].handle_response(response)
-                if self._pending_lazy_operations[i].requires_retry:
-                    return True
+            operation.handle_response(response)
+            if operation.requires_retry:
+                operations_to_retry.append((operation, request))
 
-            return False
+        return operations_to_retry
 
     def include(self, path: str) -> LoaderWithInclude:
         return MultiLoaderWithInclude(self).include(path)
@@ -543,40 +589,7 @@ class DocumentSession(InMemoryDocumentSessionOperations):
             self.__session = session
 
         def execute_all_pending_lazy_operations(self) -> ResponseTimeInformation:
-            operations_to_remove = []
-
-            requests = []
-
-            for lazy_operation in self.__session._pending_lazy_operations:
-                req = lazy_operation.create_request()
-                if req is None:
-                    operations_to_remove.append(lazy_operation)
-                    continue
-                requests.append(req)
-
-            for op in operations_to_remove:
-                self.__session._pending_lazy_operations.remove(op)
-
-            if not requests:
-                return ResponseTimeInformation()
-
-            sw = Stopwatch.create_started()
-            response_time_duration = ResponseTimeInformation()
-            while self.__session._execute_lazy_operations_single_step(response_time_duration, requests, sw):
-                time.sleep(0.1)
-            response_time_duration.compute_server_total()
-
-            for pending_lazy_operation in self.__session._pending_lazy_operations:
-                value = self.__session._on_evaluate_lazy.get(pending_lazy_operation)
-                if value is not None:
-                    value(pending_lazy_operation.result)
-
-            elapsed = datetime.now() - sw.elapsed()
-            response_time_duration.total_client_duration = elapsed
-
-            self.__session._pending_lazy_operations.clear()
-
-            return response_time_duration
+            return self.__session.execute_all_pending_lazy_operations()
 
     class _Advanced:
         def __init__(self, session: DocumentSession):
@@ -1022,24 +1035,95 @@ class DocumentSession(InMemoryDocumentSessionOperations):
 
         def stream(
             self,
-            query_or_raw_query,  # : Union[RawDocumentQuery, DocumentQuery],
-            stream_query_stats,  # : Optional[StreamQueryStatistics] = None,
-        ) -> iter:
-            pass
+            query: Union[DocumentQuery[_T], RawDocumentQuery[_T]],
+            stream_query_stats: Optional[StreamQueryStatistics] = None,
+        ) -> Iterator[StreamResult[_T]]:
+            stream_operation = StreamOperation(self._session, stream_query_stats)
+            command = stream_operation.create_request(query.index_query)
+
+            self.request_executor.execute_command(command, self._session.session_info)
+
+            results = stream_operation.set_result(command.result)
+            return self.__yield_query_results(query, results)
+
+        def __yield_query_results(
+            self, query: Union[DocumentQuery[_T], RawDocumentQuery[_T]], results: Iterator[Dict]
+        ) -> Iterator[StreamResult[_T]]:
+            fields_to_fetch = query._fields_to_fetch_token
+            for json_dict in results:
+                # streamed entities are never tracked by the session
+                yield self.__create_stream_result(
+                    json_dict,
+                    lambda key, document, metadata: QueryOperation.deserialize(
+                        query.query_class,
+                        key,
+                        document,
+                        metadata,
+                        fields_to_fetch,
+                        True,
+                        self._session,
+                        query.is_project_into,
+                    ),
+                )
 
         def stream_starting_with(
             self,
-            object_type: type,
             starts_with: str,
-            matches: str = None,
+            object_type: Optional[Type[_T]] = None,
+            matches: Optional[str] = None,
             start: int = 0,
-            page_size: int = 25,
-            starting_after: str = None,
-        ) -> iter:
-            pass
+            page_size: int = int_max,
+            start_after: Optional[str] = None,
+        ) -> Iterator[StreamResult[_T]]:
+            stream_operation = StreamOperation(self._session)
+            command = stream_operation.create_request_starting_with(
+                starts_with, matches, start, page_size, None, start_after
+            )
+
+            self.request_executor.execute_command(command, self._session.session_info)
 
-        def stream_into(self):  # query: Union[DocumentQuery, RawDocumentQuery], output: iter):
-            pass
+            results = stream_operation.set_result(command.result)
+            return self.__yield_documents(object_type, results)
+
+        def __yield_documents(
+            self, object_type: Optional[Type[_T]], results: Iterator[Dict]
+        ) -> Iterator[StreamResult[_T]]:
+            for json_dict in results:
+                yield self.__create_stream_result(
+                    json_dict,
+                    lambda key, document, metadata: self._session.track_entity(
+                        object_type, key, document, metadata, True
+                    ),
+                )
+
+        @staticmethod
+        def __create_stream_result(json_dict: Dict, deserialize: Callable[[str, Dict, Dict], _T]) -> StreamResult[_T]:
+            metadata = json_dict.get(constants.Documents.Metadata.KEY)
+            if metadata is None:
+                raise InvalidOperationException("Document must have a metadata")
+
+            change_vector = metadata.get(constants.Documents.Metadata.CHANGE_VECTOR)
+            if change_vector is None:
+                raise InvalidOperationException("Document must have a Change Vector")
+
+            key = metadata.get(constants.Documents.Metadata.ID)
+
+            stream_result = StreamResult()
+            stream_result.key = key
+            stream_result.change_vector = change_vector
+            stream_result.metadata = MetadataAsDictionary(metadata)
+            stream_result.document = deserialize(key, json_dict, metadata)
+            return stream_result
+
+        def stream_into(self, query: Union[DocumentQuery, RawDocumentQuery], output: BinaryIO) -> None:
+            stream_operation = StreamOperation(self._session)
+            command = stream_operation.create_request(query.index_query)
+
+            self.request_executor.execute_command(command, self._session.session_info)
+
+            with command.result as stream_result:
+                for chunk in stream_result.response.iter_content(16 * 1024):
+                    output.write(chunk)
 
         def conditional_load(
             self, key: str, change_vector: str, object_type: Type[_T] = None
@@ -1116,10 +1200,15 @@ class DocumentSession(InMemoryDocumentSessionOperations):
                 self,
                 entity_or_document_id: Union[object, str],
                 name: str,
-                stream: bytes,
+                stream: StreamSource,
                 content_type: str = None,
                 change_vector: str = None,
             ):
+                """
+                The stream can also be a binary file or an iterable of bytes chunks, it's read while save_changes
+                sends it. A seekable file is rewound when the request is retried, an iterable or a non seekable file
+                can't be resent.
+                """
                 if not isinstance(entity_or_document_id, str):
                     entity = self.__session._documents_by_entity.get(entity_or_document_id, None)
                     if not entity:
@@ -1210,14 +1299,7 @@ class DocumentSession(InMemoryDocumentSessionOperations):
                 self,
                 entity_or_document_id: str = None,
                 name: str = None,
-                # att_requests: Optional[List[AttachmentRequest]] = None,
-                # todo: fetching multiple attachments with single command
             ) -> CloseableAttachmentResult:
-                # if att_requests is not None:
-                #     if entity_or_document_id or name:
-                #         raise ValueError("Specify either <att_requests> or <entity/document_id, name>")
-                #     operation = GetAttachmentsOperation(att_requests, AttachmentType.document)
-                # else:
                 if not isinstance(entity_or_document_id, str):
                     entity = self.__session._documents_by_entity.get(entity_or_document_id, None)
                     if not entity:
@@ -1227,6 +1309,13 @@ class DocumentSession(InMemoryDocumentSessionOperations):
                 operation = GetAttachmentOperation(entity_or_document_id, name, AttachmentType.document, None)
                 return self.__store.operations.send(operation)
 
+            def get_many(self, attachments: List[AttachmentRequest]) -> AttachmentsIterator:
+                """
+                Gets the attachments in a single request. They are yielded as they are received, each one until the
+                next is requested - close the result (or use it as a context manager) when done.
+                """
+                return self.__store.operations.send(GetAttachmentsOperation(attachments, AttachmentType.document))
+
             def copy(
                 self,
                 entity_or_document_id: Union[object, str],
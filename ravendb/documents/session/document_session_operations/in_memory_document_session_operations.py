@@ -11,6 +11,7 @@ from ravendb.documents.operations.time_series import TimeSeriesRangeResult
 from ravendb.documents.session.misc import (
     SessionOptions,
     TransactionMode,
+    ChangeTrackingMode,
     SessionInfo,
     ForceRevisionStrategy,
     DocumentsChanges,
@@ -438,6 +439,7 @@ class InMemoryDocumentSessionOperations:
         self._on_evaluate_lazy = {}
 
         self._no_tracking = options.no_tracking
+        self._change_tracking_mode = options.change_tracking_mode or ChangeTrackingMode.DEEP_COPY
 
         self._use_optimistic_concurrency = self._request_executor.conventions.use_optimistic_concurrency
         self._max_number_of_requests_per_session = self._request_executor.conventions.max_number_of_requests_per_session
@@ -665,6 +667,10 @@ class InMemoryDocumentSessionOperations:
     def no_tracking(self, value: bool):
         self._no_tracking = value
 
+    @property
+    def change_tracking_mode(self) -> ChangeTrackingMode:
+        return self._change_tracking_mode
+
     # def counters_for(self, entity_or_document_id):
     #     """
     #     Get A counters object associated with the document
@@ -776,10 +782,16 @@ class InMemoryDocumentSessionOperations:
         if not key:
             return self.__deserialize_from_transformer(entity_type, None, document, False)
 
+        snapshot = not no_tracking and self._change_tracking_mode == ChangeTrackingMode.SNAPSHOT
+
         doc_info = self._documents_by_id.get(key)
         if doc_info is not None:
             if doc_info.entity is None:
-                doc_info.entity = self.entity_to_json.convert_to_entity(entity_type, key, document, not no_tracking)
+                doc_info.entity = self.entity_to_json.convert_to_entity(
+                    entity_type, key, document, not no_tracking, not snapshot
+                )
+                if snapshot:
+                    doc_info.take_document_snapshot()
 
             if not no_tracking:
                 self._included_documents_by_id.pop(key, None)
@@ -790,7 +802,11 @@ class InMemoryDocumentSessionOperations:
         doc_info = self._included_documents_by_id.get(key)
         if doc_info:
             if doc_info.entity is None:
-                doc_info.entity = self.entity_to_json.convert_to_entity(entity_type, key, document, not no_tracking)
+                doc_info.entity = self.entity_to_json.convert_to_entity(
+                    entity_type, key, document, not no_tracking, not snapshot
+                )
+                if snapshot:
+                    doc_info.take_document_snapshot()
 
             if not no_tracking:
                 self._included_documents_by_id.pop(key, None)
@@ -799,7 +815,7 @@ class InMemoryDocumentSessionOperations:
 
             return doc_info.entity
 
-        entity = self.entity_to_json.convert_to_entity(entity_type, key, document, not no_tracking)
+        entity = self.entity_to_json.convert_to_entity(entity_type, key, document, not no_tracking, not snapshot)
 
         change_vector = metadata.get(constants.Documents.Metadata.CHANGE_VECTOR)
         if change_vector is None:
@@ -809,6 +825,8 @@ class InMemoryDocumentSessionOperations:
             new_document_info = DocumentInfo(
                 key=key, document=document, metadata=metadata, entity=entity, change_vector=change_vector
             )
+            if snapshot:
+                new_document_info.take_document_snapshot()
             self._documents_by_id[new_document_info.key] = new_document_info
             self._documents_by_entity[new_document_info.entity] = new_document_info
 
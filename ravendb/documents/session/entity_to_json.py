@@ -12,6 +12,7 @@ from ravendb.documents.session.event_args import (
 )
 from ravendb.exceptions import exceptions
 from ravendb.exceptions.exceptions import InvalidOperationException
+from ravendb.tools.entity_serializers import EntityDeserializer
 from ravendb.tools.utils import Utils, _DynamicStructure
 from ravendb.documents.conventions import DocumentConventions
 
@@ -23,6 +24,8 @@ if TYPE_CHECKING:
 
 _T = TypeVar("_T")
 
+_IMMUTABLE_JSON_TYPES = frozenset((str, int, float, bool, type(None)))
+
 
 class EntityToJson:
     def __init__(self, session: "InMemoryDocumentSessionOperations"):
@@ -74,9 +77,11 @@ class EntityToJson:
         return json_node
 
     # todo: refactor this method, make it more useful/simple and less ugly (like this return...[0])
-    def convert_to_entity(self, entity_type: Type[_T], key: str, document: dict, track_entity: bool) -> _T:
+    def convert_to_entity(
+        self, entity_type: Type[_T], key: str, document: dict, track_entity: bool, copy_document: bool = True
+    ) -> _T:
         conventions = self._session.conventions
-        return self.convert_to_entity_static(document, entity_type, conventions, self._session)
+        return self.convert_to_entity_static(document, entity_type, conventions, self._session, copy_document)
 
     @staticmethod
     def populate_entity_static(entity, document: dict) -> None:
@@ -119,7 +124,8 @@ class EntityToJson:
         if document_info.metadata and len(document_info.metadata) > 0:
             set_metadata = True
             for name, value in document_info.metadata.items():
-                metadata_node.update({name: deepcopy(value)})
+                # metadata values are mostly strings, only containers need to be copied
+                metadata_node[name] = value if type(value) in _IMMUTABLE_JSON_TYPES else deepcopy(value)
         elif document_info.metadata_instance:
             set_metadata = True
             for key, value in document_info.metadata_instance.items():
@@ -173,13 +179,15 @@ class EntityToJson:
         object_type: [_T],
         conventions: "DocumentConventions",
         session_hook: Optional["InMemoryDocumentSessionOperations"] = None,
+        copy_document: bool = True,
     ) -> _T:
         # This method has two steps - extract the type (I), and then convert it into the entity (II)
         # todo: Separate it into two different functions and isolate the return statements from the first part
 
         # I. Extract the object type
         metadata = document.get("@metadata")
-        document_deepcopy = deepcopy(document)
+        # without the copy the entity shares nested containers with the document, the caller has to snapshot it
+        document_deepcopy = deepcopy(document) if copy_document else document
 
         # 1. Get type from metadata
         type_from_metadata = conventions.try_get_type_from_metadata(metadata)
@@ -241,14 +249,14 @@ class EntityToJson:
 
         # By projection
         elif is_projection:
-            entity = _DynamicStructure(**document_deepcopy)
-            entity.__class__ = object_type
             try:
-                entity = Utils.initialize_object(document_deepcopy, object_type)
+                entity = EntityDeserializer.for_type(object_type).deserialize(document_deepcopy)
             except TypeError as e:
                 raise InvalidOperationException("Probably projection error", e)
 
         # Happy path - successful extraction of the type from metadata, if not - got object_type passed to arguments
+        elif object_type is not None:
+            entity = EntityDeserializer.for_type(object_type, True).deserialize(document_deepcopy)
         else:
             entity = Utils.convert_json_dict_to_object(document_deepcopy, object_type)
 
@@ -30,6 +30,23 @@ class TransactionMode(Enum):
         return self.value
 
 
+class ChangeTrackingMode(Enum):
+    """
+    How the session remembers the original state of loaded documents to detect changes on save_changes.
+
+    DEEP_COPY - entities are built from a deep copy of each loaded document, the original is kept as-is.
+    SNAPSHOT - entities are built directly from the loaded document and only its serialized form is kept.
+               The original document is parsed back from it when save_changes or what_changed compares it with
+               the entity, skipping the deep copy on load.
+    """
+
+    DEEP_COPY = "deep_copy"
+    SNAPSHOT = "snapshot"
+
+    def __str__(self):
+        return self.value
+
+
 class ForceRevisionStrategy(Enum):
     NONE = "None"
     BEFORE = "Before"
@@ -105,6 +122,7 @@ class SessionOptions:
         request_executor: Optional[RequestExecutor] = None,
         transaction_mode: Optional[TransactionMode] = None,
         disable_atomic_document_writes_in_cluster_wide_transaction: Optional[bool] = None,
+        change_tracking_mode: Optional[ChangeTrackingMode] = None,
     ):
         self.database = database
         self.no_tracking = no_tracking
@@ -114,6 +132,23 @@ class SessionOptions:
         self.disable_atomic_document_writes_in_cluster_wide_transaction = (
             disable_atomic_document_writes_in_cluster_wide_transaction
         )
+        self.change_tracking_mode = change_tracking_mode
+
+
+class StreamQueryStatistics:
+    def __init__(
+        self,
+        index_name: Optional[str] = None,
+        is_stale: Optional[bool] = None,
+        index_timestamp: Optional[datetime.datetime] = None,
+        total_results: Optional[int] = None,
+        result_etag: Optional[int] = None,
+    ):
+        self.index_name = index_name
+        self.is_stale = is_stale
+        self.index_timestamp = index_timestamp
+        self.total_results = total_results
+        self.result_etag = result_etag
 
 
 class DocumentQueryCustomization:
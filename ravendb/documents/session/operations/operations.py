@@ -3,14 +3,18 @@ from __future__ import annotations
 import json
 import logging
 from datetime import datetime
-from typing import Union, List, Type, TypeVar, Optional, Dict, Any, TYPE_CHECKING
+from typing import Union, List, Type, TypeVar, Optional, Dict, Any, Iterator, TYPE_CHECKING
 
+import ijson
 import requests
+from ijson.common import ObjectBuilder
 
 from ravendb.http.server_node import ServerNode
 from ravendb.documents.commands.multi_get import GetRequest, MultiGetCommand
+from ravendb.documents.commands.stream import StreamResultResponse, StreamCommand, QueryStreamCommand
 from ravendb.documents.commands.revisions import GetRevisionsCommand
 from ravendb.documents.session.document_info import DocumentInfo
+from ravendb.documents.session.misc import StreamQueryStatistics
 
 from ravendb.primitives import constants
 from ravendb.tools.utils import Utils, CaseInsensitiveDict
@@ -19,6 +23,7 @@ from ravendb.http.raven_command import RavenCommand
 from ravendb.documents.commands.crud import GetDocumentsCommand
 
 if TYPE_CHECKING:
+    from ravendb.documents.queries.index_query import IndexQuery
     from ravendb.json.result import JsonArrayResult
     from ravendb.documents.session.document_session_operations.in_memory_document_session_operations import (
         InMemoryDocumentSessionOperations,
@@ -348,3 +353,103 @@ class GetRevisionsCountOperation:
 
         def is_read_request(self) -> bool:
             return True
+
+
+class StreamOperation:
+    _STATS_FIELDS = {"ResultEtag", "IsStale", "IndexName", "TotalResults", "IndexTimestamp"}
+
+    def __init__(self, session: InMemoryDocumentSessionOperations, statistics: Optional[StreamQueryStatistics] = None):
+        self._session = session
+        self._statistics = statistics
+        self._is_query_stream = False
+
+    def create_request(self, index_query: IndexQuery) -> QueryStreamCommand:
+        self._is_query_stream = True
+
+        if index_query.wait_for_non_stale_results:
+            raise RuntimeError(
+                "Since stream() does not wait for indexing (by design), "
+                "streaming query with wait_for_non_stale_results is not supported"
+            )
+
+        self._session.increment_requests_count()
+        return QueryStreamCommand(self._session.conventions, index_query)
+
+    def create_request_starting_with(
+        self,
+        starts_with: Optional[str],
+        matches: Optional[str] = None,
+        start: int = 0,
+        page_size: int = constants.int_max,
+        exclude: Optional[str] = None,
+        start_after: Optional[str] = None,
+    ) -> StreamCommand:
+        path = ["streams/docs?"]
+        if starts_with is not None:
+            path.append(f"startsWith={Utils.quote_key(starts_with)}&")
+        if matches is not None:
+            path.append(f"matches={Utils.quote_key(matches)}&")
+        if exclude is not None:
+            path.append(f"exclude={Utils.quote_key(exclude)}&")
+        if start_after is not None:
+            path.append(f"startAfter={Utils.quote_key(start_after)}&")
+        if start:
+            path.append(f"start={start}&")
+        if page_size is not None and page_size != constants.int_max:
+            path.append(f"pageSize={page_size}&")
+
+        self._session.increment_requests_count()
+        return StreamCommand("".join(path))
+
+    def set_result(self, response: Optional[StreamResultResponse]) -> Iterator[Dict[str, Any]]:
+        if response is None or response.stream is None:
+            raise RuntimeError("The index does not exists, failed to stream results")
+
+        events = ijson.parse(response.stream, use_float=True)
+        try:
+            # read everything up to the results array eagerly, so statistics are available right away
+            for prefix, event, value in events:
+                if prefix == "Results" and event == "start_array":
+                    break
+                if self._is_query_stream and prefix in self._STATS_FIELDS:
+                    self.__handle_stream_query_stat(prefix, value)
+            else:
+                raise RuntimeError("Expected 'Results' array in stream response")
+        except BaseException:
+            response.close()
+            raise
+
+        return self.__yield_results(response, events)
+
+    def __handle_stream_query_stat(self, field: str, value: Any) -> None:
+        if self._statistics is None:
+            return
+
+        if field == "ResultEtag":
+            self._statistics.result_etag = value
+        elif field == "IsStale":
+            self._statistics.is_stale = value
+        elif field == "IndexName":
+            self._statistics.index_name = value
+        elif field == "TotalResults":
+            self._statistics.total_results = value
+        elif field == "IndexTimestamp":
+            self._statistics.index_timestamp = Utils.string_to_datetime(value) if value else None
+
+    @staticmethod
+    def __yield_results(response: StreamResultResponse, events: Iterator) -> Iterator[Dict[str, Any]]:
+        try:
+            for prefix, event, value in events:
+                if prefix == "Results" and event == "end_array":
+                    return
+
+                # each document is materialized on its own, the rest of the stream stays on the wire
+                builder = ObjectBuilder()
+                builder.event(event, value)
+                for prefix, event, value in events:
+                    builder.event(event, value)
+                    if prefix == "Results.item" and event == "end_map":
+                        break
+                yield builder.value
+        finally:
+            response.close()
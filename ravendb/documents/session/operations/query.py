@@ -11,6 +11,7 @@ from ravendb.documents.queries.query import QueryResult
 from ravendb.documents.session.event_args import BeforeConversionToEntityEventArgs, AfterConversionToEntityEventArgs
 from ravendb.documents.session.tokens.query_tokens.definitions import FieldsToFetchToken
 from ravendb.exceptions.documents.indexes import IndexDoesNotExistException
+from ravendb.tools.entity_serializers import EntityDeserializer
 from ravendb.tools.utils import Stopwatch, Utils
 
 if TYPE_CHECKING:
@@ -205,7 +206,7 @@ class QueryOperation:
         if "from_json" in object_type.__dict__ and inspect.ismethod(object_type.from_json):
             result = object_type.from_json(document)
         else:
-            result = Utils.initialize_object(document, object_type)
+            result = EntityDeserializer.for_type(object_type).deserialize(document)
         session.after_conversion_to_entity_invoke(AfterConversionToEntityEventArgs(session, key, document, result))
 
         return result
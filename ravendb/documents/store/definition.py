@@ -4,10 +4,12 @@ import datetime
 import uuid
 from abc import abstractmethod
 from concurrent.futures import ThreadPoolExecutor
-from typing import Callable, Union, Optional, TypeVar, List, Dict, TYPE_CHECKING
+from typing import Callable, Union, Optional, TypeVar, List, Dict, Type, TYPE_CHECKING
 
 from ravendb.changes.database_changes import DatabaseChanges
-from ravendb.documents.bulk_insert_operation import BulkInsertOperation, BulkInsertOptions
+from ravendb.changes.dispatch import ChangesOverflowPolicy
+from ravendb.documents.bulk_insert_operation import BulkInsertOperation, BulkInsertOptions, ParallelBulkInsertOperation
+from ravendb.documents.commands.multi_get import MultiGetBatcher
 from ravendb.documents.indexes.index_creation import IndexCreation
 from ravendb.documents.operations.executor import MaintenanceOperationExecutor, OperationExecutor
 from ravendb.documents.operations.indexes import PutIndexesOperation
@@ -27,6 +29,8 @@ from ravendb.documents.session.event_args import (
     FailedRequestEventArgs,
 )
 from ravendb.documents.store.lazy import Lazy
+from ravendb.documents.store.misc import AggressiveCacheScope, EvictItemsFromCacheBasedOnChanges
+from ravendb.documents.session.async_document_session import AsyncDocumentSession
 from ravendb.documents.session.document_session import DocumentSession
 from ravendb.documents.session.document_session_operations.in_memory_document_session_operations import (
     InMemoryDocumentSessionOperations,
@@ -34,6 +38,8 @@ from ravendb.documents.session.document_session_operations.in_memory_document_se
 from ravendb.documents.session.misc import SessionOptions
 from ravendb.documents.subscriptions.document_subscriptions import DocumentSubscriptions
 from ravendb.documents.time_series import TimeSeriesOperations
+from ravendb.http.async_request_executor import AsyncRequestExecutor
+from ravendb.http.misc import AggressiveCacheMode, AggressiveCacheOptions
 from ravendb.http.request_executor import RequestExecutor
 from ravendb.documents.identity.hilo import MultiDatabaseHiLoGenerator
 from ravendb.http.topology import Topology
@@ -167,7 +173,21 @@ class DocumentStoreBase:
     def operations(self) -> OperationExecutor:
         pass
 
-    # todo: aggressive_caching
+    @abstractmethod
+    def aggressively_cache_for(
+        self,
+        cache_duration: datetime.timedelta,
+        mode: AggressiveCacheMode = AggressiveCacheMode.TRACK_CHANGES,
+        database: Optional[str] = None,
+    ) -> AggressiveCacheScope:
+        pass
+
+    def aggressively_cache(self, database: Optional[str] = None) -> AggressiveCacheScope:
+        return self.aggressively_cache_for(datetime.timedelta(days=1), database=database)
+
+    @abstractmethod
+    def disable_aggressive_caching(self, database: Optional[str] = None) -> AggressiveCacheScope:
+        pass
 
     # todo: time_series
 
@@ -306,14 +326,17 @@ class DocumentStoreBase:
 
 
 class DocumentStore(DocumentStoreBase):
+    _request_executor_type: Type[RequestExecutor] = RequestExecutor
+
     def __init__(self, urls: Union[str, List[str]] = None, database: Optional[str] = None):
         super(DocumentStore, self).__init__()
         self.__subscriptions = DocumentSubscriptions(self)
         self.__thread_pool_executor = ThreadPoolExecutor()
         self.urls = [urls] if isinstance(urls, str) else urls
         self.database = database
-        self.__request_executors: Dict[str, Lazy[RequestExecutor]] = CaseInsensitiveDict()
-        # todo: aggressive cache
+        self._request_executors: Dict[str, Lazy[RequestExecutor]] = CaseInsensitiveDict()
+        self.__aggressive_cache_changes: Dict[str, Lazy[EvictItemsFromCacheBasedOnChanges]] = CaseInsensitiveDict()
+        self.__aggressive_cache_changes_lock = threading.Lock()
         self.__maintenance_operation_executor: Optional[MaintenanceOperationExecutor] = None
         self.__operation_executor: Optional[OperationExecutor] = None
         # todo: database smuggler
@@ -324,6 +347,7 @@ class DocumentStore(DocumentStoreBase):
         self.__after_close: List[Callable[[], None]] = []
         self.__before_close: List[Callable[[], None]] = []
         self.__time_series_operation: Optional[TimeSeriesOperations] = None
+        self.__multi_get_batcher: Optional[MultiGetBatcher] = None
 
     def __enter__(self):
         return self
@@ -339,6 +363,13 @@ class DocumentStore(DocumentStoreBase):
     def thread_pool_executor(self) -> ThreadPoolExecutor:
         return self.__thread_pool_executor
 
+    @property
+    def multi_get_batcher(self) -> Optional[MultiGetBatcher]:
+        """
+        Shared by the sessions of this store when conventions.lazy_operations_coalescing_window is set.
+        """
+        return self.__multi_get_batcher
+
     @property
     def subscriptions(self) -> DocumentSubscriptions:
         return self.__subscriptions
@@ -378,7 +409,10 @@ class DocumentStore(DocumentStoreBase):
         for event in self.__before_close:
             event()
 
-        # todo: evict items from cache based on changes
+        for evict_items_from_cache_based_on_changes in self.__aggressive_cache_changes.values():
+            if evict_items_from_cache_based_on_changes.is_value_created:
+                evict_items_from_cache_based_on_changes.value.close()
+        self.__aggressive_cache_changes.clear()
 
         while len(self.__database_changes) > 0:
             self.__database_changes.popitem()[1].close()
@@ -395,7 +429,7 @@ class DocumentStore(DocumentStoreBase):
         for event in self.__after_close:
             event()
 
-        for key, lazy in self.__request_executors.items():
+        for key, lazy in self._request_executors.items():
             if not lazy.is_value_created:
                 continue
 
@@ -428,13 +462,13 @@ class DocumentStore(DocumentStoreBase):
 
         database = self.get_effective_database(database)
 
-        executor = self.__request_executors.get(database, None)
+        executor = self._request_executors.get(database, None)
         if executor:
             return executor.value
         effective_database = database
 
         def __create_request_executor() -> RequestExecutor:
-            request_executor = RequestExecutor.create(
+            request_executor = self._request_executor_type.create(
                 self.urls,
                 effective_database,
                 self.conventions,
@@ -446,7 +480,7 @@ class DocumentStore(DocumentStoreBase):
             return request_executor
 
         def __create_request_executor_for_single_node() -> RequestExecutor:
-            for_single_node = RequestExecutor.create_for_single_node_with_configuration_updates(
+            for_single_node = self._request_executor_type.create_for_single_node_with_configuration_updates(
                 self.urls[0],
                 effective_database,
                 self.conventions,
@@ -464,7 +498,7 @@ class DocumentStore(DocumentStoreBase):
             else Lazy(__create_request_executor_for_single_node)
         )
 
-        self.__request_executors[database] = executor
+        self._request_executors[database] = executor
 
         return executor.value
 
@@ -478,7 +512,20 @@ class DocumentStore(DocumentStoreBase):
 
         self.maintenance.for_database(self.get_effective_database(database)).send(PutIndexesOperation(*indexes_to_add))
 
-    def changes(self, database=None, on_error=None, executor=None) -> DatabaseChanges:  # todo: sync with java
+    def changes(
+        self,
+        database=None,
+        on_error=None,
+        executor=None,
+        max_queued_changes: int = 1024,
+        overflow_policy: ChangesOverflowPolicy = ChangesOverflowPolicy.BLOCK,
+    ) -> DatabaseChanges:  # todo: sync with java
+        """
+        The subscribers of the changes are called by the thread_pool_executor of the store. Every observable queues up
+        to max_queued_changes not yet delivered changes, when the subscribers fall behind overflow_policy tells whether
+        to wait for them (stopping the changes of all observables) or which changes to drop.
+        The arguments are used by the first call for the database only.
+        """
         self.assert_initialized()
         if not database:
             database = self.database
@@ -490,6 +537,9 @@ class DocumentStore(DocumentStoreBase):
                     on_close=self.__on_close_change,
                     on_error=on_error,
                     executor=executor,
+                    dispatch_executor=self.thread_pool_executor,
+                    max_queued_changes=max_queued_changes,
+                    overflow_policy=overflow_policy,
                 )
             return self.__database_changes[database]
 
@@ -524,14 +574,68 @@ class DocumentStore(DocumentStoreBase):
 
             self.conventions.document_id_generator = generator.generate_document_id
 
+        if self.conventions.lazy_operations_coalescing_window:
+            self.__multi_get_batcher = MultiGetBatcher(self.conventions.lazy_operations_coalescing_window)
+
         self.conventions.freeze()
         self._initialized = True
         return self
 
-    # todo: aggressively cache
+    def aggressively_cache_for(
+        self,
+        cache_duration: datetime.timedelta,
+        mode: AggressiveCacheMode = AggressiveCacheMode.TRACK_CHANGES,
+        database: Optional[str] = None,
+    ) -> AggressiveCacheScope:
+        """
+        Serve cached responses of the current thread without contacting the server, as long as they
+        are younger than cache_duration. With TRACK_CHANGES the cache is invalidated by the changes api.
+        Use as a context manager, or call close() on the result to restore the previous behavior.
+        """
+        self.assert_initialized()
+
+        database = database or self.database
+        if database is None:
+            raise RuntimeError(
+                "Cannot use aggressively_cache and aggressively_cache_for without a default database defined "
+                "unless 'database' parameter is provided. Did you forget to pass 'database' parameter?"
+            )
 
-    def bulk_insert(self, database_name: str = None, options: BulkInsertOptions = None) -> BulkInsertOperation:
+        if mode != AggressiveCacheMode.DO_NOT_TRACK_CHANGES:
+            self.__listen_to_changes_and_update_the_cache(database)
+
+        request_executor = self.get_request_executor(database)
+        old_options = request_executor.aggressive_caching
+        request_executor.aggressive_caching = AggressiveCacheOptions(cache_duration, mode)
+        return AggressiveCacheScope(request_executor, old_options)
+
+    def disable_aggressive_caching(self, database: Optional[str] = None) -> AggressiveCacheScope:
         self.assert_initialized()
+
+        request_executor = self.get_request_executor(self.get_effective_database(database))
+        old_options = request_executor.aggressive_caching
+        request_executor.aggressive_caching = None
+        return AggressiveCacheScope(request_executor, old_options)
+
+    def __listen_to_changes_and_update_the_cache(self, database: str) -> None:
+        with self.__aggressive_cache_changes_lock:
+            lazy = self.__aggressive_cache_changes.get(database)
+            if lazy is None:
+                lazy = Lazy(lambda: EvictItemsFromCacheBasedOnChanges(self, database))
+                self.__aggressive_cache_changes[database] = lazy
+
+        lazy.value  # force evaluation
+
+    def bulk_insert(
+        self, database_name: str = None, options: BulkInsertOptions = None, parallelism: int = None
+    ) -> Union[BulkInsertOperation, ParallelBulkInsertOperation]:
+        """
+        :param parallelism: number of bulk insert streams the documents are spread over,
+                            see ParallelBulkInsertOperation
+        """
+        self.assert_initialized()
+        if parallelism is not None:
+            return ParallelBulkInsertOperation(self.get_effective_database(database_name), self, options, parallelism)
         return BulkInsertOperation(self.get_effective_database(database_name), self, options)
 
     def _assert_valid_configuration(self) -> None:
@@ -560,3 +664,24 @@ class DocumentStore(DocumentStoreBase):
             self.__time_series_operation = TimeSeriesOperations(self)
 
         return self.__time_series_operation
+
+
+class AsyncDocumentStore(DocumentStore):
+    _request_executor_type: Type[RequestExecutor] = AsyncRequestExecutor
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close_async()
+
+    async def close_async(self) -> None:
+        request_executors = [lazy.value for lazy in self._request_executors.values() if lazy.is_value_created]
+        self.close()
+        for request_executor in request_executors:
+            await request_executor.close_async()
+
+    def open_async_session(
+        self, database: Optional[str] = None, session_options: Optional[SessionOptions] = None
+    ) -> AsyncDocumentSession:
+        return AsyncDocumentSession(self.open_session(database, session_options))
@@ -1,9 +1,16 @@
 from __future__ import annotations
 import threading
-from typing import Generic, Callable, Any, Union, TypeVar
+from typing import Generic, Callable, Any, Union, TypeVar, Optional, TYPE_CHECKING
 
+from ravendb.changes.observers import ActionObserver
+from ravendb.changes.types import DatabaseChange, IndexChange, IndexChangeTypes
 from ravendb.documents.commands.batches import CommandType
 
+if TYPE_CHECKING:
+    from ravendb.documents.store.definition import DocumentStore
+    from ravendb.http.misc import AggressiveCacheOptions
+    from ravendb.http.request_executor import RequestExecutor
+
 _T = TypeVar("_T")
 
 
@@ -29,3 +36,63 @@ class IdTypeAndName:
     @classmethod
     def create(cls, key: str, command_type: CommandType, name: Union[None, str]) -> IdTypeAndName:
         return cls(key, command_type, name)
+
+
+class AggressiveCacheScope:
+    """
+    Returned by DocumentStore.aggressively_cache_for, restores the previous aggressive caching
+    options of the request executor when closed.
+    """
+
+    def __init__(self, request_executor: RequestExecutor, old_options: Optional[AggressiveCacheOptions]):
+        self.__request_executor = request_executor
+        self.__old_options = old_options
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self) -> None:
+        self.__request_executor.aggressive_caching = self.__old_options
+
+
+class EvictItemsFromCacheBasedOnChanges:
+    """
+    Invalidates aggressively cached responses of a database by bumping the http cache generation
+    whenever the changes api reports a document or index change, or fails.
+    """
+
+    def __init__(self, store: DocumentStore, database_name: str):
+        self.__database_name = database_name
+        self.__changes = store.changes(database_name)
+        self.__request_executor = store.get_request_executor(database_name)
+
+        observer = ActionObserver(on_next=self.__on_next, on_error=self.__on_error)
+
+        documents_observable = self.__changes.for_all_documents()
+        self.__documents_subscription = documents_observable.subscribe_with_observer(observer)
+
+        indexes_observable = self.__changes.for_all_indexes()
+        self.__indexes_subscription = indexes_observable.subscribe_with_observer(observer)
+
+        documents_observable.ensure_subscribe_now()
+        indexes_observable.ensure_subscribe_now()
+
+    def __on_next(self, change: DatabaseChange) -> None:
+        if isinstance(change, IndexChange) and change.type_of_change not in (
+            IndexChangeTypes.BATCH_COMPLETED,
+            IndexChangeTypes.INDEX_REMOVED,
+        ):
+            return
+
+        self.__request_executor.cache.generation += 1
+
+    def __on_error(self, exception: Exception) -> None:
+        # we may have missed notifications while the connection was down
+        self.__request_executor.cache.generation += 1
+
+    def close(self) -> None:
+        self.__documents_subscription()
+        self.__indexes_subscription()
@@ -1,5 +1,5 @@
 import os
-from typing import Optional, Type, TypeVar, Dict, List, TYPE_CHECKING
+from typing import Optional, Type, TypeVar, Dict, List, Union, TYPE_CHECKING
 
 from ravendb.documents.operations.ongoing_tasks import ToggleOngoingTaskStateOperation, OngoingTaskType
 from ravendb.documents.session.tokens.query_tokens.definitions import CounterIncludesToken, TimeSeriesIncludesToken
@@ -18,10 +18,12 @@ from ravendb.documents.subscriptions.options import (
     SubscriptionCreationOptions,
     SubscriptionWorkerOptions,
     SubscriptionUpdateOptions,
+    SubscriptionOpeningStrategy,
 )
 from ravendb.documents.subscriptions.revision import Revision
 from ravendb.documents.subscriptions.state import SubscriptionState
 from ravendb.documents.subscriptions.worker import SubscriptionWorker
+from ravendb.documents.subscriptions.worker_pool import SubscriptionWorkerPool
 from ravendb.extensions.string_extensions import escape_string
 
 _T = TypeVar("_T")
@@ -177,6 +179,29 @@ class DocumentSubscriptions:
     ) -> SubscriptionWorker[_T]:
         return self.get_subscription_worker(SubscriptionWorkerOptions(subscription_name), object_type, database)
 
+    def get_subscription_worker_pool(
+        self,
+        options_or_name: Union[str, SubscriptionWorkerOptions],
+        size: int,
+        object_type: Optional[Type[_T]] = None,
+        database: Optional[str] = None,
+    ) -> SubscriptionWorkerPool[_T]:
+        """
+        Creates a pool of size workers processing the same subscription concurrently.
+        Given only the name of the subscription, the workers are opened with the CONCURRENT strategy.
+        """
+        self._store.assert_initialized()
+        if options_or_name is None:
+            raise RuntimeError("Cannot open a subscription if options are None")
+
+        if isinstance(options_or_name, str):
+            options = SubscriptionWorkerOptions(options_or_name)
+            options.strategy = SubscriptionOpeningStrategy.CONCURRENT
+        else:
+            options = options_or_name
+
+        return SubscriptionWorkerPool(self, options, size, object_type, database)
+
     def get_subscription_worker_for_revisions(
         self, options: SubscriptionWorkerOptions, object_type: Optional[Type[_T]] = None, database: Optional[str] = None
     ) -> SubscriptionWorker[Revision[_T]]:
@@ -215,7 +240,7 @@ class DocumentSubscriptions:
         if not self._subscriptions:
             return
 
-        for subscription in self._subscriptions:
+        for subscription in list(self._subscriptions):
             subscription.close()
 
     def drop_connection(self, name: str, database: Optional[str] = None) -> None:
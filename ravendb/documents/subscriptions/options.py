@@ -1,6 +1,7 @@
+from concurrent.futures import Executor
 from datetime import timedelta
 from enum import Enum
-from typing import Callable, Optional, Dict
+from typing import Callable, Optional, Dict, Any, Hashable
 
 from ravendb.documents.session.loaders.include import SubscriptionIncludeBuilder
 from ravendb.tools.utils import Utils
@@ -10,6 +11,7 @@ class SubscriptionOpeningStrategy(Enum):
     OPEN_IF_FREE = "OpenIfFree"
     TAKE_OVER = "TakeOver"
     WAIT_FOR_FREE = "WaitForFree"
+    CONCURRENT = "Concurrent"
 
 
 class SubscriptionCreationOptions:
@@ -49,7 +51,19 @@ class SubscriptionWorkerOptions:
         send_buffer_size: int = 32 * 1024,
         ignore_subscriber_errors: Optional[bool] = None,
         close_when_no_docs_left: Optional[bool] = None,
+        items_executor: Optional[Executor] = None,
+        items_partition_key: Optional[Callable[[Any], Hashable]] = None,
+        worker_id: Optional[str] = None,
     ):
+        """
+        items_executor and items_partition_key are client side only, used by SubscriptionWorker.run_for_each_item:
+        the items of a batch are processed concurrently by the executor (a thread or a process pool) and the batch is
+        acknowledged once all of them are processed. Items with the same partition key are processed one after
+        another, in the order of the batch.
+
+        worker_id tells the workers of a CONCURRENT subscription apart. A server that doesn't support concurrent
+        subscriptions rejects the CONCURRENT strategy when the worker connects.
+        """
         if not subscription_name or subscription_name.isspace():
             raise ValueError("Subscription name cannot be None or empty")
         self.subscription_name = subscription_name
@@ -61,6 +75,9 @@ class SubscriptionWorkerOptions:
         self.send_buffer_size = send_buffer_size
         self.ignore_subscriber_errors = ignore_subscriber_errors
         self.close_when_no_docs_left = close_when_no_docs_left
+        self.items_executor = items_executor
+        self.items_partition_key = items_partition_key
+        self.worker_id = worker_id
 
     def to_json(self) -> Dict:
         return {
@@ -73,6 +90,7 @@ class SubscriptionWorkerOptions:
             "SendBufferSize": self.send_buffer_size,
             "IgnoreSubscriberErrors": self.ignore_subscriber_errors,
             "CloseWhenNoDocsLeft": self.close_when_no_docs_left,
+            "WorkerId": self.worker_id,
         }
 
 
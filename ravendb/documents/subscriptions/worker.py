@@ -8,9 +8,8 @@ import os
 import time
 from concurrent.futures import Future
 from enum import Enum
-from json import JSONDecoder, JSONDecodeError
 from socket import socket
-from typing import TypeVar, Generic, Type, Optional, Callable, Dict, List, TYPE_CHECKING, Any
+from typing import TypeVar, Generic, Type, Optional, Callable, Dict, List, TYPE_CHECKING, Any, Hashable
 
 from ravendb.primitives import constants
 from ravendb.documents.session.entity_to_json import EntityToJson
@@ -53,6 +52,7 @@ from ravendb.serverwide.tcp import (
     TcpConnectionStatus,
 )
 from ravendb.tools.generate_id import GenerateEntityIdOnTheClient
+from ravendb.tools.parsers import JsonMessageReader
 from ravendb.http.server_node import ServerNode
 from ravendb.util.tcp_utils import TcpUtils
 
@@ -170,6 +170,8 @@ class SubscriptionWorker(Generic[_T]):
 
         self._store = document_store
         self._db_name = self._store.get_effective_database(db_name)
+        # runs the subscription, reads the batches and calls the subscriber - up to 3 threads at once
+        self._executor: concurrent.futures.Executor = self._store.thread_pool_executor
         self._logger = logging.getLogger(SubscriptionWorker.__class__.__name__)
 
         self.after_acknowledgment = []
@@ -186,6 +188,8 @@ class SubscriptionWorker(Generic[_T]):
         self._after_acknowledgment: List[Callable[[SubscriptionBatch[_T]], None]] = []
         self._on_subscription_connection_retry: List[Callable[[Exception], None]] = []
         self._on_unexpected_subscription_error: List[Callable[[Exception], None]] = []
+        self._on_batch_processed: List[Callable[[SubscriptionBatchMetrics], None]] = []
+        self._last_batch_metrics: Optional[SubscriptionBatchMetrics] = None
 
         self._redirect_node: Optional[ServerNode] = None
         self._subscription_local_request_executor: Optional[RequestExecutor] = None
@@ -194,8 +198,7 @@ class SubscriptionWorker(Generic[_T]):
         self._last_connection_failure: Optional[datetime.datetime] = None
         self._supported_features: Optional[TcpConnectionHeaderMessage.SupportedFeatures] = None
 
-        self._json_decoder = JSONDecoder()
-        self._buffer = ""
+        self._reader: Optional[JsonMessageReader] = None
 
     def __enter__(self):
         return self
@@ -233,6 +236,21 @@ class SubscriptionWorker(Generic[_T]):
         for event in self._on_unexpected_subscription_error:
             event(err)
 
+    def add_on_batch_processed(self, handler: Callable[[SubscriptionBatchMetrics], None]) -> None:
+        self._on_batch_processed.append(handler)
+
+    def remove_on_batch_processed(self, handler: Callable[[SubscriptionBatchMetrics], None]) -> None:
+        self._on_batch_processed.remove(handler)
+
+    def invoke_on_batch_processed(self, metrics: SubscriptionBatchMetrics) -> None:
+        self._last_batch_metrics = metrics
+        for event in self._on_batch_processed:
+            event(metrics)
+
+    @property
+    def last_batch_metrics(self) -> Optional[SubscriptionBatchMetrics]:
+        return self._last_batch_metrics
+
     def close(self, wait_for_subscription_task: bool = True) -> None:
         if self._disposed:
             return
@@ -266,6 +284,41 @@ class SubscriptionWorker(Generic[_T]):
         self._subscriber = process_documents
         return self._run()
 
+    def run_for_each_item(self, process_item: Callable[[SubscriptionBatch.Item[_T]], Any]) -> Future[None]:
+        """
+        Calls process_item for every item of every batch. With SubscriptionWorkerOptions.items_executor the items are
+        processed concurrently, optionally partitioned by SubscriptionWorkerOptions.items_partition_key.
+        With a process pool both process_item and the items (with their entities) have to be picklable.
+        """
+        if process_item is None:
+            raise ValueError("process_item cannot be None")
+
+        self._subscriber = lambda batch: self._process_items(batch, process_item)
+        return self._run()
+
+    def _process_items(
+        self, batch: SubscriptionBatch[_T], process_item: Callable[[SubscriptionBatch.Item[_T]], Any]
+    ) -> None:
+        executor = self._options.items_executor
+        if executor is None:
+            for item in batch.items:
+                process_item(item)
+            return
+
+        partition_key = self._options.items_partition_key
+        if partition_key is None:
+            futures = [executor.submit(process_item, item) for item in batch.items]
+        else:
+            partitions: Dict[Hashable, List[SubscriptionBatch.Item[_T]]] = {}
+            for item in batch.items:
+                partitions.setdefault(partition_key(item), []).append(item)
+            futures = [executor.submit(_process_in_order, process_item, items) for items in partitions.values()]
+
+        # the batch is acknowledged only when all of its items were processed, even if some of them failed
+        concurrent.futures.wait(futures)
+        for future in futures:
+            future.result()
+
     def _run(self) -> Future[None]:
         if self._subscription_task is not None:
             raise RuntimeError("The subscription is already running")
@@ -389,15 +442,14 @@ class SubscriptionWorker(Generic[_T]):
 
         return tcp_command.result
 
-    def _ensure_parser(self) -> None:
-        # python doesn't use parsers
-        pass
+    def _ensure_parser(self, sock: socket) -> None:
+        if self._reader is None or self._reader.socket is not sock:
+            self._reader = JsonMessageReader(sock, self._options.receive_buffer_size)
 
     def _read_server_response_and_get_version(self, url: str, sock: socket) -> int:
         # reading reply from server
-        self._ensure_parser()
-        response = sock.recv(self._options.receive_buffer_size)
-        reply = TcpConnectionHeaderResponse.from_json(json.loads(response.decode("utf-8")))
+        self._ensure_parser(sock)
+        reply = TcpConnectionHeaderResponse.from_json(self._reader.next_object())
 
         if reply.status == TcpConnectionStatus.OK:
             return reply.version
@@ -549,6 +601,7 @@ class SubscriptionWorker(Generic[_T]):
                 )
 
                 def __run_async():
+                    processing_started = time.perf_counter()
                     try:
                         self._subscriber(batch)
                     except Exception as ex:
@@ -564,12 +617,21 @@ class SubscriptionWorker(Generic[_T]):
                                 ex,
                             )
 
+                    processing_time = time.perf_counter() - processing_started
                     if tcp_client_copy is not None:
                         self._send_ack(last_received_change_vector, tcp_client_copy)
 
+                    self.invoke_on_batch_processed(
+                        SubscriptionBatchMetrics(
+                            batch.number_of_items_in_batch,
+                            datetime.timedelta(seconds=waiting_time),
+                            datetime.timedelta(seconds=processing_time),
+                        )
+                    )
+
                 while not self._processing_cts.get_token().is_cancellation_requested():
                     # start reading next batch from server on 1'st thread (can be before client started processing)
-                    read_from_server = self._store.thread_pool_executor.submit(
+                    read_from_server = self._executor.submit(
                         self._read_single_subscription_batch_from_server, tcp_client_copy, batch
                     )
                     try:
@@ -584,15 +646,17 @@ class SubscriptionWorker(Generic[_T]):
 
                         raise e
 
+                    waiting_started = time.perf_counter()
                     incoming_batch = read_from_server.result(
                         self._options.time_to_wait_before_connection_retry.total_seconds()
                     )
+                    waiting_time = time.perf_counter() - waiting_started
 
                     self._processing_cts.get_token().throw_if_cancellation_requested()
 
                     last_received_change_vector = batch.initialize(incoming_batch)
 
-                    notified_subscriber = self._store.thread_pool_executor.submit(__run_async)
+                    notified_subscriber = self._executor.submit(__run_async)
         except OperationCancelledException as e:
             if not self._disposed:
                 raise e
@@ -663,19 +727,8 @@ class SubscriptionWorker(Generic[_T]):
         if self._disposed:  # if we are disposed, nothing to do...
             return None
 
-        def _receive_more_data():
-            return sock.recv(self._options.receive_buffer_size).decode("utf-8").strip("\r\n")
-
-        while True:
-            if self._buffer and not self._buffer.isspace():
-                try:
-                    decoded_json, index = self._json_decoder.raw_decode(self._buffer)
-                    self._buffer = self._buffer[index:]
-                    return SubscriptionConnectionServerMessage.from_json(decoded_json)
-                except JSONDecodeError:
-                    self._buffer += _receive_more_data()
-            else:
-                self._buffer += _receive_more_data()
+        self._ensure_parser(sock)
+        return SubscriptionConnectionServerMessage.from_json(self._reader.next_object())
 
     def _send_ack(self, last_received_change_vector: str, network_stream: socket) -> None:
         msg = SubscriptionConnectionClientMessage()
@@ -740,7 +793,7 @@ class SubscriptionWorker(Generic[_T]):
                         )
                         raise ex
 
-        return self._store.thread_pool_executor.submit(__run_async)
+        return self._executor.submit(__run_async)
 
     def _assert_last_connection_failure(self) -> None:
         if self._last_connection_failure is None:
@@ -818,6 +871,30 @@ class SubscriptionWorker(Generic[_T]):
             self._tcp_client = None
 
 
+def _process_in_order(
+    process_item: Callable[[SubscriptionBatch.Item], Any], items: List[SubscriptionBatch.Item]
+) -> None:
+    for item in items:
+        process_item(item)
+
+
+class SubscriptionBatchMetrics:
+    """
+    Timings of a single batch: how long the worker waited for it after handing the previous one to the subscriber,
+    and how long it took to process it (all of its items, when they're processed concurrently).
+    """
+
+    def __init__(self, number_of_items: int, waiting_time: datetime.timedelta, processing_time: datetime.timedelta):
+        self.number_of_items = number_of_items
+        self.waiting_time = waiting_time
+        self.processing_time = processing_time
+
+    @property
+    def items_per_second(self) -> float:
+        seconds = self.processing_time.total_seconds()
+        return self.number_of_items / seconds if seconds else 0.0
+
+
 class BatchFromServer:
     def __init__(self):
         self.messages: Optional[List[SubscriptionConnectionServerMessage]] = None
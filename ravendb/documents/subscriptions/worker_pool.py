@@ -0,0 +1,221 @@
+from __future__ import annotations
+
+import copy
+import datetime
+import logging
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Generic, List, Optional, Type, TypeVar, TYPE_CHECKING
+
+from ravendb.documents.subscriptions.options import SubscriptionOpeningStrategy, SubscriptionWorkerOptions
+from ravendb.documents.subscriptions.worker import SubscriptionBatch, SubscriptionBatchMetrics, SubscriptionWorker
+from ravendb.exceptions.exceptions import (
+    AuthorizationException,
+    DatabaseDoesNotExistException,
+    SubscriptionClosedException,
+    SubscriptionDoesNotExistException,
+    SubscriptionInUseException,
+)
+
+if TYPE_CHECKING:
+    from ravendb.documents.subscriptions.document_subscriptions import DocumentSubscriptions
+
+_T = TypeVar("_T")
+
+
+class SubscriptionWorkerPoolMetrics:
+    def __init__(
+        self,
+        number_of_batches: int,
+        number_of_items: int,
+        processing_time: datetime.timedelta,
+        number_of_restarts: int,
+        elapsed: datetime.timedelta,
+    ):
+        self.number_of_batches = number_of_batches
+        self.number_of_items = number_of_items
+        self.processing_time = processing_time  # summed over the workers
+        self.number_of_restarts = number_of_restarts
+        self.elapsed = elapsed
+
+    @property
+    def items_per_second(self) -> float:
+        seconds = self.elapsed.total_seconds()
+        return self.number_of_items / seconds if seconds else 0.0
+
+
+class SubscriptionWorkerPool(Generic[_T]):
+    """
+    Runs several workers of one CONCURRENT subscription, the server spreads the batches between them.
+
+    Every worker gets its own connection and a thread of a pool owned by this object. A worker that stopped because of
+    an error (e.g. the subscriber raised) is replaced by a new one after time_to_wait_before_connection_retry; errors
+    no worker can recover from (the subscription or the database doesn't exist, not authorized...) stop the pool.
+    CPU bound processing can be moved to processes with SubscriptionWorkerOptions.items_executor.
+    """
+
+    _FATAL_ERRORS = (
+        SubscriptionDoesNotExistException,
+        DatabaseDoesNotExistException,
+        AuthorizationException,
+        SubscriptionInUseException,
+        SubscriptionClosedException,
+    )
+
+    def __init__(
+        self,
+        subscriptions: DocumentSubscriptions,
+        options: SubscriptionWorkerOptions,
+        size: int,
+        object_type: Optional[Type[_T]] = None,
+        database: Optional[str] = None,
+    ):
+        if size <= 0:
+            raise ValueError("Size of the pool must be positive")
+        if size > 1 and options.strategy != SubscriptionOpeningStrategy.CONCURRENT:
+            raise ValueError(
+                f"Only a subscription opened with the {SubscriptionOpeningStrategy.CONCURRENT.value} strategy "
+                f"can be processed by more than one worker, got {options.strategy.value}"
+            )
+
+        self._subscriptions = subscriptions
+        self._options = options
+        self._size = size
+        self._object_type = object_type
+        self._database = database
+        self._logger = logging.getLogger(SubscriptionWorkerPool.__name__)
+
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(3 * size, thread_name_prefix=f"subscription-{options.subscription_name}")
+        self._workers: List[Optional[SubscriptionWorker[_T]]] = [None] * size
+        self._start_worker: Optional[Callable[[SubscriptionWorker[_T]], Future[None]]] = None
+        self._result = Future()
+        self._closed = False
+
+        self._started: Optional[float] = None
+        self._number_of_batches = 0
+        self._number_of_items = 0
+        self._processing_time = datetime.timedelta()
+        self._number_of_restarts = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    @property
+    def workers(self) -> List[SubscriptionWorker[_T]]:
+        with self._lock:
+            return [worker for worker in self._workers if worker is not None]
+
+    @property
+    def metrics(self) -> SubscriptionWorkerPoolMetrics:
+        with self._lock:
+            return SubscriptionWorkerPoolMetrics(
+                self._number_of_batches,
+                self._number_of_items,
+                self._processing_time,
+                self._number_of_restarts,
+                datetime.timedelta(seconds=time.perf_counter() - self._started if self._started else 0),
+            )
+
+    def run(self, process_documents: Callable[[SubscriptionBatch[_T]], Any]) -> Future[None]:
+        """
+        Starts the workers, the returned future completes when the pool is closed, when all the workers finished
+        (e.g. with close_when_no_docs_left) or with the error that stopped the pool.
+        """
+        if process_documents is None:
+            raise ValueError("process_documents cannot be None")
+        return self._run(lambda worker: worker.run(process_documents))
+
+    def run_for_each_item(self, process_item: Callable[[SubscriptionBatch.Item[_T]], Any]) -> Future[None]:
+        if process_item is None:
+            raise ValueError("process_item cannot be None")
+        return self._run(lambda worker: worker.run_for_each_item(process_item))
+
+    def _run(self, start_worker: Callable[[SubscriptionWorker[_T]], Future[None]]) -> Future[None]:
+        with self._lock:
+            if self._start_worker is not None:
+                raise RuntimeError("The pool is already running")
+            self._start_worker = start_worker
+            self._started = time.perf_counter()
+
+        for index in range(self._size):
+            self._start(index)
+        return self._result
+
+    def _start(self, index: int) -> None:
+        options = copy.copy(self._options)
+        options.worker_id = f"{self._options.worker_id or self._options.subscription_name}/{index}"
+
+        with self._lock:
+            if self._closed:
+                return
+            worker = self._subscriptions.get_subscription_worker(options, self._object_type, self._database)
+            worker._executor = self._executor
+            worker.add_on_batch_processed(self._on_batch_processed)
+            self._workers[index] = worker
+
+        self._start_worker(worker).add_done_callback(lambda task: self._on_worker_stopped(index, worker, task))
+
+    def _on_batch_processed(self, metrics: SubscriptionBatchMetrics) -> None:
+        with self._lock:
+            self._number_of_batches += 1
+            self._number_of_items += metrics.number_of_items
+            self._processing_time += metrics.processing_time
+
+    def _on_worker_stopped(self, index: int, worker: SubscriptionWorker[_T], task: Future[None]) -> None:
+        error = None if task.cancelled() else task.exception()
+
+        with self._lock:
+            if self._closed or self._workers[index] is not worker:
+                return
+            if error is None or isinstance(error, self._FATAL_ERRORS):
+                self._workers[index] = None
+                stopped = error is not None or all(w is None for w in self._workers)
+            else:
+                self._number_of_restarts += 1
+                stopped = False
+
+        worker.close(False)
+
+        if error is not None and isinstance(error, self._FATAL_ERRORS):
+            self._logger.error(f"Subscription {self._options.subscription_name} worker pool stopped", exc_info=error)
+            self._stop(error)
+        elif error is not None:
+            self._logger.info(
+                f"Subscription {self._options.subscription_name} worker {index} failed and will be restarted",
+                exc_info=error,
+            )
+            timer = threading.Timer(
+                self._options.time_to_wait_before_connection_retry.total_seconds(), self._start, (index,)
+            )
+            timer.daemon = True
+            timer.start()
+        elif stopped:
+            self._stop(None)
+
+    def _stop(self, error: Optional[Exception]) -> None:
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            workers = [worker for worker in self._workers if worker is not None]
+
+        for worker in workers:
+            worker.close(False)
+
+        if error is not None:
+            self._result.set_exception(error)
+        else:
+            self._result.set_result(None)
+        self._executor.shutdown(wait=False)
+
+    def close(self) -> None:
+        self._stop(None)
@@ -1,10 +1,18 @@
 from __future__ import annotations
 import datetime
-from typing import TYPE_CHECKING, Optional, Type, TypeVar, List
+from concurrent.futures import Future
+from typing import TYPE_CHECKING, Optional, Type, TypeVar, List, Iterator, Union
 
 from ravendb.documents.conventions import DocumentConventions
-from ravendb.documents.session.time_series import TimeSeriesValuesHelper, ITimeSeriesValuesBindable
+from ravendb.documents.session.time_series import (
+    TimeSeriesValuesHelper,
+    ITimeSeriesValuesBindable,
+    TimeSeriesEntry,
+    TimeSeriesArrays,
+)
 from ravendb.documents.operations.time_series import (
+    GetTimeSeriesOperation,
+    TimeSeriesRangeResult,
     ConfigureTimeSeriesValueNamesOperation,
     TimeSeriesPolicy,
     ConfigureTimeSeriesPolicyOperation,
@@ -91,3 +99,70 @@ class TimeSeriesOperations:
             return self
 
         return TimeSeriesOperations(self._store, database)
+
+    def stream_time_series(
+        self,
+        doc_id: str,
+        name: str,
+        from_date: Optional[datetime.datetime] = None,
+        to_date: Optional[datetime.datetime] = None,
+        page_size: int = 4096,
+        as_arrays: bool = False,
+    ) -> Iterator[Union[TimeSeriesEntry, TimeSeriesArrays]]:
+        """
+        Yields the entries of the from_date..to_date range one by one, or a TimeSeriesArrays per page given as_arrays.
+        The range is read page_size entries at a time, the next page is requested while the current one is processed,
+        so at most two pages are held in memory whatever the size of the range.
+        """
+        if not doc_id or doc_id.isspace():
+            raise ValueError("DocId cannot be None or empty")
+        if not name or name.isspace():
+            raise ValueError("Timeseries cannot be None or empty")
+        if page_size <= 0:
+            raise ValueError("Page size must be positive")
+
+        return self._stream_time_series(doc_id, name, from_date, to_date, page_size, as_arrays)
+
+    def _stream_time_series(
+        self,
+        doc_id: str,
+        name: str,
+        from_date: Optional[datetime.datetime],
+        to_date: Optional[datetime.datetime],
+        page_size: int,
+        as_arrays: bool,
+    ) -> Iterator[Union[TimeSeriesEntry, TimeSeriesArrays]]:
+        request_executor = self._store.get_request_executor(self._database)
+
+        def __get_page(page_from: Optional[datetime.datetime]) -> Optional[TimeSeriesRangeResult]:
+            command = GetTimeSeriesOperation.GetTimeSeriesCommand(doc_id, name, page_from, to_date, 0, page_size, None)
+            request_executor.execute_command(command)
+            return command.result
+
+        page = __get_page(from_date)
+        next_page: Optional[Future[Optional[TimeSeriesRangeResult]]] = None
+        try:
+            while page is not None:
+                arrays = page.to_arrays() if as_arrays else None
+                entries = None if as_arrays else page.entries
+                size = len(arrays) if as_arrays else len(entries)
+
+                if size == page_size:
+                    last = arrays.timestamps[-1].astype("datetime64[us]").item() if as_arrays else entries[-1].timestamp
+                    # the server keeps the timestamps with millisecond precision, there's nothing before the next one
+                    page_from = last + datetime.timedelta(microseconds=1)
+                    if to_date is None or page_from <= to_date:
+                        next_page = self._store.thread_pool_executor.submit(__get_page, page_from)
+
+                if size > 0:
+                    if as_arrays:
+                        yield arrays
+                    else:
+                        yield from entries
+
+                if next_page is None:
+                    return
+                page, next_page = next_page.result(), None
+        finally:
+            if next_page is not None:
+                next_page.cancel()
@@ -0,0 +1,352 @@
+from __future__ import annotations
+
+import asyncio
+import datetime
+import inspect
+import ssl
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http import HTTPStatus
+from typing import TYPE_CHECKING, Optional, List, Union
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from ravendb.primitives import constants
+from ravendb.documents.session.event_args import BeforeRequestEventArgs
+from ravendb.exceptions.exceptions import DatabaseDoesNotExistException, UnsuccessfulRequestException
+from ravendb.http.raven_command import RavenCommand, RavenCommandResponseType
+from ravendb.http.request_executor import RequestExecutor
+from ravendb.http.server_node import ServerNode
+from ravendb.http.topology import UpdateTopologyParameters
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+_CONNECTION_ERRORS = (IOError, asyncio.TimeoutError) + ((aiohttp.ClientConnectionError,) if aiohttp else ())
+
+if TYPE_CHECKING:
+    from ravendb.documents.conventions import DocumentConventions
+    from ravendb.documents.session.misc import SessionInfo
+
+
+class AsyncRequestExecutor(RequestExecutor):
+    """
+    RequestExecutor that can additionally execute commands on an asyncio event loop.
+
+    Topology, node selection, the http cache and the command contracts (create_request/set_response)
+    are shared with the synchronous executor, so both APIs can be used on the same instance.
+    Requests are sent through a pooled aiohttp session, one per event loop.
+    """
+
+    def __init__(
+        self,
+        database_name: str,
+        conventions: DocumentConventions,
+        certificate_path: Optional[str] = None,
+        trust_store_path: Optional[str] = None,
+        thread_pool_executor: Optional[ThreadPoolExecutor] = None,
+        initial_urls: Optional[List[str]] = None,
+    ):
+        super().__init__(
+            database_name, conventions, certificate_path, trust_store_path, thread_pool_executor, initial_urls
+        )
+        self.__async_http_session: Optional[aiohttp.ClientSession] = None
+        self.__async_http_session_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close_async()
+
+    async def close_async(self) -> None:
+        self.close()
+        await self.__close_async_http_session()
+
+    async def __close_async_http_session(self) -> None:
+        http_session = self.__async_http_session
+        self.__async_http_session = None
+        self.__async_http_session_loop = None
+        if http_session is not None and not http_session.closed:
+            await http_session.close()
+
+    async def _get_async_http_session(self) -> aiohttp.ClientSession:
+        loop = asyncio.get_running_loop()
+        http_session = self.__async_http_session
+        if http_session is not None and not http_session.closed and self.__async_http_session_loop is loop:
+            return http_session
+
+        if http_session is not None and self.__async_http_session_loop is loop:
+            await self.__close_async_http_session()
+
+        self.__async_http_session = self.__create_async_http_session()
+        self.__async_http_session_loop = loop
+        return self.__async_http_session
+
+    def __create_async_http_session(self) -> aiohttp.ClientSession:
+        if aiohttp is None:
+            raise ImportError(
+                "AsyncRequestExecutor requires the 'aiohttp' package. Install it with 'pip install ravendb[async]'."
+            )
+
+        ssl_context: Union[None, bool, ssl.SSLContext] = None
+        if self.certificate_path is not None or self.trust_store_path is not None:
+            ssl_context = ssl.create_default_context(cafile=self.trust_store_path)
+            if self.certificate_path is not None:
+                ssl_context.load_cert_chain(self.certificate_path)
+
+        connector = aiohttp.TCPConnector(limit=self.conventions.async_http_connection_limit, ssl=ssl_context)
+        return aiohttp.ClientSession(connector=connector, auto_decompress=True)
+
+    async def execute_command_async(self, command: RavenCommand, session_info: Optional[SessionInfo] = None) -> None:
+        topology_update = self._first_topology_update_task
+        if not self._disable_topology_updates and not (
+            topology_update is not None
+            and topology_update.done()
+            and not topology_update.cancelled()
+            and not topology_update.exception()
+        ):
+            # first topology update is running on the thread pool, wait for it without blocking the loop
+            await asyncio.get_running_loop().run_in_executor(None, self._wait_for_topology_update, topology_update)
+
+        current_index_and_node = self.choose_node_for_request(command, session_info)
+        await self.execute_async(
+            current_index_and_node.current_node, current_index_and_node.current_index, command, True, session_info
+        )
+
+    async def execute_async(
+        self,
+        chosen_node: ServerNode,
+        node_index: Optional[int],
+        command: RavenCommand,
+        should_retry: bool = True,
+        session_info: Optional[SessionInfo] = None,
+    ) -> None:
+        self._update_failover_topology_etag(command)
+
+        request = self._create_request(chosen_node, command)
+        if not request:
+            return
+        url = request.url
+
+        no_caching = session_info.no_caching if session_info else False
+
+        cached_item, change_vector, cached_value = self._get_from_cache(command, not no_caching, url)
+        with cached_item:
+            if change_vector is not None and self._try_get_from_cache(command, cached_item, cached_value):
+                return
+
+            self._set_request_headers(session_info, change_vector, request)
+
+            command.number_of_attempts = command.number_of_attempts + 1
+            attempt_num = command.number_of_attempts
+            for func in self._on_before_request:
+                func(BeforeRequestEventArgs(self._database_name, url, request, attempt_num))
+
+            self.number_of_server_requests += 1
+            try:
+                response = await self._send_async(chosen_node, command, request)
+            except _CONNECTION_ERRORS as e:
+                if not should_retry:
+                    raise
+
+                command.failed_nodes[chosen_node] = e
+                if not await self._handle_server_down_async(chosen_node, node_index, command, session_info):
+                    self._throw_failed_to_contact_all_nodes(command, request)
+                return
+
+            refresh_tasks = self._refresh_if_needed(chosen_node, response)
+
+            command.status_code = response.status_code
+            try:
+                if response.status_code == HTTPStatus.NOT_MODIFIED:
+                    self._on_succeed_request_invoke(
+                        self._database_name, url, response, request, attempt_num, command, chosen_node, node_index
+                    )
+                    cached_item.not_modified()
+                    if command.response_type == RavenCommandResponseType.OBJECT:
+                        command.set_response(cached_value, True)
+                    return
+
+                if response.status_code >= 400:
+                    if not await self._handle_unsuccessful_response_async(
+                        chosen_node, node_index, command, request, response, url, session_info, should_retry
+                    ):
+                        db_missing_header = response.headers.get("Database-Missing", None)
+                        if db_missing_header is not None:
+                            raise DatabaseDoesNotExistException(db_missing_header)
+                        self._throw_failed_to_contact_all_nodes(command, request)
+                    return
+
+                self._on_succeed_request_invoke(
+                    self._database_name, url, response, request, attempt_num, command, chosen_node, node_index
+                )
+                command.process_response(self._cache, response, url)
+                self._last_returned_response = datetime.datetime.utcnow()
+            finally:
+                response.close()
+                for task in refresh_tasks:
+                    await asyncio.wrap_future(task)
+
+    async def _send_async(
+        self, chosen_node: ServerNode, command: RavenCommand, request: requests.Request
+    ) -> requests.Response:
+        if self.__requires_blocking_send(command, request):
+            # custom transports, multipart uploads and streamed bodies stay on the blocking path
+            response = await asyncio.get_running_loop().run_in_executor(
+                self._thread_pool_executor, command.send, self.http_session, request
+            )
+        else:
+            response = await self.__send_with_async_http_session(command, request)
+
+        if chosen_node.should_update_server_version():
+            server_version = response.headers.get(constants.Headers.SERVER_VERSION)
+            if server_version is not None:
+                chosen_node.update_server_version(server_version)
+
+        self._last_server_version = chosen_node.last_server_version
+        return response
+
+    @staticmethod
+    def __requires_blocking_send(command: RavenCommand, request: requests.Request) -> bool:
+        return (
+            type(command).send is not RavenCommand.send
+            or bool(request.files)
+            or inspect.isgenerator(request.data)
+            or hasattr(request.data, "read")
+        )
+
+    async def __send_with_async_http_session(
+        self, command: RavenCommand, request: requests.Request
+    ) -> requests.Response:
+        http_session = await self._get_async_http_session()
+        timeout = command.timeout if command.timeout else self.default_timeout
+        client_timeout = (
+            aiohttp.ClientTimeout(total=timeout.total_seconds())
+            if timeout and timeout > datetime.timedelta(0)
+            else aiohttp.ClientTimeout(total=None)
+        )
+
+        start = time.perf_counter()
+        async with http_session.request(
+            request.method, request.url, data=request.data, headers=request.headers, timeout=client_timeout
+        ) as async_response:
+            content = await async_response.read()
+            response = self.__to_response(async_response, content)
+            response.elapsed = datetime.timedelta(seconds=time.perf_counter() - start)
+            return response
+
+    @staticmethod
+    def __to_response(async_response: aiohttp.ClientResponse, content: bytes) -> requests.Response:
+        # materialize the body into a requests.Response so commands can keep using the same
+        # process_response / set_response / set_response_raw contracts as the synchronous executor
+        response = requests.Response()
+        response.status_code = async_response.status
+        response.reason = async_response.reason
+        response.url = str(async_response.url)
+        response.headers = CaseInsensitiveDict(async_response.headers)
+        response.encoding = async_response.charset
+        response._content = content
+        response._content_consumed = True
+        return response
+
+    async def _handle_unsuccessful_response_async(
+        self,
+        chosen_node: ServerNode,
+        node_index: Optional[int],
+        command: RavenCommand,
+        request: requests.Request,
+        response: requests.Response,
+        url: str,
+        session_info: Optional[SessionInfo],
+        should_retry: bool,
+    ) -> bool:
+        if response.status_code == HTTPStatus.GONE:
+            # request not relevant for the chosen node - the database has been moved to a different one
+            if not should_retry:
+                return False
+
+            if node_index is not None:
+                self._node_selector.on_failed_request(node_index)
+
+            command.failed_nodes[chosen_node] = UnsuccessfulRequestException(
+                f"Request to {request.url} ({request.method}) is not relevant for this node anymore."
+            )
+
+            index_and_node = self.choose_node_for_request(command, session_info)
+            if index_and_node.current_node in command.failed_nodes:
+                update_parameters = UpdateTopologyParameters(chosen_node)
+                update_parameters.timeout_in_ms = 60000
+                update_parameters.force_update = True
+                update_parameters.debug_tag = "handle-unsuccessful-response"
+                success = await asyncio.wrap_future(self.update_topology_async(update_parameters))
+                if not success:
+                    return False
+
+                command.failed_nodes.clear()
+                index_and_node = self.choose_node_for_request(command, session_info)
+                await self.execute_async(
+                    index_and_node.current_node, index_and_node.current_index, command, False, session_info
+                )
+                return True
+
+            await self.execute_async(
+                index_and_node.current_node, index_and_node.current_index, command, True, session_info
+            )
+            return True
+
+        if response.status_code == 425:  # too early
+            if not should_retry:
+                return False
+
+            if node_index is not None:
+                self._node_selector.on_failed_request(node_index)
+
+            if not command.is_failed_with_node(chosen_node):
+                command.failed_nodes[chosen_node] = UnsuccessfulRequestException(
+                    f"Request to '{request.url}' ({request.method}) is processing and not yet available on that node."
+                )
+
+            next_node = self.choose_node_for_request(command, session_info)
+            await self.execute_async(next_node.current_node, next_node.current_index, command, True, session_info)
+
+            if node_index is not None:
+                self._node_selector.restore_node_index(node_index)
+
+            return True
+
+        # remaining statuses don't retry over the network, so the synchronous handling can be reused as-is
+        return self._handle_unsuccessful_response(
+            chosen_node, node_index, command, request, response, url, session_info, should_retry
+        )
+
+    async def _handle_server_down_async(
+        self,
+        chosen_node: ServerNode,
+        node_index: Optional[int],
+        command: RavenCommand,
+        session_info: Optional[SessionInfo],
+    ) -> bool:
+        if node_index is None or self._node_selector is None:
+            # We executed request over a node not in the topology. This means no failover...
+            return False
+
+        # As the server is down, we discard the server version to ensure we update when it goes up.
+        chosen_node.discard_server_version()
+        self._node_selector.on_failed_request(node_index)
+
+        index_node_and_etag = self._node_selector.get_preferred_node_with_topology()
+        if command.failover_topology_etag != self.topology_etag:
+            command.failed_nodes.clear()
+            command.failover_topology_etag = self.topology_etag
+
+        if index_node_and_etag.current_node in command.failed_nodes:
+            return False
+
+        await self.execute_async(
+            index_node_and_etag.current_node, index_node_and_etag.current_index, command, True, session_info
+        )
+        return True
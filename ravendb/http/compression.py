@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import zlib
+from enum import Enum
+from typing import Iterable, Iterator, Union
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+try:
+    from urllib3.util.request import ACCEPT_ENCODING as _URLLIB3_ACCEPT_ENCODING
+except ImportError:
+    _URLLIB3_ACCEPT_ENCODING = "gzip,deflate"
+
+
+class HttpCompressionAlgorithm(Enum):
+    GZIP = "gzip"
+    ZSTD = "zstd"
+
+    def __str__(self):
+        return self.value
+
+
+class HttpCompression:
+    """
+    Compresses request bodies, either at once or chunk by chunk for streamed bodies.
+
+    Both algorithms use their fast levels - bodies are compressed on the request path, so the cpu spent on them
+    has to stay well below the time saved on the wire.
+    """
+
+    # smaller bodies don't gain enough to be worth the cpu time and the extra header
+    MIN_SIZE_TO_COMPRESS = 1024
+
+    GZIP_LEVEL = 1
+    ZSTD_LEVEL = 3
+
+    # encodings the http session can decode on its own, zstd/br are included when their packages are installed
+    ACCEPT_ENCODING = ", ".join(encoding.strip() for encoding in _URLLIB3_ACCEPT_ENCODING.split(","))
+
+    @staticmethod
+    def assert_supported(algorithm: HttpCompressionAlgorithm) -> None:
+        if algorithm == HttpCompressionAlgorithm.ZSTD and zstandard is None:
+            raise ImportError(
+                "Zstd http compression requires the 'zstandard' package. Install it with 'pip install ravendb[zstd]'."
+            )
+
+    @staticmethod
+    def compress(data: Union[str, bytes, bytearray], algorithm: HttpCompressionAlgorithm) -> bytes:
+        if isinstance(data, str):
+            data = data.encode("utf-8")
+
+        if algorithm == HttpCompressionAlgorithm.GZIP:
+            compressor = zlib.compressobj(HttpCompression.GZIP_LEVEL, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+            return compressor.compress(data) + compressor.flush()
+
+        HttpCompression.assert_supported(algorithm)
+        return zstandard.ZstdCompressor(level=HttpCompression.ZSTD_LEVEL).compress(data)
+
+    @staticmethod
+    def compress_stream(chunks: Iterable[bytes], algorithm: HttpCompressionAlgorithm) -> Iterator[bytes]:
+        if algorithm == HttpCompressionAlgorithm.GZIP:
+            compressor = zlib.compressobj(HttpCompression.GZIP_LEVEL, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+            return HttpCompression.__compress_chunks(chunks, compressor, zlib.Z_SYNC_FLUSH, zlib.Z_FINISH)
+
+        HttpCompression.assert_supported(algorithm)
+        compressor = zstandard.ZstdCompressor(level=HttpCompression.ZSTD_LEVEL).compressobj()
+        return HttpCompression.__compress_chunks(
+            chunks, compressor, zstandard.COMPRESSOBJ_FLUSH_BLOCK, zstandard.COMPRESSOBJ_FLUSH_FINISH
+        )
+
+    @staticmethod
+    def __compress_chunks(chunks: Iterable[bytes], compressor, flush_mode: int, finish_mode: int) -> Iterator[bytes]:
+        for chunk in chunks:
+            if not chunk:
+                continue
+            # flush every chunk, the server should be able to process what was produced so far
+            # instead of waiting for the compressor to fill up its window
+            compressed = compressor.compress(chunk) + compressor.flush(flush_mode)
+            if compressed:
+                yield compressed
+
+        yield compressor.flush(finish_mode)
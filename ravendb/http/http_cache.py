@@ -1,4 +1,7 @@
 import datetime
+import sys
+import threading
+from collections import OrderedDict
 from enum import Enum
 from typing import Union, Optional, Dict, Set
 
@@ -15,7 +18,7 @@ class ItemFlags(Enum):
 class HttpCacheItem:
     def __init__(self):
         self.change_vector: Union[None, str] = None
-        self.payload: Union[None, str] = None
+        self.payload: Union[None, str, bytes] = None
         self.last_server_update: datetime.datetime = datetime.datetime.now()
         self.flags: Set[ItemFlags] = {ItemFlags.NONE}
         self.generation: Union[None, int] = None
@@ -55,11 +58,24 @@ class ReleaseCacheItem:
 
 class HttpCache:
     NOT_FOUND_RESPONSE = "404 Response"
-
-    def __init__(self):
-        self.__items: Dict[str, HttpCacheItem] = {}
+    DEFAULT_MAX_SIZE = 128 * 1024 * 1024
+
+    def __init__(self, max_size: int = DEFAULT_MAX_SIZE):
+        if max_size is None or max_size < 0:
+            raise ValueError("Max size must be a non negative number")
+
+        # kept in least recently used order, the first item is the next one to evict
+        self.__items: "OrderedDict[str, HttpCacheItem]" = OrderedDict()
+        self.__sizes: Dict[str, int] = {}
+        self.__lock = threading.Lock()
+        self.__max_size = max_size
+        self.__current_size = 0
         self.generation = 0
 
+        self.__hits = 0
+        self.__misses = 0
+        self.__evictions = 0
+
     def __enter__(self):
         return self
 
@@ -67,37 +83,77 @@ class HttpCache:
         self.close()
 
     def __len__(self):
-        return len(self.__items)
+        return len(self.__items) if self.__items is not None else 0
 
     def __setitem__(self, key, value):
-        self.__items.__setitem__(key, value)
+        with self.__lock:
+            self.__put(key, value)
 
     def __getitem__(self, item):
-        self.__items.__getitem__(item)
+        with self.__lock:
+            return self.__items.__getitem__(item)
+
+    @property
+    def max_size(self) -> int:
+        return self.__max_size
+
+    @property
+    def current_size(self) -> int:
+        return self.__current_size
+
+    @property
+    def number_of_items(self) -> int:
+        return len(self)
+
+    @property
+    def hits(self) -> int:
+        return self.__hits
+
+    @property
+    def misses(self) -> int:
+        return self.__misses
+
+    @property
+    def evictions(self) -> int:
+        return self.__evictions
 
     def close(self):
-        self.__items.clear()
-        self.__items = None
+        with self.__lock:
+            if self.__items is None:
+                return
+            self.__items.clear()
+            self.__sizes.clear()
+            self.__current_size = 0
+            self.__items = None
 
     def clear(self) -> None:
-        self.__items.clear()
-
-    def set(self, url: str, change_vector: str, result: str) -> None:
+        with self.__lock:
+            if self.__items is None:
+                return
+            self.__items.clear()
+            self.__sizes.clear()
+            self.__current_size = 0
+
+    def set(self, url: str, change_vector: str, result: Union[str, bytes]) -> None:
         http_cache_item = HttpCacheItem()
         http_cache_item.change_vector = change_vector
         http_cache_item.payload = result
         http_cache_item.cache = self
         http_cache_item.generation = self.generation
-        self.__items[url] = http_cache_item
+        with self.__lock:
+            self.__put(url, http_cache_item)
+
+    def get(self, url: str) -> (ReleaseCacheItem, str, Union[str, bytes]):
+        with self.__lock:
+            item = self.__items.get(url, None) if self.__items else None
+            if item is None:
+                self.__misses += 1
+                return ReleaseCacheItem(), None, None
 
-    def get(self, url: str) -> (ReleaseCacheItem, str, str):
-        item = self.__items.get(url, None) if self.__items else None
-        if item is not None:
-            change_vector = item.change_vector
-            response = item.payload
-            return ReleaseCacheItem(item), change_vector, response
+            self.__items.move_to_end(url)
+            self.__hits += 1
 
-        return ReleaseCacheItem(), None, None
+        return ReleaseCacheItem(item), item.change_vector, item.payload
 
     def set_not_found(self, url: str, aggressively_cached: bool) -> None:
         http_cache_item = HttpCacheItem()
@@ -107,7 +163,43 @@ class HttpCache:
         http_cache_item.flags = (
             {ItemFlags.AGGRESSIVELY_CACHED, ItemFlags.NOT_FOUND} if aggressively_cached else {ItemFlags.NOT_FOUND}
         )
-        self.__items[url] = http_cache_item
+        with self.__lock:
+            self.__put(url, http_cache_item)
+
+    @staticmethod
+    def _size_of(url: str, item: HttpCacheItem) -> int:
+        # sys.getsizeof is O(1) for str and bytes and reflects the real memory held by the entry
+        size = sys.getsizeof(url)
+        if item.payload is not None:
+            size += sys.getsizeof(item.payload)
+        if item.change_vector is not None:
+            size += sys.getsizeof(item.change_vector)
+        return size
+
+    def __put(self, url: str, item: HttpCacheItem) -> None:
+        # must be called while holding the lock
+        if self.__items is None:
+            return
+
+        self.__remove(url)
+
+        size = self._size_of(url, item)
+        if size > self.__max_size:
+            # would evict everything else and still not fit
+            return
+
+        self.__items[url] = item
+        self.__sizes[url] = size
+        self.__current_size += size
+
+        while self.__current_size > self.__max_size:
+            oldest_url = next(iter(self.__items))
+            self.__remove(oldest_url)
+            self.__evictions += 1
+
+    def __remove(self, url: str) -> None:
+        if self.__items.pop(url, None) is not None:
+            self.__current_size -= self.__sizes.pop(url)
 
     class ReleaseCacheItem:
         def __init__(self, item: HttpCacheItem = None):
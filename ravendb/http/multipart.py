@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import uuid
+from typing import BinaryIO, Iterable, Iterator, List, Optional, Tuple, Union
+
+# bytes, a binary file-like object (read(size)) or an iterable of bytes chunks
+StreamSource = Union[bytes, bytearray, memoryview, BinaryIO, Iterable[bytes]]
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+
+def is_in_memory(stream: StreamSource) -> bool:
+    return isinstance(stream, (bytes, bytearray, memoryview))
+
+
+def iter_chunks(stream: StreamSource, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[bytes]:
+    """
+    Yields the content of the stream in chunks, reading a file-like object chunk_size bytes at a time
+    """
+    if is_in_memory(stream):
+        yield bytes(stream)
+    elif hasattr(stream, "read"):
+        while True:
+            chunk = stream.read(chunk_size)
+            if not chunk:
+                return
+            yield chunk
+    else:
+        for chunk in stream:
+            if chunk:
+                yield bytes(chunk)
+
+
+class ReplayableStream:
+    """
+    Gives the attachment stream to each attempt of a request. A seekable file is rewound to the position it had when
+    the command was created, bytes are simply sent again. Iterators and non seekable files are read once - a retry
+    would send them empty or truncated, so it raises instead.
+    """
+
+    def __init__(self, stream: StreamSource):
+        self._stream = stream
+        self._position = None if is_in_memory(stream) else self._tell(stream)
+        self._sent = False
+
+    @staticmethod
+    def _tell(stream: StreamSource) -> Optional[int]:
+        if not hasattr(stream, "seek") or not hasattr(stream, "tell"):
+            return None
+        seekable = getattr(stream, "seekable", None)
+        if seekable is not None and not seekable():
+            return None
+        try:
+            return stream.tell()
+        except OSError:
+            return None
+
+    @property
+    def stream(self) -> StreamSource:
+        return self._stream
+
+    def open(self) -> StreamSource:
+        if is_in_memory(self._stream):
+            return self._stream
+        if self._position is not None:
+            self._stream.seek(self._position)
+            return self._stream
+        if self._sent:
+            raise RuntimeError(
+                "The attachment stream was already consumed by a previous attempt of the request and can't be "
+                "rewound. Use bytes or a seekable file to let the request be retried."
+            )
+        self._sent = True
+        return self._stream
+
+
+class MultipartFormStream:
+    """
+    multipart/form-data body produced part by part while it's being sent - unlike requests' files, which reads the
+    files into one body first. Sent with chunked transfer encoding, as the length isn't known up front.
+    """
+
+    def __init__(self, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        self._boundary = uuid.uuid4().hex
+        self._chunk_size = chunk_size
+        self._parts: List[Tuple[bytes, StreamSource]] = []
+
+    @property
+    def content_type(self) -> str:
+        return f"multipart/form-data; boundary={self._boundary}"
+
+    def add_part(
+        self,
+        name: str,
+        stream: StreamSource,
+        content_type: Optional[str] = None,
+        headers: Optional[dict] = None,
+    ) -> None:
+        part_headers = [f'Content-Disposition: form-data; name="{name}"; filename="{name}"']
+        if content_type:
+            part_headers.append(f"Content-Type: {content_type}")
+        if headers:
+            part_headers.extend(f"{key}: {value}" for key, value in headers.items())
+
+        head = f"--{self._boundary}\r\n" + "\r\n".join(part_headers) + "\r\n\r\n"
+        self._parts.append((head.encode("utf-8"), stream))
+
+    def __iter__(self) -> Iterator[bytes]:
+        for head, stream in self._parts:
+            yield head
+            yield from iter_chunks(stream, self._chunk_size)
+            yield b"\r\n"
+        yield f"--{self._boundary}--\r\n".encode("utf-8")
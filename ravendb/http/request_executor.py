@@ -7,7 +7,7 @@ import logging
 import os
 from concurrent.futures import ThreadPoolExecutor, Future, FIRST_COMPLETED, wait, ALL_COMPLETED
 import uuid
-from threading import Timer, Semaphore, Lock
+from threading import Timer, Semaphore, Lock, local
 
 import requests
 from copy import copy
@@ -26,11 +26,25 @@ from ravendb.exceptions.exception_dispatcher import ExceptionDispatcher
 from ravendb.exceptions.raven_exceptions import ClientVersionMismatchException
 
 
-from ravendb.http.http_cache import HttpCache
-from ravendb.http.misc import ReadBalanceBehavior, ResponseDisposeHandling, LoadBalanceBehavior, Broadcast
+from ravendb.http.compression import HttpCompression
+from ravendb.http.http_cache import HttpCache, ItemFlags, ReleaseCacheItem
+from ravendb.http.misc import (
+    ReadBalanceBehavior,
+    ResponseDisposeHandling,
+    LoadBalanceBehavior,
+    Broadcast,
+    AggressiveCacheOptions,
+)
 from ravendb.http.raven_command import RavenCommand, RavenCommandResponseType
 from ravendb.http.server_node import ServerNode
-from ravendb.http.topology import Topology, NodeStatus, NodeSelector, CurrentIndexAndNode, UpdateTopologyParameters
+from ravendb.http.topology import (
+    Topology,
+    NodeStatus,
+    NodeSelector,
+    CurrentIndexAndNode,
+    UpdateTopologyParameters,
+    NodeLatency,
+)
 from ravendb.serverwide.commands import GetDatabaseTopologyCommand, GetClusterTopologyCommand
 
 from http import HTTPStatus
@@ -64,7 +78,8 @@ class RequestExecutor:
         self.conventions = copy(conventions)
         self._node_selector: NodeSelector = None
         self.__default_timeout: datetime.timedelta = conventions.request_timeout
-        self._cache: HttpCache = HttpCache()
+        self._cache: HttpCache = HttpCache(conventions.max_http_cache_size)
+        self.__aggressive_caching = local()
 
         self.__certificate_path = certificate_path
         self.__trust_store_path = trust_store_path
@@ -173,12 +188,30 @@ class RequestExecutor:
         session = requests.session()
         session.cert = self.__certificate_path
         session.verify = self.__trust_store_path if self.__trust_store_path else True
+        session.headers["Accept-Encoding"] = HttpCompression.ACCEPT_ENCODING
         return session
 
     @property
     def cache(self) -> HttpCache:
         return self._cache
 
+    @property
+    def node_latencies(self) -> List[NodeLatency]:
+        """
+        Moving average of the read response times of every node in the topology,
+        the same numbers ReadBalanceBehavior.FASTEST_NODE routes reads by.
+        """
+        return self._node_selector.get_node_latencies() if self._node_selector else []
+
+    @property
+    def aggressive_caching(self) -> Optional[AggressiveCacheOptions]:
+        # scoped to the calling thread, like the aggressively_cache_for() block that set it
+        return getattr(self.__aggressive_caching, "value", None)
+
+    @aggressive_caching.setter
+    def aggressive_caching(self, value: Optional[AggressiveCacheOptions]) -> None:
+        self.__aggressive_caching.value = value
+
     @property
     def topology_nodes(self) -> List[ServerNode]:
         return self.topology.nodes if self.topology else None
@@ -224,8 +257,20 @@ class RequestExecutor:
             event(FailedRequestEventArgs(self._database_name, url, e, request, response))
 
     def _on_succeed_request_invoke(
-        self, database: str, url: str, response: requests.Response, request: requests.Request, attempt_number: int
+        self,
+        database: str,
+        url: str,
+        response: requests.Response,
+        request: requests.Request,
+        attempt_number: int,
+        command: Optional[RavenCommand] = None,
+        chosen_node: Optional[ServerNode] = None,
+        node_index: Optional[int] = None,
     ):
+        # writes always go to the preferred node, only reads tell how fast the nodes are for read balancing
+        if node_index is not None and self._node_selector is not None and command and self._is_read_request(command):
+            self._node_selector.record_response_time(node_index, chosen_node, response.elapsed)
+
         for event in self.__on_succeed_request:
             event(SucceedRequestEventArgs(database, url, response, request, attempt_number))
 
@@ -489,19 +534,15 @@ class RequestExecutor:
         session_info: SessionInfo = None,
         ret_request: bool = False,
     ) -> Union[None, requests.Request]:
-        if command.failover_topology_etag == RequestExecutor.__INITIAL_TOPOLOGY_ETAG:
-            command.failover_topology_etag = RequestExecutor.__INITIAL_TOPOLOGY_ETAG
-            if self._node_selector and self._node_selector.topology:
-                topology = self._node_selector.topology
-                if topology.etag:
-                    command.failover_topology_etag = topology.etag
+        self._update_failover_topology_etag(command)
 
-        request = self.__create_request(chosen_node, command)
-        url = request.url
+        request = self._create_request(chosen_node, command)
 
         if not request:
             return
 
+        url = request.url
+
         if ret_request:
             request_ref = request
 
@@ -511,9 +552,10 @@ class RequestExecutor:
         no_caching = session_info.no_caching if session_info else False
 
         cached_item, change_vector, cached_value = self._get_from_cache(command, not no_caching, url)
-        # todo: if change_vector exists try get from cache - aggressive caching
         with cached_item:
-            # todo: try get from cache
+            if change_vector is not None and self._try_get_from_cache(command, cached_item, cached_value):
+                return
+
             self._set_request_headers(session_info, change_vector, request)
 
             command.number_of_attempts = command.number_of_attempts + 1
@@ -534,7 +576,9 @@ class RequestExecutor:
 
             try:
                 if response.status_code == HTTPStatus.NOT_MODIFIED:
-                    self._on_succeed_request_invoke(self._database_name, url, response, request, attempt_num)
+                    self._on_succeed_request_invoke(
+                        self._database_name, url, response, request, attempt_num, command, chosen_node, node_index
+                    )
                     cached_item.not_modified()
                     if command.response_type == RavenCommandResponseType.OBJECT:
                         command.set_response(cached_value, True)
@@ -556,7 +600,9 @@ class RequestExecutor:
                             raise DatabaseDoesNotExistException(db_missing_header)
                         self._throw_failed_to_contact_all_nodes(command, request)
                     return  # we either handled this already in the unsuccessful response or we are throwing
-                self._on_succeed_request_invoke(self._database_name, url, response, request, attempt_num)
+                self._on_succeed_request_invoke(
+                    self._database_name, url, response, request, attempt_num, command, chosen_node, node_index
+                )
                 response_dispose = command.process_response(self._cache, response, url)
                 self._last_returned_response = datetime.datetime.utcnow()
             finally:
@@ -568,6 +614,14 @@ class RequestExecutor:
                     except:
                         raise
 
+    def _update_failover_topology_etag(self, command: RavenCommand) -> None:
+        if command.failover_topology_etag == RequestExecutor.__INITIAL_TOPOLOGY_ETAG:
+            command.failover_topology_etag = RequestExecutor.__INITIAL_TOPOLOGY_ETAG
+            if self._node_selector and self._node_selector.topology:
+                topology = self._node_selector.topology
+                if topology.etag:
+                    command.failover_topology_etag = topology.etag
+
     def _refresh_if_needed(self, chosen_node: ServerNode, response: requests.Response) -> List[Future]:
         refresh_topology = response.headers.get(constants.Headers.REFRESH_TOPOLOGY, False)
         refresh_client_configuration = response.headers.get(constants.Headers.REFRESH_CLIENT_CONFIGURATION, False)
@@ -680,7 +734,7 @@ class RequestExecutor:
             if session_info is not None and session_info.can_use_load_balance_behavior:
                 return self._node_selector.get_node_by_session_id(session_info.session_id)
 
-        if not cmd.is_read_request:
+        if not self._is_read_request(cmd):
             return self._node_selector.get_preferred_node()
 
         if self.conventions.read_balance_behavior == ReadBalanceBehavior.NONE:
@@ -694,14 +748,14 @@ class RequestExecutor:
     def __unlikely_execute(
         self, command: RavenCommand, topology_update: Union[None, Future[None]], session_info: SessionInfo
     ) -> None:
-        self.__wait_for_topology_update(topology_update)
+        self._wait_for_topology_update(topology_update)
 
         current_index_and_node = self.choose_node_for_request(command, session_info)
         self.execute(
             current_index_and_node.current_node, current_index_and_node.current_index, command, True, session_info
         )
 
-    def __wait_for_topology_update(self, topology_update: Future[None]) -> None:
+    def _wait_for_topology_update(self, topology_update: Future[None]) -> None:
         try:
             if topology_update is None or topology_update.exception():
                 with self.__synchronized_lock:
@@ -779,6 +833,25 @@ class RequestExecutor:
 
         return HttpCache.ReleaseCacheItem(), None, None
 
+    def _try_get_from_cache(self, command: RavenCommand, cached_item: ReleaseCacheItem, cached_value: str) -> bool:
+        aggressive_cache_options = self.aggressive_caching
+        if (
+            aggressive_cache_options is not None
+            and cached_item.age < aggressive_cache_options.duration
+            and not cached_item.might_have_been_modified
+            and command.can_cache_aggressively
+        ):
+            if ItemFlags.NOT_FOUND in cached_item.item.flags:
+                # a cached 404 is only served when it was itself stored under aggressive caching
+                if ItemFlags.AGGRESSIVELY_CACHED in cached_item.item.flags:
+                    command.set_response(None, True)
+                    return True
+            else:
+                command.set_response(cached_value, True)
+                return True
+
+        return False
+
     @staticmethod
     def __try_get_server_version(response: requests.Response) -> Union[None, str]:
         server_version_header = response.headers.get(constants.Headers.SERVER_VERSION)
@@ -828,13 +901,19 @@ class RequestExecutor:
 
         raise AllTopologyNodesDownException(message)
 
+    @staticmethod
+    def _is_read_request(command: RavenCommand) -> bool:
+        # some commands expose is_read_request as a property
+        is_read_request = command.is_read_request
+        return is_read_request() if callable(is_read_request) else is_read_request
+
     def should_execute_on_all(self, chosen_node: ServerNode, command: RavenCommand) -> bool:
         return (
             self.conventions.read_balance_behavior == ReadBalanceBehavior.FASTEST_NODE
             and self._node_selector
             and self._node_selector.in_speed_test_phase
             and len(self._node_selector.topology.nodes) > 1
-            and command.is_read_request()
+            and self._is_read_request(command)
             and command.response_type == RavenCommandResponseType.OBJECT
             and chosen_node is not None
             and not isinstance(command, Broadcast)
@@ -843,64 +922,94 @@ class RequestExecutor:
     def __execute_on_all_to_figure_out_the_fastest(
         self, chosen_node: ServerNode, command: RavenCommand
     ) -> requests.Response:
-        number_failed_tasks = [0]  # mutable integer
-        preferred_task: Future[RequestExecutor.IndexAndResponse] = None
+        preferred_task: Optional[Future[RequestExecutor.IndexAndResponse]] = None
 
         nodes = self._node_selector.topology.nodes
-        tasks: List[Future[RequestExecutor.IndexAndResponse]] = [None] * len(nodes)
+        tasks: List[Future[RequestExecutor.IndexAndResponse]] = []
+
+        def __send_to_node(index: int) -> RequestExecutor.IndexAndResponse:
+            request = self._create_request(nodes[index], command)
+            self._set_request_headers(None, None, request)
+            response = command.send(self.http_session, request)
+            if nodes[index] is not chosen_node:
+                # the chosen node's response is recorded once it's processed as the command response
+                self._node_selector.record_response_time(index, nodes[index], response.elapsed)
+            return self.IndexAndResponse(index, response)
 
         for i in range(len(nodes)):
-            task_number = i
             self.number_of_server_requests += 1
 
-            def __supply_async(
-                single_element_list_number_failed_tasks: List[int],
-            ) -> (RequestExecutor.IndexAndResponse, int):
-                try:
-                    request, str_ref = self.__create_request(nodes[task_number], command)
-                    self._set_request_headers(None, None, request)
-                    return self.IndexAndResponse(task_number, command.send(self.http_session, request))
-                except Exception as e:
-                    single_element_list_number_failed_tasks[0] += 1
-                    tasks[task_number] = None
-                    raise RuntimeError("Request execution failed", e)
-
-            task = self._thread_pool_executor.submit(__supply_async, number_failed_tasks)
+            task = self._thread_pool_executor.submit(__send_to_node, i)
 
             if nodes[i].cluster_tag == chosen_node.cluster_tag:
                 preferred_task = task
             else:
-                task.add_done_callback(lambda result: result.response.close())
+                task.add_done_callback(RequestExecutor.__close_speed_test_response)
 
-            tasks[i] = task
+            tasks.append(task)
 
-        while number_failed_tasks[0] < len(tasks):
-            try:
-                first_finished, slow = wait(list(filter(lambda t: t is not None, tasks)), return_when=FIRST_COMPLETED)
-                fastest = first_finished.pop().result()
-                fastest: RequestExecutor.IndexAndResponse
+        pending = set(tasks)
+        while pending:
+            finished, pending = wait(pending, return_when=FIRST_COMPLETED)
+            succeeded = [task for task in finished if task.exception() is None]
+            if succeeded:
+                fastest = succeeded[0].result()
                 self._node_selector.record_fastest(fastest.index, nodes[fastest.index])
                 break
-            except BaseException:
-                for i in range(len(nodes)):
-                    if tasks[i].exception() is not None:
-                        number_failed_tasks[0] += 1
-                        tasks[i] = None
 
         # we can reach here if number of failed task equal to the number of the nodes,
         # in which case we have nothing to do
 
         return preferred_task.result().response
 
-    def __create_request(self, node: ServerNode, command: RavenCommand) -> Optional[requests.Request]:
+    @staticmethod
+    def __close_speed_test_response(task: Future[RequestExecutor.IndexAndResponse]) -> None:
+        if task.exception() is None:
+            task.result().response.close()
+
+    def _create_request(self, node: ServerNode, command: RavenCommand) -> Optional[requests.Request]:
         request = command.create_request(node)
+        if request is None:
+            return None
+
+        command.json_codec = self.conventions.json_codec
+
         # todo: optimize that if - look for the way to make less ifs each time
-        if request.data and not isinstance(request.data, str) and not inspect.isgenerator(request.data):
-            request.data = json.dumps(request.data, default=self.conventions.json_default_method)
+        if (
+            request.data
+            and not isinstance(request.data, (str, bytes, bytearray))
+            and not inspect.isgenerator(request.data)
+            and not hasattr(request.data, "read")
+        ):
+            request.data = self.conventions.json_codec.dumps(request.data, self.conventions.json_default_method)
+
+        if request.data and self.conventions.should_compress_request(command):
+            self.__compress_request(request)
 
         # todo: 1117 - 1133
         return request or None
 
+    def __compress_request(self, request: requests.Request) -> None:
+        # attachments (multipart bodies) are sent as they are
+        if (
+            request.files
+            or constants.Headers.CONTENT_ENCODING in request.headers
+            or request.headers.get("Content-Type", "").startswith("multipart/")
+        ):
+            return
+
+        algorithm = self.conventions.http_compression_algorithm
+        if isinstance(request.data, (str, bytes, bytearray)):
+            if len(request.data) < HttpCompression.MIN_SIZE_TO_COMPRESS:
+                return
+            request.data = HttpCompression.compress(request.data, algorithm)
+        elif inspect.isgenerator(request.data):
+            request.data = HttpCompression.compress_stream(request.data, algorithm)
+        else:
+            return
+
+        request.headers[constants.Headers.CONTENT_ENCODING] = str(algorithm)
+
     def should_broadcast(self, command: RavenCommand) -> bool:
         if not isinstance(command, Broadcast):
             return False
@@ -993,7 +1102,7 @@ class RequestExecutor:
         should_retry: bool,
     ) -> bool:
         if response.status_code == HTTPStatus.NOT_FOUND:
-            self._cache.set_not_found(url, False)  # todo : check if aggressively cached, don't just pass False
+            self._cache.set_not_found(url, self.aggressive_caching is not None)
             if command.response_type == RavenCommandResponseType.EMPTY:
                 return True
             elif command.response_type == RavenCommandResponseType.OBJECT:
@@ -1115,16 +1224,17 @@ class RequestExecutor:
 
             state.command.timeout = self.second_broadcast_attempt_timeout
 
-            # todo: aggressive caching options
+            aggressive_cache_options = self.aggressive_caching
 
             def __run_async() -> None:
-                # todo: aggressive caching options
+                # aggressive caching is thread local, carry it over to the worker thread
+                old_aggressive_cache_options = self.aggressive_caching
+                self.aggressive_caching = aggressive_cache_options
                 try:
                     request = self.execute(state.node, None, state.command, False, session_info, True)
                     state.request = request
                 finally:
-                    # todo: aggressive_caching
-                    pass
+                    self.aggressive_caching = old_aggressive_cache_options
 
             task = self._thread_pool_executor.submit(__run_async)
             tasks[task] = state
@@ -1231,7 +1341,7 @@ class RequestExecutor:
 
     def __ensure_node_selector(self) -> None:
         if not self._disable_topology_updates:
-            self.__wait_for_topology_update(self._first_topology_update_task)
+            self._wait_for_topology_update(self._first_topology_update_task)
 
         if self._node_selector is None:
             topology = Topology(self.topology_etag, self.topology_nodes)
@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import datetime
-import threading
 import time
 import uuid
 from abc import abstractmethod
@@ -69,16 +68,39 @@ class UpdateTopologyParameters:
 
 
 class NodeSelector:
+    # weight of the newest sample in the moving average of node response times
+    RESPONSE_TIME_SMOOTHING = 0.2
+    # how often nodes that aren't receiving reads are probed again
+    SPEED_TEST_INTERVAL = datetime.timedelta(minutes=1)
+
     class __NodeSelectorState:
-        def __init__(self, topology: Topology):
+        def __init__(self, topology: Topology, previous: Optional[NodeSelector.__NodeSelectorState] = None):
             self.topology = topology
             self.nodes = topology.nodes
             self.failures = [0] * len(topology.nodes)
             self.fastest_records = [0] * len(topology.nodes)
             self.fastest: Union[None, int] = None
             self.speed_test_mode = 0
+            self.last_speed_test: Optional[float] = None
             self.unlikely_everyone_faulted_choice_index: Optional[int] = 0
 
+            # moving average of response times in seconds, None until the node answered a read
+            self.response_times: List[Optional[float]] = [None] * len(topology.nodes)
+            self.response_samples = [0] * len(topology.nodes)
+
+            if previous is not None:
+                self.__inherit_response_times(previous)
+
+        def __inherit_response_times(self, previous: NodeSelector.__NodeSelectorState) -> None:
+            # nodes that are still in the topology keep their averages, there's no reason to measure them again
+            previous_indexes = {node.url: index for index, node in enumerate(previous.nodes)}
+            for index, node in enumerate(self.nodes):
+                previous_index = previous_indexes.get(node.url)
+                if previous_index is not None:
+                    self.response_times[index] = previous.response_times[previous_index]
+                    self.response_samples[index] = previous.response_samples[previous_index]
+            self.last_speed_test = previous.last_speed_test
+
         @property
         def node_when_everyone_marked_as_faulted(self) -> CurrentIndexAndNode:
             index = self.unlikely_everyone_faulted_choice_index
@@ -92,12 +114,10 @@ class NodeSelector:
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        if self.__update_fastest_node_timer is not None:
-            self.__update_fastest_node_timer.__exit__()
+        pass
 
     def __init__(self, topology: Topology, thread_pool: ThreadPoolExecutor):
         self.__state = self.__NodeSelectorState(topology)
-        self.__update_fastest_node_timer: Union[None, time] = None
         self.__thread_pool_executor = thread_pool
 
     @property
@@ -123,7 +143,8 @@ class NodeSelector:
         if state_etag >= topology_etag and not force_update:
             return False
 
-        state = NodeSelector.__NodeSelectorState(topology)
+        state = NodeSelector.__NodeSelectorState(topology, self.__state)
+        state.fastest = self.__find_fastest_index(state)
         self.__state = state
 
         return True
@@ -149,7 +170,7 @@ class NodeSelector:
         server_nodes = state.nodes
         length = min(len(server_nodes), len(state_failures))
         for i in range(length):
-            if state_failures[0] == 0:
+            if state_failures[i] == 0:
                 return CurrentIndexAndNode(i, server_nodes[i])
         return cls.unlikely_everyone_faulted_choice(state)
 
@@ -184,16 +205,82 @@ class NodeSelector:
 
     def get_fastest_node(self) -> CurrentIndexAndNode:
         state = self.__state
-        if state.failures[state.fastest] == 0 and state.nodes[state.fastest].server_role == ServerNode.Role.MEMBER:
-            return CurrentIndexAndNode(state.fastest, state.nodes[state.fastest])
+        if (
+            state.speed_test_mode == 0
+            and state.last_speed_test is not None
+            and time.monotonic() - state.last_speed_test >= self.SPEED_TEST_INTERVAL.total_seconds()
+        ):
+            self.__switch_to_speed_test_phase()
+
+        fastest = state.fastest
+        if fastest is not None and self.__is_healthy_member(state, fastest):
+            return CurrentIndexAndNode(fastest, state.nodes[fastest])
 
         # if the fastest node has failures, we'll immediately schedule
-        # another run of finding who the fastest node is, in the mantime
-        # we'll just use the server preferred node or failover as usual
+        # another run of finding who the fastest node is, in the meantime
+        # we'll use the next fastest healthy node, or the preferred node and failover as usual
 
         self.__switch_to_speed_test_phase()
+
+        fastest = self.__find_fastest_index(state)
+        if fastest is not None:
+            state.fastest = fastest
+            return CurrentIndexAndNode(fastest, state.nodes[fastest])
+
         return self.get_preferred_node()
 
+    def record_response_time(self, index: int, node: ServerNode, elapsed: datetime.timedelta) -> None:
+        state = self.__state
+        if index is None or index < 0 or index >= len(state.nodes) or node is not state.nodes[index]:
+            return
+
+        seconds = elapsed.total_seconds()
+        if seconds <= 0:
+            return
+
+        previous = state.response_times[index]
+        state.response_times[index] = (
+            seconds if previous is None else previous + self.RESPONSE_TIME_SMOOTHING * (seconds - previous)
+        )
+        state.response_samples[index] += 1
+
+        if state.speed_test_mode == 0:
+            fastest = self.__find_fastest_index(state)
+            if fastest is not None:
+                state.fastest = fastest
+
+    def get_node_latencies(self) -> List[NodeLatency]:
+        state = self.__state
+        return [
+            NodeLatency(
+                node,
+                (
+                    datetime.timedelta(seconds=state.response_times[index])
+                    if state.response_times[index] is not None
+                    else None
+                ),
+                state.response_samples[index],
+                state.failures[index] == 0,
+                state.fastest == index,
+            )
+            for index, node in enumerate(state.nodes)
+        ]
+
+    @staticmethod
+    def __is_healthy_member(state: NodeSelector.__NodeSelectorState, index: int) -> bool:
+        return state.failures[index] == 0 and state.nodes[index].server_role == ServerNode.Role.MEMBER
+
+    @staticmethod
+    def __find_fastest_index(state: NodeSelector.__NodeSelectorState) -> Optional[int]:
+        fastest = None
+        for index, response_time in enumerate(state.response_times):
+            if response_time is None or not NodeSelector.__is_healthy_member(state, index):
+                continue
+            if fastest is None or response_time < state.response_times[fastest]:
+                fastest = index
+
+        return fastest
+
     def restore_node_index(self, node_index: int) -> None:
         state = self.__state
         if len(state.failures) <= node_index:
@@ -208,13 +295,11 @@ class NodeSelector:
     def __switch_to_speed_test_phase(self) -> None:
         state = self.__state
 
-        if not state.speed_test_mode == 0:
-            state.speed_test_mode = 1
+        if state.speed_test_mode != 0:
             return
 
-        for i in state.fastest_records:
-            i = 0
-
+        state.speed_test_mode = 1
+        state.fastest_records = [0] * len(state.nodes)
         state.speed_test_mode += 1
 
     @property
@@ -233,12 +318,13 @@ class NodeSelector:
         if index < 0 or index >= len(state_fastest):
             return
 
-        if node != state.nodes[index]:
+        if node is not state.nodes[index]:
             return
 
         state_fastest[index] += 1
         if state_fastest[index] >= 10:
             self.__select_fastest(state, index)
+            return
 
         state.speed_test_mode += 1
 
@@ -264,17 +350,12 @@ class NodeSelector:
         return max_index
 
     def __select_fastest(self, state: NodeSelector.__NodeSelectorState, index: int) -> None:
-        state.fastest = index
+        # the node that answered first most often is only a fallback, the response time averages
+        # collected during the speed test are the better measure
+        fastest = self.__find_fastest_index(state)
+        state.fastest = fastest if fastest is not None else index
         state.speed_test_mode = 0
-
-        if self.__update_fastest_node_timer is not None:
-            # todo: figure out how to reshedule timer, or put it in sleep for 60s
-            threading.self.__update_fastest_node_timer
-
-        else:
-            self.__update_fastest_node_timer = threading.Timer(
-                datetime.timedelta(minutes=1), self.__switch_to_speed_test_phase
-            )
+        state.last_speed_test = time.monotonic()
 
     def schedule_speed_test(self) -> None:
         self.__switch_to_speed_test_phase()
@@ -286,6 +367,22 @@ class CurrentIndexAndNode:
         self.current_node = current_node
 
 
+class NodeLatency:
+    def __init__(
+        self,
+        node: ServerNode,
+        average_response_time: Optional[datetime.timedelta],
+        samples: int,
+        available: bool,
+        fastest: bool,
+    ):
+        self.node = node
+        self.average_response_time = average_response_time
+        self.samples = samples
+        self.available = available
+        self.fastest = fastest
+
+
 class CurrentIndexAndNodeAndEtag:
     def __init__(self, current_index: int, current_node: ServerNode, etag: int):
         self.current_index = current_index
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import json
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Optional, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class JsonCodec(ABC):
+    """
+    Encodes request bodies and decodes response payloads.
+
+    Set on DocumentConventions.json_codec. Encoding takes the conventions json default method, which is called for
+    every object the codec can't encode by itself, so custom types are handled the same way by every codec.
+    Decoding accepts both str and bytes, response bodies and cached payloads are passed in as received.
+    """
+
+    @property
+    @abstractmethod
+    def name(self) -> str:
+        pass
+
+    @abstractmethod
+    def dumps(
+        self, obj: Any, default: Optional[Callable[[Any], Any]] = None, check_circular: bool = True
+    ) -> Union[str, bytes]:
+        pass
+
+    @abstractmethod
+    def loads(self, data: Union[str, bytes, bytearray]) -> Any:
+        pass
+
+
+class StdlibJsonCodec(JsonCodec):
+    @property
+    def name(self) -> str:
+        return "json"
+
+    def dumps(
+        self, obj: Any, default: Optional[Callable[[Any], Any]] = None, check_circular: bool = True
+    ) -> Union[str, bytes]:
+        return json.dumps(obj, default=default, check_circular=check_circular)
+
+    def loads(self, data: Union[str, bytes, bytearray]) -> Any:
+        return json.loads(data)
+
+
+class OrjsonCodec(JsonCodec):
+    """
+    Codec backed by orjson, works on utf-8 bytes end-to-end.
+
+    datetime and dataclass instances are passed through to the json default method, so they're written the same way
+    the stdlib codec writes them. Values orjson refuses to encode (e.g. integers above 64 bits) and payloads it
+    refuses to decode (e.g. NaN literals) fall back to the stdlib json module.
+    """
+
+    def __init__(self):
+        if orjson is None:
+            raise ImportError(
+                "OrjsonCodec requires the 'orjson' package. Install it with 'pip install ravendb[orjson]'."
+            )
+        self.__options = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+
+    @property
+    def name(self) -> str:
+        return "orjson"
+
+    def dumps(
+        self, obj: Any, default: Optional[Callable[[Any], Any]] = None, check_circular: bool = True
+    ) -> Union[str, bytes]:
+        # orjson always guards against circular references, check_circular is meaningful for the stdlib fallback only
+        try:
+            return orjson.dumps(obj, default=default, option=self.__options)
+        except orjson.JSONEncodeError:
+            return json.dumps(obj, default=default, check_circular=check_circular).encode("utf-8")
+
+    def loads(self, data: Union[str, bytes, bytearray]) -> Any:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            return json.loads(data)
+
+
+DEFAULT_JSON_CODEC = StdlibJsonCodec()
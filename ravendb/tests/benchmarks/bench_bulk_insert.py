@@ -0,0 +1,132 @@
+"""
+Measures bulk insert throughput (store_as one by one, store_many and several parallel streams) against a local
+stub server.
+
+The stub runs in a separate process, so it doesn't compete with the client for the GIL. It answers the next
+operation id request and drains the chunked bulk insert stream, optionally sleeping after every chunk to simulate
+a slow network - the stalled time then shows the store methods being held back instead of piling buffers up in memory.
+
+Run with: python -m ravendb.tests.benchmarks.bench_bulk_insert [number_of_documents] [chunk_delay_ms]
+"""
+
+import json
+import multiprocessing
+import sys
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from ravendb import DocumentStore
+from ravendb.documents.bulk_insert_operation import BulkInsertOptions
+
+
+class Order:
+    def __init__(
+        self, Id: str = None, company: str = None, employee: str = None, freight: float = None, lines: list = None
+    ):
+        self.Id = Id
+        self.company = company
+        self.employee = employee
+        self.freight = freight
+        self.lines = lines
+
+
+class _StubServerHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    chunk_delay = 0.0
+    bytes_received: multiprocessing.Value = None
+
+    def log_message(self, format, *args):
+        pass
+
+    def _reply(self, body: bytes = b"") -> None:
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        self._reply(json.dumps({"Id": 1, "NodeTag": "A"}).encode("utf-8"))
+
+    def do_POST(self):
+        while True:
+            size = int(self.rfile.readline().strip(), 16)
+            if size == 0:
+                self.rfile.readline()
+                break
+            received = len(self.rfile.read(size + 2)) - 2
+            with self.bytes_received.get_lock():
+                self.bytes_received.value += received
+            if self.chunk_delay:
+                time.sleep(self.chunk_delay)
+        self._reply()
+
+
+def _serve(port: multiprocessing.Queue, bytes_received: multiprocessing.Value, chunk_delay: float) -> None:
+    _StubServerHandler.bytes_received = bytes_received
+    _StubServerHandler.chunk_delay = chunk_delay
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StubServerHandler)
+    port.put(server.server_port)
+    server.serve_forever()
+
+
+def bench(count: int = 100000, chunk_delay_ms: float = 0.0) -> None:
+    port = multiprocessing.Queue()
+    bytes_received = multiprocessing.Value("q", 0)
+    server = multiprocessing.Process(target=_serve, args=(port, bytes_received, chunk_delay_ms / 1000), daemon=True)
+    server.start()
+
+    store = DocumentStore(urls=[f"http://127.0.0.1:{port.get()}"], database="bench")
+    store.conventions.disable_topology_updates = True
+    store.initialize()
+
+    orders = [
+        Order(
+            f"orders/{i}",
+            f"companies/{i % 90}",
+            f"employees/{i % 9}",
+            12.5,
+            [{"product": f"products/{j}"} for j in range(3)],
+        )
+        for i in range(count)
+    ]
+
+    try:
+        for flush_threshold, max_buffers_in_flight, batch, parallelism in [
+            (16 * 1024, 2, False, None),
+            (64 * 1024, 8, False, None),
+            (1024 * 1024, 8, False, None),
+            (64 * 1024, 8, True, None),
+            (64 * 1024, 8, True, 2),
+            (64 * 1024, 8, True, 4),
+        ]:
+            bytes_received.value = 0
+            options = BulkInsertOptions(flush_threshold=flush_threshold, max_buffers_in_flight=max_buffers_in_flight)
+            with store.bulk_insert(options=options, parallelism=parallelism) as bulk_insert:
+                if batch:
+                    bulk_insert.store_many(orders)
+                else:
+                    for order in orders:
+                        bulk_insert.store_as(order, order.Id)
+
+            statistics = bulk_insert.statistics
+            assert statistics.bytes_sent == bytes_received.value
+            print(
+                f"{'store_many' if batch else 'store_as':<10} "
+                f"x{parallelism or 1} "
+                f"flush {flush_threshold // 1024:>5} KiB x {max_buffers_in_flight}: "
+                f"{statistics.documents_per_second:10.0f} docs/s "
+                f"{statistics.bytes_per_second / 1024 / 1024:7.2f} MiB/s "
+                f"stalled {statistics.stalled_time.total_seconds() * 1000:8.1f} ms "
+                f"of {statistics.elapsed.total_seconds() * 1000:8.1f} ms"
+            )
+    finally:
+        store.close()
+        server.terminate()
+
+
+if __name__ == "__main__":
+    bench(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 100000,
+        float(sys.argv[2]) if len(sys.argv) > 2 else 0.0,
+    )
@@ -0,0 +1,99 @@
+"""
+Compares the session change tracking modes on the client side of a load + save_changes cycle.
+
+Documents are fed to a LoadOperation as if they came from the server, then save_changes is prepared
+(BatchOperation.create_request) with a single modified entity - no server is needed.
+
+Run with: python -m ravendb.tests.benchmarks.bench_change_tracking [number_of_documents ...]
+"""
+
+import json
+import sys
+import timeit
+
+from ravendb import DocumentStore
+from ravendb.documents.commands.results import GetDocumentsResult
+from ravendb.documents.operations.batch import BatchOperation
+from ravendb.documents.session.misc import ChangeTrackingMode, SessionOptions
+from ravendb.documents.session.operations.load_operation import LoadOperation
+
+
+class Address:
+    def __init__(self, street: str = None, city: str = None, zip_code: str = None):
+        self.street = street
+        self.city = city
+        self.zip_code = zip_code
+
+
+class Order:
+    def __init__(
+        self,
+        Id: str = None,
+        company: str = None,
+        employee: str = None,
+        ordered_at: str = None,
+        ship_to: dict = None,
+        freight: float = None,
+        lines: list = None,
+    ):
+        self.Id = Id
+        self.company = company
+        self.employee = employee
+        self.ordered_at = ordered_at
+        self.ship_to = ship_to
+        self.freight = freight
+        self.lines = lines
+
+
+def _server_response(count: int) -> str:
+    documents = []
+    for number in range(count):
+        documents.append(
+            {
+                "company": f"companies/{number % 90}",
+                "employee": f"employees/{number % 9}",
+                "ordered_at": "2023-01-01T10:00:00.0000000",
+                "ship_to": {"street": "Main St", "city": "Hadera", "zip_code": "38000"},
+                "freight": 12.5,
+                "lines": [{"product": f"products/{i}", "quantity": i, "price": 2.5} for i in range(5)],
+                "@metadata": {
+                    "@collection": "Orders",
+                    "Raven-Python-Type": f"{Order.__module__}.{Order.__name__}",
+                    "@change-vector": f"A:{number + 1}-ZXhhbXBsZQ",
+                    "@id": f"orders/{number}",
+                    "@last-modified": "2023-01-01T10:00:00.0000000Z",
+                },
+            }
+        )
+    return json.dumps({"Results": documents, "Includes": {}})
+
+
+def bench(count: int = 10000, repeat: int = 5) -> None:
+    store = DocumentStore(urls=["http://127.0.0.1:8080"], database="bench")
+    store.conventions.disable_topology_updates = True
+    store.initialize()
+
+    response = _server_response(count)
+    keys = [f"orders/{number}" for number in range(count)]
+
+    def load_and_save(mode: ChangeTrackingMode):
+        with store.open_session(session_options=SessionOptions(change_tracking_mode=mode)) as session:
+            load_operation = LoadOperation(session).by_keys(keys)
+            load_operation.set_result(GetDocumentsResult.from_json(json.loads(response)))
+            orders = load_operation.get_documents(Order)
+            orders[keys[0]].freight = 20
+            assert BatchOperation(session).create_request() is not None
+
+    try:
+        for mode in ChangeTrackingMode:
+            best = min(timeit.repeat(lambda: load_and_save(mode), number=1, repeat=repeat))
+            print(
+                f"{str(mode):<10} {count:>6} documents: {best * 1000:8.1f} ms ({best / count * 1e6:6.2f} us/document)"
+            )
+    finally:
+        store.close()
+
+
+if __name__ == "__main__":
+    for number_of_documents in [int(arg) for arg in sys.argv[1:]] or [1000, 10000]:
+        bench(number_of_documents)
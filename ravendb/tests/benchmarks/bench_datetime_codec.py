@@ -0,0 +1,57 @@
+"""
+Compares the strptime/strftime based date conversion Utils used before with Utils.string_to_datetime and
+Utils.datetime_to_string, for the formats the server sends: 7 fraction digits with and without the Z suffix,
+shorter fractions and offsets.
+
+Run with: python -m ravendb.tests.benchmarks.bench_datetime_codec [number_of_dates]
+"""
+
+import datetime
+import sys
+import timeit
+
+from ravendb.tools.utils import Utils
+
+
+def _strptime(datetime_str: str) -> datetime.datetime:
+    try:
+        if datetime_str.endswith("Z"):
+            datetime_str = datetime_str[:-1]
+        return datetime.datetime.strptime(datetime_str, "%Y-%m-%dT%H:%M:%S.%f")
+    except ValueError:
+        return datetime.datetime.strptime(datetime_str[:-1], "%Y-%m-%dT%H:%M:%S.%f")
+
+
+def _strftime(datetime_obj: datetime.datetime) -> str:
+    return datetime_obj.strftime("%Y-%m-%dT%H:%M:%S.%f0")
+
+
+def bench(count: int = 100_000) -> None:
+    start = datetime.datetime(2023, 1, 1)
+    dates = [start + datetime.timedelta(seconds=i * 7.3) for i in range(count)]
+    ticks = [Utils.datetime_to_string(date) for date in dates]
+
+    cases = {
+        "7 digits Z": ([date + "Z" for date in ticks], _strptime),
+        "7 digits": (ticks, _strptime),
+        "3 digits Z": ([date[:23] + "Z" for date in ticks], _strptime),
+        "+02:00": ([date + "+02:00" for date in ticks], None),  # strptime based parsing didn't support offsets
+    }
+    for name, (strings, old) in cases.items():
+        new_time = timeit.timeit(lambda: [Utils.string_to_datetime(s) for s in strings], number=1)
+        old_time = timeit.timeit(lambda: [old(s) for s in strings], number=1) if old else None
+        print(
+            f"parse  {name:<11} {new_time * 1e9 / count:7.0f} ns"
+            + (f"  strptime {old_time * 1e9 / count:7.0f} ns  x{old_time / new_time:.1f}" if old else "")
+        )
+
+    new_time = timeit.timeit(lambda: [Utils.datetime_to_string(d) for d in dates], number=1)
+    old_time = timeit.timeit(lambda: [_strftime(d) for d in dates], number=1)
+    print(
+        f"format {'':<11} {new_time * 1e9 / count:7.0f} ns  strftime {old_time * 1e9 / count:7.0f} ns"
+        f"  x{old_time / new_time:.1f}"
+    )
+
+
+if __name__ == "__main__":
+    bench(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
@@ -0,0 +1,77 @@
+"""
+Compares building entities with Utils.initialize_object (inspects the constructor of the class for every
+document) with the cached EntityDeserializer used by the session.
+
+Run with: python -m ravendb.tests.benchmarks.bench_entity_deserializer [number_of_documents]
+"""
+
+import sys
+import timeit
+
+from ravendb.tools.entity_serializers import EntityDeserializer
+from ravendb.tools.utils import Utils
+
+
+class Address:
+    def __init__(self, street: str = None, city: str = None, zip_code: str = None):
+        self.street = street
+        self.city = city
+        self.zip_code = zip_code
+
+
+class Order:
+    def __init__(
+        self,
+        Id: str = None,
+        company: str = None,
+        employee: str = None,
+        ordered_at: str = None,
+        ship_to: Address = None,
+        freight: float = None,
+        lines: list = None,
+    ):
+        self.Id = Id
+        self.company = company
+        self.employee = employee
+        self.ordered_at = ordered_at
+        self.ship_to = ship_to
+        self.freight = freight
+        self.lines = lines
+
+
+def create_documents(count: int):
+    return [
+        {
+            "Company": f"companies/{i % 90}",
+            "Employee": f"employees/{i % 9}",
+            "OrderedAt": "2023-01-01T10:00:00.0000000",
+            "ShipTo": {"Street": "Main St", "City": "Hadera", "ZipCode": "38000"},
+            "Freight": 12.5,
+            "Lines": [{"Product": "products/1", "Quantity": 3}, {"Product": "products/2", "Quantity": 1}],
+            "@metadata": {"@id": f"orders/{i}", "@collection": "Orders"},
+        }
+        for i in range(count)
+    ]
+
+
+def bench(count: int = 10000, repeat: int = 5) -> None:
+    documents = create_documents(count)
+    nested_types = {"ship_to": Address}
+
+    def introspecting():
+        for document in documents:
+            entity = Utils.initialize_object(document, Order, True)
+            Utils.fill_with_nested_object_types(entity, nested_types)
+
+    def cached():
+        deserializer = EntityDeserializer.for_type(Order, True)
+        for document in documents:
+            deserializer.deserialize(document, nested_types)
+
+    for name, func in (("Utils.initialize_object", introspecting), ("EntityDeserializer", cached)):
+        best = min(timeit.repeat(func, number=1, repeat=repeat))
+        print(f"{name:<25} {count} docs: {best * 1000:8.1f} ms ({best / count * 1e6:6.2f} us/doc)")
+
+
+if __name__ == "__main__":
+    bench(int(sys.argv[1]) if len(sys.argv) > 1 else 10000)
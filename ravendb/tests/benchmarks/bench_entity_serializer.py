@@ -0,0 +1,52 @@
+"""
+Compares converting entities to json dicts through a json.dumps/json.loads round trip
+with the single pass EntitySerializer used by Utils.entity_to_dict.
+
+Run with: python -m ravendb.tests.benchmarks.bench_entity_serializer [number_of_entities]
+"""
+import datetime
+import json
+import sys
+import timeit
+
+from ravendb.documents.conventions import DocumentConventions
+from ravendb.tools.entity_serializers import EntitySerializer
+
+
+class Address:
+    def __init__(self, street: str = None, city: str = None, zip_code: str = None):
+        self.street = street
+        self.city = city
+        self.zip_code = zip_code
+
+
+class Order:
+    def __init__(self, number: int):
+        self.Id = None
+        self.company = f"companies/{number % 90}"
+        self.employee = f"employees/{number % 9}"
+        self.ordered_at = datetime.datetime(2023, 1, 1, 10, 0)
+        self.ship_to = Address("Main St", "Hadera", "38000")
+        self.freight = 12.5
+        self.lines = [{"product": f"products/{i}", "quantity": i, "price": 2.5} for i in range(5)]
+
+
+def bench(count: int = 10000, repeat: int = 5) -> None:
+    entities = [Order(i) for i in range(count)]
+    default_method = DocumentConventions.json_default
+
+    def round_trip():
+        for entity in entities:
+            json.loads(json.dumps(entity, default=default_method))
+
+    def single_pass():
+        for entity in entities:
+            EntitySerializer.to_json_dict(entity, default_method)
+
+    for name, func in (("json round trip", round_trip), ("EntitySerializer", single_pass)):
+        best = min(timeit.repeat(func, number=1, repeat=repeat))
+        print(f"{name:<25} {count} entities: {best * 1000:8.1f} ms ({best / count * 1e6:6.2f} us/entity)")
+
+
+if __name__ == "__main__":
+    bench(int(sys.argv[1]) if len(sys.argv) > 1 else 10000)
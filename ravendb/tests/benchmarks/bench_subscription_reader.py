@@ -0,0 +1,102 @@
+"""
+Measures how fast subscription messages are read from a socket: the previous str buffer re-decoded with
+JSONDecoder.raw_decode after every receive against the JsonMessageReader used by the subscription worker.
+
+A local socket server replays a recorded subscription stream (batches of Data messages followed by EndOfBatch),
+the documents are large enough to span many receives.
+
+Run with: python -m ravendb.tests.benchmarks.bench_subscription_reader [document_size_kb] [number_of_documents]
+"""
+
+import json
+import socket
+import sys
+import threading
+import time
+from json import JSONDecoder, JSONDecodeError
+
+from ravendb.tools.parsers import JsonMessageReader
+
+
+def _record_stream(document_size: int, count: int, batch_size: int = 32) -> bytes:
+    messages = [{"Type": "ConnectionStatus", "Status": "Accepted"}]
+    for i in range(count):
+        messages.append(
+            {
+                "Type": "Data",
+                "Data": {
+                    "Name": f"document {i}",
+                    "Text": "lorem ipsum dolor sit amet, " * (document_size // 56) + '"quoted" {braces} \\',
+                    "Lines": [
+                        {"Product": f"products/{j}", "Quantity": j, "Price": 12.5, "Discount": 0.1}
+                        for j in range(document_size // 256)
+                    ],
+                    "@metadata": {"@id": f"docs/{i}", "@change-vector": f"A:{i}-abc"},
+                },
+            }
+        )
+        if i % batch_size == batch_size - 1:
+            messages.append({"Type": "EndOfBatch"})
+    # sent back to back, the raw_decode reader doesn't skip whitespace between the messages
+    return "".join(json.dumps(message) for message in messages).encode("utf-8")
+
+
+def _replay(stream: bytes) -> socket.socket:
+    server = socket.socket()
+    server.bind(("127.0.0.1", 0))
+    server.listen(1)
+
+    def __serve():
+        connection, _ = server.accept()
+        with connection:
+            connection.sendall(stream)
+        server.close()
+
+    threading.Thread(target=__serve, daemon=True).start()
+    return socket.create_connection(server.getsockname())
+
+
+def _read_with_raw_decode(sock: socket.socket, messages: int, receive_buffer_size: int) -> None:
+    decoder = JSONDecoder()
+    buffer = ""
+    for _ in range(messages):
+        while True:
+            if buffer and not buffer.isspace():
+                try:
+                    decoded, index = decoder.raw_decode(buffer)
+                    buffer = buffer[index:]
+                    break
+                except JSONDecodeError:
+                    buffer += sock.recv(receive_buffer_size).decode("utf-8").strip("\r\n")
+            else:
+                buffer += sock.recv(receive_buffer_size).decode("utf-8").strip("\r\n")
+
+
+def _read_with_message_reader(sock: socket.socket, messages: int, receive_buffer_size: int) -> None:
+    reader = JsonMessageReader(sock, receive_buffer_size)
+    for _ in range(messages):
+        reader.next_object()
+
+
+def bench(document_size_kb: int = 256, count: int = 200) -> None:
+    stream = _record_stream(document_size_kb * 1024, count)
+    messages = stream.count(b'"Type"')
+    print(f"{messages} messages, {len(stream) / 1024 / 1024:.1f} MiB")
+
+    for receive_buffer_size in [4 * 1024, 32 * 1024, 256 * 1024]:
+        for name, read in [("raw_decode", _read_with_raw_decode), ("reader", _read_with_message_reader)]:
+            with _replay(stream) as sock:
+                start = time.perf_counter()
+                read(sock, messages, receive_buffer_size)
+                elapsed = time.perf_counter() - start
+            print(
+                f"{name:<10} receive {receive_buffer_size // 1024:>4} KiB: "
+                f"{elapsed * 1000:9.1f} ms {len(stream) / elapsed / 1024 / 1024:8.1f} MiB/s"
+            )
+
+
+if __name__ == "__main__":
+    bench(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 256,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 200,
+    )
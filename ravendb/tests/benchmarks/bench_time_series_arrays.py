@@ -0,0 +1,55 @@
+"""
+Measures decoding of a time series range as returned by GetTimeSeriesOperation: TimeSeriesEntry objects (one strptime
+per timestamp) against the columnar TimeSeriesRangeResult.to_arrays().
+
+Run with: python -m ravendb.tests.benchmarks.bench_time_series_arrays [number_of_entries]
+"""
+
+import datetime
+import json
+import sys
+import time
+
+from ravendb.documents.operations.time_series import TimeSeriesRangeResult
+
+
+def _record_range(count: int) -> str:
+    start = datetime.datetime(2023, 1, 1)
+    entries = [
+        {
+            "Timestamp": (start + datetime.timedelta(seconds=i)).strftime("%Y-%m-%dT%H:%M:%S.%f") + "0Z",
+            "Tag": f"watches/{i % 3}",
+            "Values": [60 + i % 40, 120.5, 80.25],
+            "IsRollup": False,
+        }
+        for i in range(count)
+    ]
+    return json.dumps(
+        {
+            "From": "2023-01-01T00:00:00.0000000Z",
+            "To": "2024-01-01T00:00:00.0000000Z",
+            "Entries": entries,
+            "TotalResults": count,
+        }
+    )
+
+
+def _measure(name: str, count: int, decode) -> None:
+    start = time.perf_counter()
+    decode()
+    elapsed = time.perf_counter() - start
+    print(f"{name:<10} {elapsed * 1000:9.1f} ms {count / elapsed:12.0f} entries/s")
+
+
+def bench(count: int = 1_000_000) -> None:
+    response = _record_range(count)
+    print(f"{count} entries, {len(response) / 1024 / 1024:.1f} MiB")
+
+    # the response is parsed by json.loads either way
+    response_json = json.loads(response)
+    _measure("entries", count, lambda: TimeSeriesRangeResult.from_json(response_json).entries)
+    _measure("to_arrays", count, lambda: TimeSeriesRangeResult.from_json(response_json).to_arrays())
+
+
+if __name__ == "__main__":
+    bench(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -0,0 +1,98 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from ravendb.changes.dispatch import ChangesOverflowPolicy, DispatchQueue
+from ravendb.changes.observers import Observable
+from ravendb.changes.types import DocumentChange, DocumentChangeType
+from ravendb.tests.test_base import TestBase
+
+
+def _change(key: str, change_vector: str) -> DocumentChange:
+    return DocumentChange(DocumentChangeType.PUT, key, "Users", change_vector)
+
+
+class TestChangesDispatch(TestBase):
+    def setUp(self):
+        super(TestChangesDispatch, self).setUp()
+        self.executor = ThreadPoolExecutor(4)
+        self.release = threading.Event()
+        self.delivered = []
+
+    def tearDown(self):
+        super(TestChangesDispatch, self).tearDown()
+        self.release.set()
+        self.executor.shutdown()
+
+    def _deliver_when_released(self, change: DocumentChange) -> None:
+        self.release.wait()
+        self.delivered.append(change.change_vector)
+
+    def _put_all(self, queue: DispatchQueue, changes) -> threading.Thread:
+        thread = threading.Thread(target=lambda: [queue.put(change) for change in changes])
+        thread.start()
+        return thread
+
+    def test_block_waits_for_the_subscriber(self):
+        queue = DispatchQueue(self._deliver_when_released, self.executor, 2, ChangesOverflowPolicy.BLOCK)
+        thread = self._put_all(queue, [_change("users/1", str(i)) for i in range(6)])
+
+        thread.join(0.2)
+        self.assertTrue(thread.is_alive())
+        self.assertEqual(2, queue.stats.queued)
+
+        self.release.set()
+        thread.join(5)
+        self._wait_for(lambda: queue.stats.delivered == 6)
+        self.assertEqual([str(i) for i in range(6)], self.delivered)
+        self.assertEqual(0, queue.stats.dropped)
+        self.assertGreater(queue.stats.max_lag.total_seconds(), 0)
+
+    def test_drop_oldest(self):
+        queue = DispatchQueue(self._deliver_when_released, self.executor, 2, ChangesOverflowPolicy.DROP_OLDEST)
+        self._put_all(queue, [_change("users/1", str(i)) for i in range(6)]).join(5)
+
+        self.release.set()
+        self._wait_for(lambda: queue.stats.queued == 0)
+        self.assertEqual(["4", "5"], self.delivered[-2:])
+        self.assertEqual(6, queue.stats.delivered + queue.stats.dropped)
+
+    def test_coalesce_keeps_latest_change_of_document(self):
+        queue = DispatchQueue(self._deliver_when_released, self.executor, 3, ChangesOverflowPolicy.COALESCE)
+        queue.put(_change("users/1", "in-flight"))
+        self._wait_for(lambda: queue.stats.queued == 0)
+
+        changes = [_change("users/1", "1"), _change("users/2", "2"), _change("users/3", "3"), _change("USERS/1", "4")]
+        self._put_all(queue, changes).join(5)
+
+        self.release.set()
+        self._wait_for(lambda: queue.stats.queued == 0 and queue.stats.delivered == 4)
+        self.assertEqual(["in-flight", "2", "3", "4"], self.delivered)
+        self.assertEqual(1, queue.stats.dropped)
+
+    def test_slow_subscriber_does_not_hold_up_other_observables(self):
+        slow = Observable(executor=self.executor, dispatch_executor=self.executor)(lambda change: True)
+        fast = Observable(executor=self.executor, dispatch_executor=self.executor)(lambda change: True)
+        slow.subscribe(self._deliver_when_released)
+        received = []
+        fast.subscribe(received.append)
+
+        for i in range(10):
+            change = _change("users/1", str(i))
+            slow.send(change)
+            fast.send(change)
+
+        self._wait_for(lambda: len(received) == 10)
+        self.assertEqual([], self.delivered)
+        self.assertEqual(9, slow.dispatch_stats.queued)
+
+        self.release.set()
+        self._wait_for(lambda: len(self.delivered) == 10)
+
+    @staticmethod
+    def _wait_for(condition, timeout: float = 5) -> None:
+        deadline = time.monotonic() + timeout
+        while not condition():
+            if time.monotonic() > deadline:
+                raise TimeoutError()
+            time.sleep(0.01)
@@ -0,0 +1,115 @@
+import threading
+
+from ravendb.documents.bulk_insert_operation import (
+    BulkInsertOperation,
+    BulkInsertOptions,
+    BulkInsertStatistics,
+    ParallelBulkInsertOperation,
+)
+from ravendb.exceptions.documents.bulkinsert import BulkInsertAbortedException
+from ravendb.tests.test_base import TestBase
+
+
+class Item:
+    def __init__(self, name: str = None):
+        self.name = name
+
+
+class TestBulkInsertPipeline(TestBase):
+    def setUp(self):
+        super(TestBulkInsertPipeline, self).setUp()
+
+    def test_options_are_validated(self):
+        with self.assertRaises(ValueError):
+            BulkInsertOptions(flush_threshold=0)
+        with self.assertRaises(ValueError):
+            BulkInsertOptions(max_buffers_in_flight=-1)
+
+    def test_buffer_exposer_blocks_producer_and_reuses_buffers(self):
+        statistics = BulkInsertStatistics()
+        exposer = BulkInsertOperation._BufferExposer(1, statistics)
+        exposer.enqueue_buffer_for_flush(bytearray(b"first"))
+
+        second_enqueued = threading.Event()
+
+        def __enqueue_second():
+            exposer.enqueue_buffer_for_flush(bytearray(b"second"))
+            second_enqueued.set()
+
+        threading.Thread(target=__enqueue_second).start()
+        self.assertFalse(second_enqueued.wait(0.1))
+
+        data = exposer.send_data()
+        self.assertEqual(b"first", bytes(next(data)))
+        self.assertTrue(second_enqueued.wait(5))
+        self.assertEqual(b"second", bytes(next(data)))
+
+        exposer.finish_operation()
+        self.assertEqual([], list(data))
+
+        self.assertEqual(len(b"firstsecond"), statistics.bytes_sent)
+        self.assertGreater(statistics.stalled_time.total_seconds(), 0)
+        self.assertEqual(bytearray(), exposer.rent_buffer())
+
+    def test_bulk_insert_with_small_buffers(self):
+        options = BulkInsertOptions(flush_threshold=128, max_buffers_in_flight=1)
+        with self.store.bulk_insert(options=options) as bulk_insert:
+            for i in range(500):
+                bulk_insert.store_as(Item(f"item {i}"), f"items/{i}")
+
+        self.assertEqual(500, bulk_insert.statistics.documents_count)
+        self.assertGreater(bulk_insert.statistics.bytes_sent, 500 * 128 // 10)
+        self.assertGreater(bulk_insert.statistics.documents_per_second, 0)
+
+        with self.store.open_session() as session:
+            self.assertEqual("item 499", session.load("items/499", Item).name)
+            self.assertEqual(500, session.query(object_type=Item).count())
+
+    def test_store_many(self):
+        items = [Item(f"item {i}") for i in range(100)]
+        with self.store.bulk_insert() as bulk_insert:
+            keys = bulk_insert.store_many(items)
+
+        self.assertEqual(100, len(set(keys)))
+        with self.store.open_session() as session:
+            self.assertEqual("item 42", session.load(keys[42], Item).name)
+
+    def test_strings_are_escaped(self):
+        name = 'quote " backslash \\ new line \n zażółć'
+        with self.store.bulk_insert(options=BulkInsertOptions(flush_threshold=16)) as bulk_insert:
+            bulk_insert.store_as(Item(name), 'items/"1\\')
+            bulk_insert.attachments_for('items/"1\\').store('file "1"', b"x" * 64, "text/plain")
+            bulk_insert.store_as(Item("after attachment"), "items/2")
+
+        with self.store.open_session() as session:
+            self.assertEqual(name, session.load('items/"1\\', Item).name)
+            self.assertEqual("after attachment", session.load("items/2", Item).name)
+            with session.advanced.attachments.get('items/"1\\', 'file "1"') as attachment:
+                self.assertEqual(b"x" * 64, attachment.data)
+
+    def test_parallel_bulk_insert(self):
+        with self.store.bulk_insert(parallelism=4) as bulk_insert:
+            self.assertIsInstance(bulk_insert, ParallelBulkInsertOperation)
+            keys = bulk_insert.store_many(Item(f"item {i}") for i in range(1000))
+            bulk_insert.store_as(Item("last"), "items/last")
+
+        self.assertEqual(1000, len(set(keys)))
+        self.assertEqual(1001, bulk_insert.statistics.documents_count)
+        self.assertEqual(1001, sum(s.documents_count for s in bulk_insert.streams_statistics))
+        self.assertGreater(bulk_insert.statistics.bytes_sent, 0)
+
+        with self.store.open_session() as session:
+            self.assertEqual("item 999", session.load(keys[999], Item).name)
+            self.assertEqual("last", session.load("items/last", Item).name)
+            self.assertEqual(1001, session.query(object_type=Item).count())
+
+    def test_parallel_bulk_insert_abort(self):
+        with self.assertRaises(BulkInsertAbortedException):
+            with self.store.bulk_insert(parallelism=2) as bulk_insert:
+                bulk_insert.store_as(Item("first"), "items/1")
+                bulk_insert.abort()
+                for i in range(2, 10000):
+                    bulk_insert.store_as(Item(f"item {i}"), f"items/{i}")
+
+        with self.assertRaises(ValueError):
+            self.store.bulk_insert(parallelism=0)
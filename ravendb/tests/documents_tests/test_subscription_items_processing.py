@@ -0,0 +1,69 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from ravendb.documents.subscriptions.options import SubscriptionCreationOptions, SubscriptionWorkerOptions
+from ravendb.documents.subscriptions.worker import SubscriptionBatch, SubscriptionBatchMetrics
+from ravendb.exceptions.exceptions import SubscriberErrorException
+from ravendb.infrastructure.entities import User
+from ravendb.tests.test_base import TestBase
+
+
+class TestSubscriptionItemsProcessing(TestBase):
+    def setUp(self):
+        super(TestSubscriptionItemsProcessing, self).setUp()
+        self.reasonable_amount_of_time = 10
+        with self.store.open_session() as session:
+            for i in range(100):
+                session.store(User(name=f"user {i}", age=i % 4), f"users/{i}")
+            session.save_changes()
+
+    def test_items_processed_concurrently_in_order_of_partition(self):
+        key = self.store.subscriptions.create_for_class(User, SubscriptionCreationOptions())
+        processed = {}
+        lock = threading.Lock()
+        all_processed = threading.Event()
+        all_acknowledged = threading.Event()
+        metrics = []
+
+        def __on_batch_processed(batch_metrics: SubscriptionBatchMetrics):
+            metrics.append(batch_metrics)
+            if sum(m.number_of_items for m in metrics) == 100:
+                all_acknowledged.set()
+
+        def __process_item(item: SubscriptionBatch.Item[User]):
+            with lock:
+                processed.setdefault(item.result.age, []).append(int(item.key.split("/")[1]))
+                if sum(len(keys) for keys in processed.values()) == 100:
+                    all_processed.set()
+
+        with ThreadPoolExecutor(4) as executor:
+            options = SubscriptionWorkerOptions(
+                key, items_executor=executor, items_partition_key=lambda item: item.result.age
+            )
+            with self.store.subscriptions.get_subscription_worker(options, User) as worker:
+                worker.add_on_batch_processed(__on_batch_processed)
+                worker.run_for_each_item(__process_item)
+                self.assertTrue(all_processed.wait(self.reasonable_amount_of_time))
+                self.assertTrue(all_acknowledged.wait(self.reasonable_amount_of_time))
+
+        self.assertEqual({0, 1, 2, 3}, set(processed.keys()))
+        for age, keys in processed.items():
+            self.assertEqual(sorted(keys), keys)
+            self.assertTrue(all(k % 4 == age for k in keys))
+
+        self.assertIs(metrics[-1], worker.last_batch_metrics)
+        self.assertGreater(worker.last_batch_metrics.processing_time.total_seconds(), 0)
+
+    def test_failed_item_isnt_acknowledged(self):
+        key = self.store.subscriptions.create_for_class(User, SubscriptionCreationOptions())
+
+        def __process_item(item: SubscriptionBatch.Item[User]):
+            if item.key == "users/42":
+                raise RuntimeError("failed")
+
+        with ThreadPoolExecutor(4) as executor:
+            options = SubscriptionWorkerOptions(key, items_executor=executor)
+            with self.store.subscriptions.get_subscription_worker(options, User) as worker:
+                with self.assertRaises(SubscriberErrorException):
+                    worker.run_for_each_item(__process_item).result(self.reasonable_amount_of_time)
+                self.assertIsNone(worker.last_batch_metrics)
@@ -0,0 +1,67 @@
+import json
+import socket
+import threading
+import time
+
+from ravendb.tools.parsers import JsonMessageReader
+from ravendb.tests.test_base import TestBase
+
+
+class TestSubscriptionMessageReader(TestBase):
+    def setUp(self):
+        super(TestSubscriptionMessageReader, self).setUp()
+        self.server_side, self.client_side = socket.socketpair()
+
+    def tearDown(self):
+        super(TestSubscriptionMessageReader, self).tearDown()
+        self.server_side.close()
+        self.client_side.close()
+
+    def test_messages_split_at_every_byte(self):
+        messages = [
+            {"Type": "Data", "Data": {"Name": 'braces } { and "quotes" \\ inside', "Emoji": "zażółć 🐍"}},
+            {"Type": "Includes", "Includes": {"a": [{"b": {}}, [], "]"]}},
+            {"Type": "EndOfBatch", "Value": "\\"},
+        ]
+        stream = "\r\n".join(json.dumps(message, ensure_ascii=False) for message in messages).encode("utf-8")
+
+        reader = JsonMessageReader(self.client_side, receive_buffer_size=1)
+        self.server_side.sendall(stream)
+        self.assertEqual(messages, [reader.next_object() for _ in messages])
+
+    def test_many_messages_in_one_receive(self):
+        messages = [{"Type": "Data", "Id": i, "Text": "x" * i} for i in range(100)]
+        self.server_side.sendall(b" ".join(json.dumps(message).encode("utf-8") for message in messages))
+
+        reader = JsonMessageReader(self.client_side, receive_buffer_size=64 * 1024)
+        self.assertEqual(messages, [reader.next_object() for _ in messages])
+
+    def test_message_completed_while_the_server_waits(self):
+        message = json.dumps({"Type": "EndOfBatch", "Padding": "x" * 10000}).encode("utf-8")
+        reader = JsonMessageReader(self.client_side, receive_buffer_size=1024)
+        received = []
+
+        def __read():
+            received.append(reader.next_object())
+
+        self.server_side.sendall(message[:9000])
+        thread = threading.Thread(target=__read)
+        thread.start()
+        time.sleep(0.1)
+
+        # much less than what was received so far, the server sends nothing more until it gets an ack
+        self.server_side.sendall(message[9000:])
+        thread.join(5)
+        self.assertEqual([json.loads(message)], received)
+
+    def test_closed_connection(self):
+        reader = JsonMessageReader(self.client_side)
+        self.server_side.sendall(b'{"Type": "Confirm"}\r\n{"Type": ')
+        self.server_side.close()
+
+        self.assertEqual({"Type": "Confirm"}, reader.next_object())
+        with self.assertRaises(ConnectionError):
+            reader.next_object()
+
+        with self.assertRaises(ValueError):
+            JsonMessageReader(self.client_side, receive_buffer_size=0)
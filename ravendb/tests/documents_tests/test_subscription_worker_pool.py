@@ -0,0 +1,86 @@
+import threading
+from datetime import timedelta
+
+from ravendb.documents.subscriptions.options import (
+    SubscriptionCreationOptions,
+    SubscriptionOpeningStrategy,
+    SubscriptionWorkerOptions,
+)
+from ravendb.documents.subscriptions.worker import SubscriptionBatch
+from ravendb.exceptions.exceptions import SubscriptionDoesNotExistException
+from ravendb.infrastructure.entities import User
+from ravendb.serverwide.tcp import TcpConnectionHeaderMessage
+from ravendb.tests.test_base import TestBase
+
+
+class TestSubscriptionWorkerPool(TestBase):
+    def setUp(self):
+        super(TestSubscriptionWorkerPool, self).setUp()
+        self.reasonable_amount_of_time = 15
+        with self.store.open_session() as session:
+            for i in range(100):
+                session.store(User(name=f"user {i}"), f"users/{i}")
+            session.save_changes()
+
+    def test_pool_processes_all_documents(self):
+        key = self.store.subscriptions.create_for_class(User, SubscriptionCreationOptions())
+        processed = set()
+        lock = threading.Lock()
+        all_processed = threading.Event()
+
+        def __process_item(item: SubscriptionBatch.Item[User]):
+            with lock:
+                processed.add(item.key)
+                if len(processed) == 100:
+                    all_processed.set()
+
+        with self.store.subscriptions.get_subscription_worker_pool(key, 3, User) as pool:
+            self.assertEqual(3, pool.size)
+            result = pool.run_for_each_item(__process_item)
+            self.assertTrue(all_processed.wait(self.reasonable_amount_of_time))
+            self.assertEqual(3, len(pool.workers))
+            self.assertEqual(
+                [f"{key}/{i}" for i in range(3)], sorted(worker._options.worker_id for worker in pool.workers)
+            )
+
+        self.assertIsNone(result.result(self.reasonable_amount_of_time))
+        self.assertEqual(0, pool.metrics.number_of_restarts)
+
+    def test_failed_worker_is_restarted(self):
+        key = self.store.subscriptions.create_for_class(User, SubscriptionCreationOptions())
+        options = SubscriptionWorkerOptions(key, strategy=SubscriptionOpeningStrategy.CONCURRENT)
+        options.time_to_wait_before_connection_retry = timedelta(milliseconds=100)
+        failed = threading.Event()
+        processed = set()
+        lock = threading.Lock()
+        all_processed = threading.Event()
+
+        def __process_item(item: SubscriptionBatch.Item[User]):
+            if item.key == "users/42" and not failed.is_set():
+                failed.set()
+                raise RuntimeError("failed")
+            with lock:
+                processed.add(item.key)
+                if len(processed) == 100:
+                    all_processed.set()
+
+        with self.store.subscriptions.get_subscription_worker_pool(options, 2, User) as pool:
+            pool.run_for_each_item(__process_item)
+            self.assertTrue(all_processed.wait(self.reasonable_amount_of_time))
+            self.assertEqual(1, pool.metrics.number_of_restarts)
+
+    def test_pool_stops_when_subscription_does_not_exist(self):
+        with self.store.subscriptions.get_subscription_worker_pool("no-such-subscription", 2, User) as pool:
+            with self.assertRaises(SubscriptionDoesNotExistException):
+                pool.run(lambda batch: None).result(self.reasonable_amount_of_time)
+
+        with self.assertRaises(ValueError):
+            self.store.subscriptions.get_subscription_worker_pool(SubscriptionWorkerOptions("name"), 2)
+
+    def test_concurrent_strategy_uses_the_subscription_tcp_version(self):
+        # the server rejects a CONCURRENT strategy it doesn't support, no version above it is proposed
+        versions = TcpConnectionHeaderMessage.operations_to_supported_protocol_versions[
+            TcpConnectionHeaderMessage.OperationTypes.SUBSCRIPTION
+        ]
+        self.assertEqual(TcpConnectionHeaderMessage.SUBSCRIPTION_TIME_SERIES_INCLUDES, max(versions))
+        self.assertEqual(TcpConnectionHeaderMessage.SUBSCRIPTION_TIME_SERIES_INCLUDES, versions[0])
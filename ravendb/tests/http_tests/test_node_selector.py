@@ -0,0 +1,74 @@
+import datetime
+
+from ravendb.http.server_node import ServerNode
+from ravendb.http.topology import NodeSelector, Topology
+from ravendb.tests.test_base import TestBase
+
+
+class TestNodeSelector(TestBase):
+    def setUp(self):
+        super(TestNodeSelector, self).setUp()
+        self.nodes = [ServerNode(f"http://node-{tag}:8080", "db", tag, ServerNode.Role.MEMBER) for tag in "ABC"]
+        self.node_selector = NodeSelector(Topology(1, self.nodes), self.store.thread_pool_executor)
+
+    def _record(self, *milliseconds: int):
+        for index, elapsed in enumerate(milliseconds):
+            self.node_selector.record_response_time(index, self.nodes[index], datetime.timedelta(milliseconds=elapsed))
+
+    def _run_speed_test(self, fastest_index: int):
+        self.node_selector.schedule_speed_test()
+        self.assertTrue(self.node_selector.in_speed_test_phase)
+        for _ in range(10):
+            self._record(30, 10, 20)
+            self.node_selector.record_fastest(fastest_index, self.nodes[fastest_index])
+        self.assertFalse(self.node_selector.in_speed_test_phase)
+
+    def test_speed_test_selects_fastest_node(self):
+        self._run_speed_test(1)
+        self.assertEqual("B", self.node_selector.get_fastest_node().current_node.cluster_tag)
+
+    def test_regular_traffic_moves_reads_to_faster_node(self):
+        self._run_speed_test(1)
+
+        for _ in range(20):
+            self.node_selector.record_response_time(1, self.nodes[1], datetime.timedelta(milliseconds=50))
+
+        self.assertEqual("C", self.node_selector.get_fastest_node().current_node.cluster_tag)
+
+    def test_failed_fastest_node_is_skipped_and_speed_test_is_scheduled(self):
+        self._run_speed_test(1)
+
+        self.node_selector.on_failed_request(1)
+        self.assertEqual("C", self.node_selector.get_fastest_node().current_node.cluster_tag)
+        self.assertTrue(self.node_selector.in_speed_test_phase)
+
+    def test_speed_test_is_repeated_periodically(self):
+        self._run_speed_test(1)
+
+        original_interval = NodeSelector.SPEED_TEST_INTERVAL
+        NodeSelector.SPEED_TEST_INTERVAL = datetime.timedelta()
+        try:
+            self.node_selector.get_fastest_node()
+            self.assertTrue(self.node_selector.in_speed_test_phase)
+        finally:
+            NodeSelector.SPEED_TEST_INTERVAL = original_interval
+
+    def test_latencies_survive_topology_update(self):
+        self._run_speed_test(1)
+
+        nodes = [ServerNode(node.url, "db", node.cluster_tag, ServerNode.Role.MEMBER) for node in self.nodes]
+        self.assertTrue(self.node_selector.on_update_topology(Topology(2, nodes)))
+
+        latencies = self.node_selector.get_node_latencies()
+        self.assertEqual(["A", "B", "C"], [latency.node.cluster_tag for latency in latencies])
+        self.assertEqual([10, 10, 10], [latency.samples for latency in latencies])
+        self.assertEqual([False, True, False], [latency.fastest for latency in latencies])
+        self.assertAlmostEqual(0.01, latencies[1].average_response_time.total_seconds())
+
+    def test_executor_exposes_latencies(self):
+        with self.store.open_session() as session:
+            session.load("users/1")
+
+        latencies = self.store.get_request_executor().node_latencies
+        self.assertEqual(1, len(latencies))
+        self.assertGreater(latencies[0].samples, 0)
@@ -1,5 +1,4 @@
 import os
-import unittest
 
 from ravendb.documents.operations.attachments import PutAttachmentOperation, AttachmentRequest
 from ravendb.tests.test_base import TestBase, User
@@ -9,15 +8,12 @@ class TestAttachmentsStream(TestBase):
     def setUp(self):
         super(TestAttachmentsStream, self).setUp()
 
-    @unittest.skip("Get many attachments in single request https://issues.hibernatingrhinos.com/issue/RDBC-427")
     def test_can_get_one_attachment_1(self):
         self.__can_get_one_attachment(1024)
 
-    @unittest.skip("Get many attachments in single request https://issues.hibernatingrhinos.com/issue/RDBC-427")
     def test_can_get_one_attachment_2(self):
         self.__can_get_one_attachment(1024 * 1024)
 
-    @unittest.skip("Get many attachments in single request https://issues.hibernatingrhinos.com/issue/RDBC-427")
     def test_can_get_one_attachment_3(self):
         self.__can_get_one_attachment(128 * 1024 * 1024)
 
@@ -37,7 +33,30 @@ class TestAttachmentsStream(TestBase):
             user = session.load(key, User)
             attachment_names = [AttachmentRequest(key, x.name) for x in session.advanced.attachments.get_names(user)]
 
-            with session.advanced.attachments.get(attachment_names) as attachments_result:
-                while attachments_result.has_next():
-                    item = attachments_result.next()
-                    self.assertEqual(stream, item.stream)
+            with session.advanced.attachments.get_many(attachment_names) as attachments_result:
+                items = 0
+                for item in attachments_result:
+                    self.assertEqual(attachment_name, item.details.name)
+                    self.assertEqual(size, item.details.size)
+                    self.assertEqual(stream, item.data)
+                    items += 1
+                self.assertEqual(1, items)
+
+    def test_can_get_many_attachments(self):
+        streams = {f"file{i}": os.urandom(100 * i) for i in range(10)}
+
+        with self.store.open_session() as session:
+            session.store(User("su"), "users/1-A")
+            for name, stream in streams.items():
+                session.advanced.attachments.store("users/1-A", name, stream)
+            session.save_changes()
+
+        with self.store.open_session() as session:
+            attachment_requests = [AttachmentRequest("users/1-A", name) for name in reversed(streams)]
+            with session.advanced.attachments.get_many(attachment_requests) as attachments_result:
+                names = []
+                for item in attachments_result:
+                    if item.details.name != "file5":  # skipped attachments don't affect the next ones
+                        self.assertEqual(streams[item.details.name], b"".join(item.iter_content(64)))
+                    names.append(item.details.name)
+                self.assertEqual(list(reversed(streams)), names)
@@ -0,0 +1,138 @@
+import io
+import json
+import os
+import tempfile
+
+import requests
+
+from ravendb.data.operation import AttachmentType
+from ravendb.documents.commands.batches import PutAttachmentCommandData, SingleNodeBatchCommand
+from ravendb.documents.conventions import DocumentConventions
+from ravendb.documents.operations.attachments import (
+    AttachmentsIterator,
+    GetAttachmentOperation,
+    PutAttachmentOperation,
+)
+from ravendb.http.multipart import MultipartFormStream, iter_chunks
+from ravendb.http.server_node import ServerNode
+from ravendb.tests.test_base import TestBase, User
+
+
+class TestAttachmentsStreaming(TestBase):
+    def setUp(self):
+        super(TestAttachmentsStreaming, self).setUp()
+
+    def test_multipart_form_stream(self):
+        body = MultipartFormStream(chunk_size=4)
+        body.add_part("main", b'{"Commands":[]}')
+        body.add_part("file", io.BytesIO(b"0123456789"), "image/png", {"Command-Type": "AttachmentStream"})
+        body.add_part("chunks", (chunk for chunk in [b"ab", b"", b"cd"]))
+
+        chunks = list(body)
+        self.assertIn(b"0123", chunks)  # the file is read chunk_size bytes at a time
+        boundary = body.content_type.split("boundary=")[1].encode()
+        self.assertEqual(
+            b"--" + boundary + b'\r\nContent-Disposition: form-data; name="main"; filename="main"\r\n\r\n'
+            b'{"Commands":[]}\r\n'
+            b"--" + boundary + b'\r\nContent-Disposition: form-data; name="file"; filename="file"\r\n'
+            b"Content-Type: image/png\r\nCommand-Type: AttachmentStream\r\n\r\n0123456789\r\n"
+            b"--" + boundary + b'\r\nContent-Disposition: form-data; name="chunks"; filename="chunks"\r\n\r\n'
+            b"abcd\r\n"
+            b"--" + boundary + b"--\r\n",
+            b"".join(chunks),
+        )
+        self.assertEqual([b"abc"], list(iter_chunks(bytearray(b"abc"))))
+
+    def test_store_attachments_from_file_and_iterable(self):
+        data = os.urandom(300 * 1024)
+        with self.store.open_session() as session:
+            user = User("Fitzchak")
+            session.store(user, "users/1")
+            session.advanced.attachments.store(user, "file", io.BytesIO(data), "image/png")
+            session.advanced.attachments.store(user, "chunks", (data[i : i + 1000] for i in range(0, len(data), 1000)))
+            session.save_changes()
+
+        self.store.operations.send(PutAttachmentOperation("users/1", "operation", io.BytesIO(data), "image/png"))
+        self.store.operations.send(PutAttachmentOperation("users/1", "operation-chunks", iter([data[:10], data[10:]])))
+
+        with self.store.open_session() as session:
+            for name in ["file", "chunks", "operation", "operation-chunks"]:
+                with session.advanced.attachments.get("users/1", name) as result:
+                    self.assertEqual(len(data), result.details.size)
+                    self.assertEqual(data, b"".join(result.iter_content(8192)))
+
+    def test_download_attachment_without_reading_it_into_memory(self):
+        data = os.urandom(200 * 1024)
+        with self.store.open_session() as session:
+            session.store(User("Fitzchak"), "users/1")
+            session.advanced.attachments.store("users/1", "file", data, "image/png")
+            session.save_changes()
+
+        operation = GetAttachmentOperation("users/1", "file", AttachmentType.document, None)
+        with self.store.operations.send(operation) as result:
+            destination = io.BytesIO()
+            self.assertEqual(len(data), result.copy_to(destination))
+            self.assertEqual(data, destination.getvalue())
+
+        with self.store.operations.send(operation) as result:
+            with result.to_memory_map() as memory_map:
+                self.assertEqual(data, memory_map[:])
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "file")
+            with self.store.operations.send(operation) as result:
+                result.to_memory_map(path).close()
+            with open(path, "rb") as file:
+                self.assertEqual(data, file.read())
+
+    def test_attachments_iterator_reads_metadata_then_attachments(self):
+        class _Raw(io.BytesIO):
+            def read(self, size=-1):
+                return super().read(min(size, 3))  # the attachments arrive in small chunks
+
+        metadata = [
+            {"Name": 'a"}]', "Hash": "h", "ContentType": "", "Size": 4, "ChangeVector": "A:1", "DocumentId": "users/1"},
+            {"Name": "b\\", "Hash": "h", "ContentType": "", "Size": 2, "ChangeVector": "A:2", "DocumentId": "users/1"},
+        ]
+        response = requests.Response()
+        response.raw = _Raw(json.dumps({"AttachmentsMetadata": metadata}).encode("utf-8") + b"{[1]" + b"ok")
+
+        with AttachmentsIterator(response) as attachments:
+            items = [(item.details.name, item.data) for item in attachments]
+        self.assertEqual([('a"}]', b"{[1]"), ("b\\", b"ok")], items)
+
+    @staticmethod
+    def _batch_body(command: SingleNodeBatchCommand) -> bytes:
+        request = command.create_request(ServerNode("http://127.0.0.1:8080", "db"))
+        body = b"".join(request.data)
+        boundary = request.headers["Content-Type"].split("boundary=")[1].encode()
+        return body.replace(boundary, b"<boundary>")
+
+    def test_retried_request_resends_the_whole_attachment(self):
+        file = io.BytesIO(b"skipped|attachment data")
+        file.read(8)  # the attachment starts where the file is when it's stored
+        command = SingleNodeBatchCommand(
+            DocumentConventions(), [PutAttachmentCommandData("users/1", "file", file, "text/plain", None)]
+        )
+        first = self._batch_body(command)
+        self.assertIn(b"\r\n\r\nattachment data\r\n", first)
+        self.assertEqual(first, self._batch_body(command))
+
+        operation_command = PutAttachmentOperation("users/1", "file", io.BytesIO(b"data")).get_command(None, None)
+        node = ServerNode("http://127.0.0.1:8080", "db")
+        self.assertEqual(b"data", operation_command.create_request(node).data.read())
+        self.assertEqual(b"data", operation_command.create_request(node).data.read())
+
+    def test_retried_request_with_consumed_attachment_raises(self):
+        command = SingleNodeBatchCommand(
+            DocumentConventions(), [PutAttachmentCommandData("users/1", "chunks", iter([b"a", b"b"]), None, None)]
+        )
+        self.assertIn(b"\r\n\r\nab\r\n", self._batch_body(command))
+        with self.assertRaises(RuntimeError):
+            self._batch_body(command)
+
+        operation_command = PutAttachmentOperation("users/1", "chunks", iter([b"a", b"b"])).get_command(None, None)
+        node = ServerNode("http://127.0.0.1:8080", "db")
+        self.assertEqual(b"ab", b"".join(operation_command.create_request(node).data))
+        with self.assertRaises(RuntimeError):
+            operation_command.create_request(node)
@@ -0,0 +1,52 @@
+from ravendb.documents.store.definition import DocumentStore
+from ravendb.http.http_cache import HttpCache
+from ravendb.tests.test_base import TestBase, User
+
+
+class TestHttpCacheSize(TestBase):
+    def setUp(self):
+        super(TestHttpCacheSize, self).setUp()
+
+    def test_cache_evicts_least_recently_used_items(self):
+        cache = HttpCache(3000)
+        for i in range(3):
+            cache.set(f"/docs?id=users/{i}", f"A:{i}", "x" * 800)
+
+        self.assertEqual(3, cache.number_of_items)
+
+        # touch the oldest item, so the next one becomes the eviction candidate
+        cache.get("/docs?id=users/0")
+        cache.set("/docs?id=users/3", "A:3", "x" * 800)
+
+        self.assertLessEqual(cache.current_size, cache.max_size)
+        self.assertEqual(1, cache.evictions)
+        self.assertEqual("A:0", cache.get("/docs?id=users/0")[1])
+        self.assertIsNone(cache.get("/docs?id=users/1")[1])
+        self.assertEqual(2, cache.hits)
+        self.assertEqual(1, cache.misses)
+
+    def test_cache_does_not_keep_items_larger_than_max_size(self):
+        cache = HttpCache(1000)
+        cache.set("/docs?id=users/1", "A:1", "x" * 2000)
+
+        self.assertEqual(0, cache.number_of_items)
+        self.assertEqual(0, cache.current_size)
+
+    def test_request_executor_honors_max_http_cache_size(self):
+        with self.store.open_session() as session:
+            for i in range(20):
+                session.store(User(f"user_{i}" * 100, i), f"users/{i}")
+            session.save_changes()
+
+        with DocumentStore(self.store.urls, self.store.database) as store:
+            store.conventions.max_http_cache_size = 16 * 1024
+            store.initialize()
+
+            for i in range(20):
+                with store.open_session() as session:
+                    session.load(f"users/{i}", User)
+
+            cache = store.get_request_executor().cache
+            self.assertEqual(16 * 1024, cache.max_size)
+            self.assertLessEqual(cache.current_size, cache.max_size)
+            self.assertGreater(cache.evictions, 0)
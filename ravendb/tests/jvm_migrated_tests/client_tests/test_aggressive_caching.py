@@ -0,0 +1,79 @@
+import datetime
+import time
+
+from ravendb.http.misc import AggressiveCacheMode
+from ravendb.tests.test_base import TestBase, User
+
+
+class TestAggressiveCaching(TestBase):
+    def setUp(self):
+        super(TestAggressiveCaching, self).setUp()
+        with self.store.open_session() as session:
+            for i in range(5):
+                session.store(User(f"user_{i}", i), f"users/{i}")
+            session.save_changes()
+
+        self.request_executor = self.store.get_request_executor()
+
+    def test_can_aggressively_cache_loads(self):
+        with self.store.open_session() as session:
+            session.load("users/1", User)
+
+        old_number_of_requests = self.request_executor.number_of_server_requests
+        with self.store.aggressively_cache_for(datetime.timedelta(minutes=5), AggressiveCacheMode.DO_NOT_TRACK_CHANGES):
+            for _ in range(5):
+                with self.store.open_session() as session:
+                    user = session.load("users/1", User)
+                    self.assertEqual("user_1", user.name)
+
+        self.assertEqual(old_number_of_requests, self.request_executor.number_of_server_requests)
+
+    def test_can_aggressively_cache_queries(self):
+        with self.store.open_session() as session:
+            list(session.query(object_type=User).wait_for_non_stale_results())
+
+        with self.store.aggressively_cache():
+            with self.store.open_session() as session:
+                self.assertEqual(5, len(list(session.query(object_type=User))))
+
+            old_number_of_requests = self.request_executor.number_of_server_requests
+            for _ in range(5):
+                with self.store.open_session() as session:
+                    self.assertEqual(5, len(list(session.query(object_type=User))))
+
+        self.assertEqual(old_number_of_requests, self.request_executor.number_of_server_requests)
+
+    def test_aggressive_caching_is_scoped(self):
+        with self.store.open_session() as session:
+            session.load("users/1", User)
+
+        with self.store.aggressively_cache():
+            with self.store.disable_aggressive_caching():
+                self.assertIsNone(self.request_executor.aggressive_caching)
+            self.assertIsNotNone(self.request_executor.aggressive_caching)
+
+        self.assertIsNone(self.request_executor.aggressive_caching)
+
+        old_number_of_requests = self.request_executor.number_of_server_requests
+        with self.store.open_session() as session:
+            session.load("users/1", User)
+        self.assertEqual(old_number_of_requests + 1, self.request_executor.number_of_server_requests)
+
+    def test_changes_invalidate_aggressively_cached_items(self):
+        with self.store.aggressively_cache():
+            with self.store.open_session() as session:
+                self.assertEqual("user_1", session.load("users/1", User).name)
+
+            with self.store.open_session() as session:
+                session.load("users/1", User).name = "Changed"
+                session.save_changes()
+
+            name = None
+            for _ in range(50):
+                with self.store.open_session() as session:
+                    name = session.load("users/1", User).name
+                if name == "Changed":
+                    break
+                time.sleep(0.1)
+
+            self.assertEqual("Changed", name)
@@ -59,8 +59,9 @@ class TestHiLo(TestBase):
             self.assertEqual(generate_document_key, "products/129-A")
 
     def test_capacity_should_double(self):
+        # without prefetching, so the next range is requested exactly when the current one runs out
         hilo_generator = HiLoIdGenerator(
-            "users", self.store, self.store.database, self.store.conventions.identity_parts_separator
+            "users", self.store, self.store.database, self.store.conventions.identity_parts_separator, 0
         )
         with self.store.open_session() as session:
             hilo_doc = HiLoDocument(64)
@@ -79,6 +80,34 @@ class TestHiLo(TestBase):
             hilo_doc = session.load("Raven/Hilo/users", HiLoDocument)
             self.assertEqual(hilo_doc.Max, 160)
 
+    def test_next_range_is_prefetched(self):
+        hilo_generator = HiLoIdGenerator(
+            "users", self.store, self.store.database, self.store.conventions.identity_parts_separator, 0.25
+        )
+        with self.store.open_session() as session:
+            session.store(HiLoDocument(64), "Raven/Hilo/users")
+            session.save_changes()
+
+        # the 25th id reaches the low water mark and requests the next range in the background,
+        # the current range is still used up before switching to the prefetched one
+        ids = [hilo_generator.next_id() for _ in range(33)]
+        self.assertEqual(list(range(65, 98)), ids)
+        self.assertEqual(97, hilo_generator.range.min_val)
+        self.assertEqual(160, hilo_generator.range.max_val)
+
+        with self.store.open_session() as session:
+            self.assertEqual(160, session.load("Raven/Hilo/users", HiLoDocument).Max)
+
+    def test_ids_are_unique_across_threads(self):
+        hilo_generator = HiLoIdGenerator(
+            "users", self.store, self.store.database, self.store.conventions.identity_parts_separator
+        )
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            ids = list(executor.map(lambda _: hilo_generator.next_id(), range(2000)))
+
+        self.assertEqual(len(ids), len(set(ids)))
+
     def test_return_unused_range_on_close(self):
         new_store = DocumentStore(self.store.urls, self.store.database)
         new_store.initialize()
@@ -182,6 +182,34 @@ class TestOperations(TestBase):
         with self.store.open_session() as session:
             self.assertEqual(0, len(session.load_starting_with("users", User)))
 
+    def test_wait_for_completion_of_many_operations(self):
+        with self.store.open_session() as session:
+            for i in range(10):
+                session.store(User(name=f"user {i}"), key=f"users/{i + 2}")
+            session.save_changes()
+
+        operations = [
+            self.store.operations.send_async(
+                PatchByQueryOperation(f"from Users where name = 'user {i}' update {{ this.age = {i}; }}")
+            )
+            for i in range(10)
+        ]
+        futures = [operation.wait_for_completion_async() for operation in operations]
+        self.assertIs(futures[0], operations[0].wait_for_completion_async())
+
+        for future in futures:
+            self.assertEqual(1, future.result(30)["Total"])
+
+        with self.store.open_session() as session:
+            self.assertEqual(9, session.load("users/11", User).age)
+
+    def test_wait_for_completion_of_missing_operation_raises(self):
+        operation = NewOperation(
+            self.store.get_request_executor(), lambda: self.store.changes(), self.store.conventions, 2**40
+        )
+        with self.assertRaises(RuntimeError):
+            operation.wait_for_completion(timedelta(seconds=30))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -5,9 +5,15 @@ from ravendb.documents.operations.time_series import (
     TimeSeriesOperation,
     TimeSeriesBatchOperation,
 )
+from ravendb.documents.session.time_series import TimeSeriesArrays
 
 import unittest
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 from ravendb.tests.test_base import TestBase, User
 from ravendb.tools.raven_test_helper import RavenTestHelper
 
@@ -101,6 +107,89 @@ class TestTimeSeriesOperations(TestBase):
             self.assertEqual(1, len(ts[0].values))
             self.assertEqual(3, ts[0].values[0])
 
+    @unittest.skipIf(numpy is None, "numpy is not installed")
+    def test_get_time_series_as_arrays(self):
+        base = datetime(2023, 3, 1, 12, 30, 15, 123000)
+        ts_operation = TimeSeriesOperation(self.ts_name)
+        ts_operation.append(TimeSeriesOperation.AppendOperation(base, [73, 1.5], "watches/fitbit"))
+        ts_operation.append(TimeSeriesOperation.AppendOperation(base + timedelta(seconds=1), [78]))
+        ts_operation.append(TimeSeriesOperation.AppendOperation(base + timedelta(seconds=2), [80, 2], "watches/fitbit"))
+        self.store.operations.send(TimeSeriesBatchOperation("users/1-A", ts_operation))
+
+        ts_range_result = self.store.operations.send(GetTimeSeriesOperation("users/1-A", self.ts_name))
+        arrays = ts_range_result.to_arrays()
+
+        self.assertEqual(3, len(arrays))
+        self.assertEqual(numpy.dtype("datetime64[ns]"), arrays.timestamps.dtype)
+        self.assertEqual(numpy.datetime64(base, "ns"), arrays.timestamps[0])
+        numpy.testing.assert_array_equal([[73, 1.5], [78, numpy.nan], [80, 2]], arrays.values)
+        self.assertEqual(["watches/fitbit"], arrays.tags)
+        self.assertEqual([0, -1, 0], arrays.tag_codes.tolist())
+        self.assertEqual([False, False, False], arrays.rollup.tolist())
+
+        # the entries are still there, as the arrays give them
+        entries = ts_range_result.entries
+        self.assertEqual(
+            [(e.timestamp, e.tag, e.values) for e in entries], [(e.timestamp, e.tag, e.values) for e in arrays]
+        )
+        self.assertEqual([78], arrays[1].values)
+        self.assertEqual(arrays.values.tolist()[0], ts_range_result.to_arrays().values.tolist()[0])
+
+    @unittest.skipIf(numpy is None, "numpy is not installed")
+    def test_time_series_arrays_keep_nan_values(self):
+        arrays = TimeSeriesArrays.from_json(
+            [
+                {"Timestamp": "2023-03-01T12:30:15.0000000Z", "Values": [float("nan"), 1], "Tag": None},
+                {"Timestamp": "2023-03-01T12:30:16.0000000Z", "Values": [2, float("nan"), 3], "Tag": None},
+                {"Timestamp": "2023-03-01T12:30:17.0000000Z", "Values": [4], "Tag": None},
+            ]
+        )
+
+        self.assertEqual([2, 3, 1], arrays.value_counts.tolist())
+        self.assertEqual(2, len(arrays[0].values))
+        self.assertTrue(numpy.isnan(arrays[0].values[0]))
+        self.assertEqual(1, arrays[0].values[1])
+        self.assertEqual(3, len(arrays[1].values))
+        self.assertEqual(3, arrays[1].values[2])
+        self.assertEqual([4], arrays[2].values)
+        self.assertEqual([2, 3, 1], [len(entry.values) for entry in TimeSeriesArrays.from_entries(list(arrays))])
+
+    def test_stream_time_series(self):
+        base = datetime(2023, 3, 1)
+        ts_operation = TimeSeriesOperation(self.ts_name)
+        for i in range(250):
+            ts_operation.append(TimeSeriesOperation.AppendOperation(base + timedelta(seconds=i), [i]))
+        self.store.operations.send(TimeSeriesBatchOperation("users/1-A", ts_operation))
+
+        entries = list(self.store.time_series.stream_time_series("users/1-A", self.ts_name, page_size=100))
+        self.assertEqual(list(range(250)), [entry.value for entry in entries])
+        self.assertEqual(base + timedelta(seconds=249), entries[-1].timestamp)
+
+        entries = list(
+            self.store.time_series.stream_time_series(
+                "users/1-A", self.ts_name, base + timedelta(seconds=10), base + timedelta(seconds=209), page_size=50
+            )
+        )
+        self.assertEqual(list(range(10, 210)), [entry.value for entry in entries])
+
+        self.assertEqual([], list(self.store.time_series.stream_time_series("users/1-A", "no-such-series")))
+
+    @unittest.skipIf(numpy is None, "numpy is not installed")
+    def test_stream_time_series_as_arrays(self):
+        base = datetime(2023, 3, 1)
+        ts_operation = TimeSeriesOperation(self.ts_name)
+        for i in range(250):
+            ts_operation.append(TimeSeriesOperation.AppendOperation(base + timedelta(seconds=i), [i, -i]))
+        self.store.operations.send(TimeSeriesBatchOperation("users/1-A", ts_operation))
+
+        chunks = list(
+            self.store.time_series.stream_time_series("users/1-A", self.ts_name, page_size=100, as_arrays=True)
+        )
+        self.assertEqual([100, 100, 50], [len(chunk) for chunk in chunks])
+        values = numpy.concatenate([chunk.values for chunk in chunks])
+        numpy.testing.assert_array_equal(numpy.arange(250), values[:, 0])
+        numpy.testing.assert_array_equal(-numpy.arange(250), values[:, 1])
+
 
 if __name__ == "__main__":
     unittest.main()
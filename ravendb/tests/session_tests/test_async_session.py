@@ -0,0 +1,70 @@
+import asyncio
+
+from ravendb.documents.store.definition import AsyncDocumentStore
+from ravendb.tests.test_base import TestBase, User
+
+
+class TestAsyncSession(TestBase):
+    def setUp(self):
+        super(TestAsyncSession, self).setUp()
+        self.async_store = AsyncDocumentStore(self.store.urls, self.store.database)
+        self.async_store.initialize()
+
+    def tearDown(self):
+        asyncio.run(self.async_store.close_async())
+        super(TestAsyncSession, self).tearDown()
+
+    def test_store_and_load(self):
+        async def __run():
+            async with self.async_store.open_async_session() as session:
+                session.store(User("Idan", 30), "users/1")
+                session.store(User("Tal", 25), "users/2")
+                await session.save_changes()
+
+            async with self.async_store.open_async_session() as session:
+                user = await session.load("users/1", User)
+                self.assertEqual("Idan", user.name)
+                self.assertEqual(30, user.age)
+
+                users = await session.load(["users/1", "users/2"], User)
+                self.assertEqual(2, len(users))
+                self.assertIsNone(await session.load("users/3", User))
+
+        asyncio.run(__run())
+
+        with self.store.open_session() as session:
+            self.assertEqual("Tal", session.load("users/2", User).name)
+
+    def test_many_concurrent_loads_share_one_event_loop(self):
+        with self.store.open_session() as session:
+            for i in range(10):
+                session.store(User(f"user{i}", i), f"users/{i}")
+            session.save_changes()
+
+        async def __load(i: int) -> User:
+            async with self.async_store.open_async_session() as session:
+                return await session.load(f"users/{i % 10}", User)
+
+        async def __run():
+            return await asyncio.gather(*[__load(i) for i in range(500)])
+
+        users = asyncio.run(__run())
+        self.assertEqual(500, len(users))
+        self.assertEqual(["user3"] * 50, [user.name for user in users if user.age == 3])
+
+    def test_query(self):
+        with self.store.open_session() as session:
+            session.store(User("John", 20), "users/1")
+            session.store(User("Jane", 40), "users/2")
+            session.save_changes()
+
+        async def __run():
+            async with self.async_store.open_async_session() as session:
+                query = session.query(object_type=User).where_greater_than("age", 30).wait_for_non_stale_results()
+                results = await session.to_list(query)
+                self.assertEqual(1, len(results))
+                self.assertEqual("Jane", results[0].name)
+
+                self.assertEqual(2, await session.count(session.query(object_type=User)))
+
+        asyncio.run(__run())
@@ -0,0 +1,65 @@
+from ravendb.documents.session.misc import ChangeTrackingMode, SessionOptions
+from ravendb.tests.test_base import TestBase
+
+
+class Post:
+    def __init__(self, title: str = None, tags: list = None, author: dict = None):
+        self.title = title
+        self.tags = tags
+        self.author = author
+
+
+class TestChangeTracking(TestBase):
+    def setUp(self):
+        super(TestChangeTracking, self).setUp()
+        with self.store.open_session() as session:
+            for i in range(3):
+                session.store(Post(f"post {i}", ["a", "b"], {"name": "Oren", "age": 40}), f"posts/{i}")
+            session.save_changes()
+
+    def _open_session(self, mode: ChangeTrackingMode):
+        return self.store.open_session(session_options=SessionOptions(change_tracking_mode=mode))
+
+    def test_default_mode_is_deep_copy(self):
+        with self.store.open_session() as session:
+            self.assertEqual(ChangeTrackingMode.DEEP_COPY, session.change_tracking_mode)
+
+    def test_unchanged_entities_are_not_saved(self):
+        for mode in ChangeTrackingMode:
+            with self._open_session(mode) as session:
+                session.load(["posts/0", "posts/1", "posts/2"], Post)
+                self.assertFalse(session.has_changes())
+                self.assertEqual({}, session.advanced.what_changed())
+
+                session.save_changes()
+                self.assertEqual(1, session.advanced.number_of_requests)
+
+    def test_nested_modifications_are_detected(self):
+        for i, mode in enumerate(ChangeTrackingMode):
+            with self._open_session(mode) as session:
+                post = session.load("posts/0", Post)
+                post.tags.append(str(mode))
+                post.author["age"] = 41 + i
+
+                self.assertTrue(session.advanced.has_changed(post))
+                changes = session.advanced.what_changed()["posts/0"]
+                self.assertEqual({"tags", "age"}, {change["field_name"] for change in changes})
+                session.save_changes()
+
+                # the saved state becomes the new original
+                self.assertFalse(session.has_changes())
+
+            with self.store.open_session() as session:
+                post = session.load("posts/0", Post)
+                self.assertEqual(str(mode), post.tags[-1])
+                self.assertEqual(41 + i, post.author["age"])
+
+    def test_snapshot_keeps_original_document_intact(self):
+        with self._open_session(ChangeTrackingMode.SNAPSHOT) as session:
+            post = session.load("posts/1", Post)
+            post.tags.clear()
+
+            document_info = session.documents_by_id.get("posts/1")
+            self.assertIsNotNone(document_info.document_snapshot)
+            self.assertEqual(["a", "b"], document_info.document["tags"])
+            self.assertTrue(session.has_changes())
@@ -0,0 +1,44 @@
+import datetime
+
+from ravendb.tests.test_base import TestBase
+from ravendb.tools.utils import Utils
+
+
+class TestDatetimeCodec(TestBase):
+    def setUp(self):
+        super(TestDatetimeCodec, self).setUp()
+
+    def test_parse_server_format(self):
+        expected = datetime.datetime(2023, 3, 1, 12, 30, 15, 123456)
+        self.assertEqual(expected, Utils.string_to_datetime("2023-03-01T12:30:15.1234567Z"))
+        self.assertEqual(expected, Utils.string_to_datetime("2023-03-01T12:30:15.1234567"))
+        self.assertEqual(expected, Utils.string_to_datetime("2023-03-01T12:30:15.123456Z"))
+        self.assertEqual(
+            datetime.datetime(2023, 3, 1, 12, 30, 15, 120000), Utils.string_to_datetime("2023-03-01T12:30:15.12Z")
+        )
+        self.assertEqual(datetime.datetime(2023, 3, 1, 12, 30, 15), Utils.string_to_datetime("2023-03-01T12:30:15"))
+        self.assertEqual(datetime.datetime.max, Utils.string_to_datetime("9999-12-31T23:59:59.9999999"))
+        self.assertIsNone(Utils.string_to_datetime(None))
+
+    def test_parse_offset(self):
+        parsed = Utils.string_to_datetime("2023-03-01T12:30:15.1234567+02:00")
+        self.assertEqual(datetime.timedelta(hours=2), parsed.utcoffset())
+        self.assertEqual(
+            datetime.datetime(2023, 3, 1, 10, 30, 15, 123456), parsed.replace(tzinfo=None) - parsed.utcoffset()
+        )
+        self.assertEqual(
+            datetime.timedelta(hours=-5, minutes=-30), Utils.string_to_datetime("2023-03-01T12:30:15-05:30").utcoffset()
+        )
+
+        with self.assertRaises(ValueError):
+            Utils.string_to_datetime("2023-03-01")
+
+    def test_format_round_trip(self):
+        value = datetime.datetime(2023, 3, 1, 12, 30, 15, 123456)
+        self.assertEqual("2023-03-01T12:30:15.1234560", Utils.datetime_to_string(value))
+        self.assertEqual(value, Utils.string_to_datetime(Utils.datetime_to_string(value)))
+        self.assertEqual("2023-03-01T12:30:00.0000000", Utils.datetime_to_string(datetime.datetime(2023, 3, 1, 12, 30)))
+        self.assertEqual("9999-12-31T23:59:59.9999999", Utils.datetime_to_string(datetime.datetime.max))
+        self.assertEqual("0001-01-01T00:00:00.0000000", Utils.datetime_to_string(datetime.datetime.min))
+        self.assertIsNone(Utils.datetime_to_string(None))
+        self.assertEqual("", Utils.datetime_to_string(None, False))
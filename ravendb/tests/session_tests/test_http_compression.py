@@ -0,0 +1,58 @@
+import gzip
+import unittest
+
+from ravendb import DocumentStore
+from ravendb.documents.bulk_insert_operation import BulkInsertOptions
+from ravendb.documents.commands.batches import SingleNodeBatchCommand
+from ravendb.http.compression import HttpCompression, HttpCompressionAlgorithm, zstandard
+from ravendb.tests.test_base import TestBase
+
+
+class Item:
+    def __init__(self, name: str = None, description: str = None):
+        self.name = name
+        self.description = description
+
+
+class TestHttpCompression(TestBase):
+    def setUp(self):
+        super(TestHttpCompression, self).setUp()
+
+    def test_compress(self):
+        data = "raven " * 1000
+        self.assertEqual(
+            data.encode("utf-8"), gzip.decompress(HttpCompression.compress(data, HttpCompressionAlgorithm.GZIP))
+        )
+
+        chunks = [b"a" * 2000, b"", b"b" * 3000, b"c"]
+        compressed = b"".join(HttpCompression.compress_stream(iter(chunks), HttpCompressionAlgorithm.GZIP))
+        self.assertEqual(b"".join(chunks), gzip.decompress(compressed))
+
+    @unittest.skipIf(zstandard is not None, "zstandard is installed")
+    def test_zstd_requires_zstandard(self):
+        with self.assertRaises(ImportError):
+            HttpCompression.compress_stream(iter([b"a"]), HttpCompressionAlgorithm.ZSTD)
+
+    def test_bulk_insert_with_compression(self):
+        with self.store.bulk_insert(options=BulkInsertOptions(use_compression=True)) as bulk_insert:
+            self.assertTrue(bulk_insert.use_compression)
+            for i in range(1000):
+                bulk_insert.store_as(Item(f"item {i}", "description " * 20), f"items/{i}")
+
+        with self.store.open_session() as session:
+            self.assertEqual("item 999", session.load("items/999", Item).name)
+            self.assertEqual(1000, session.query(object_type=Item).count())
+
+    def test_save_changes_with_compression(self):
+        with DocumentStore(self.store.urls, self.store.database) as store:
+            store.conventions.use_http_compression = True
+            store.conventions.http_compression_command_types = [SingleNodeBatchCommand]
+            store.initialize()
+
+            with store.open_session() as session:
+                for i in range(100):
+                    session.store(Item(f"item {i}", "description " * 20), f"items/{i}")
+                session.save_changes()
+
+            with store.open_session() as session:
+                self.assertEqual("item 42", session.load("items/42", Item).name)
@@ -0,0 +1,82 @@
+import datetime
+import json
+import unittest
+
+from ravendb import DocumentStore, SessionOptions, TransactionMode
+from ravendb.documents.conventions import DocumentConventions
+from ravendb.documents.operations.compare_exchange.compare_exchange_value_result_parser import (
+    CompareExchangeValueResultParser,
+)
+from ravendb.json.json_codec import StdlibJsonCodec, OrjsonCodec, orjson
+from ravendb.tests.test_base import TestBase, User
+
+
+class Event:
+    def __init__(self, name: str = None, at: datetime.datetime = None, tags: list = None):
+        self.name = name
+        self.at = at
+        self.tags = tags
+
+
+class TestJsonCodec(TestBase):
+    def setUp(self):
+        super(TestJsonCodec, self).setUp()
+
+    def test_default_codec_is_stdlib(self):
+        self.assertIsInstance(DocumentConventions().json_codec, StdlibJsonCodec)
+
+    @unittest.skipIf(orjson is None, "orjson is not installed")
+    def test_orjson_codec_keeps_json_default_method_semantics(self):
+        default = DocumentConventions.json_default
+        value = {
+            "at": datetime.datetime(2023, 1, 2, 3, 4, 5),
+            "span": datetime.timedelta(minutes=5),
+            "user": User("Oren", 40),
+            1: "non str key",
+            "big": 2**70,
+        }
+
+        self.assertEqual(
+            json.loads(StdlibJsonCodec().dumps(value, default)), json.loads(OrjsonCodec().dumps(value, default))
+        )
+        self.assertEqual({"a": 1}, OrjsonCodec().loads(b'{"a": 1}'))
+        self.assertEqual({"a": 1}, OrjsonCodec().loads('{"a": 1}'))
+
+    @unittest.skipIf(orjson is None, "orjson is not installed")
+    def test_session_with_orjson_codec(self):
+        with DocumentStore(self.store.urls, self.store.database) as store:
+            store.conventions.json_codec = OrjsonCodec()
+            store.initialize()
+
+            at = datetime.datetime(2023, 1, 2, 3, 4, 5)
+            with store.open_session() as session:
+                session.store(Event("zażółć", at, ["a", "b"]), "events/1")
+                session.save_changes()
+
+            with store.open_session() as session:
+                event = session.load("events/1", Event)
+                self.assertEqual("zażółć", event.name)
+                self.assertEqual(["a", "b"], event.tags)
+
+                # served from the http cache as bytes
+                session.advanced.clear()
+                self.assertEqual("zażółć", session.load("events/1", Event).name)
+
+                results = list(session.query(object_type=Event).where_equals("name", "zażółć"))
+                self.assertEqual(1, len(results))
+
+    @unittest.skipIf(orjson is None, "orjson is not installed")
+    def test_lazy_missing_compare_exchange_value_with_orjson_codec(self):
+        conventions = DocumentConventions()
+        conventions.json_codec = OrjsonCodec()
+        self.assertIsNone(CompareExchangeValueResultParser.get_value(dict, b"null", False, conventions))
+        self.assertIsNone(CompareExchangeValueResultParser.get_value(dict, "null", False, conventions))
+
+        with DocumentStore(self.store.urls, self.store.database) as store:
+            store.conventions.json_codec = OrjsonCodec()
+            store.initialize()
+
+            session_options = SessionOptions(transaction_mode=TransactionMode.CLUSTER_WIDE)
+            with store.open_session(session_options=session_options) as session:
+                lazy_value = session.advanced.cluster_transaction.lazily.get_compare_exchange_value("missing", dict)
+                self.assertIsNone(lazy_value.value)
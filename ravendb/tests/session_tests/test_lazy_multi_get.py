@@ -0,0 +1,82 @@
+import datetime
+import json
+import threading
+
+from ravendb import DocumentStore
+from ravendb.http.misc import AggressiveCacheMode
+from ravendb.tests.test_base import TestBase, User
+
+
+class TestLazyMultiGet(TestBase):
+    def setUp(self):
+        super(TestLazyMultiGet, self).setUp()
+        with self.store.open_session() as session:
+            for i in range(5):
+                session.store(User(f"user_{i}", i), f"users/{i}")
+            session.save_changes()
+
+    @staticmethod
+    def _record_multi_get_requests(store: DocumentStore) -> list:
+        sent = []
+
+        def __on_before_request(args):
+            if args.url.endswith("/multi_get"):
+                sent.append(json.loads(args.request.data)["Requests"])
+
+        store.get_request_executor().add_on_before_request(__on_before_request)
+        return sent
+
+    def test_only_requests_missing_from_aggressive_cache_are_sent(self):
+        with self.store.open_session() as session:
+            session.advanced.lazily.load("users/1", User)
+            session.advanced.eagerly.execute_all_pending_lazy_operations()
+
+        sent = self._record_multi_get_requests(self.store)
+
+        with self.store.aggressively_cache_for(datetime.timedelta(minutes=5), AggressiveCacheMode.DO_NOT_TRACK_CHANGES):
+            with self.store.open_session() as session:
+                user_1 = session.advanced.lazily.load("users/1", User)
+                user_2 = session.advanced.lazily.load("users/2", User)
+                session.advanced.eagerly.execute_all_pending_lazy_operations()
+
+                self.assertEqual("user_1", user_1.value.name)
+                self.assertEqual("user_2", user_2.value.name)
+
+            self.assertEqual(1, len(sent))
+            self.assertEqual(1, len(sent[0]))
+            self.assertIn("users/2", sent[0][0]["Query"])
+
+            with self.store.open_session() as session:
+                user_1 = session.advanced.lazily.load("users/1", User)
+                user_2 = session.advanced.lazily.load("users/2", User)
+                session.advanced.eagerly.execute_all_pending_lazy_operations()
+
+                self.assertEqual("user_2", user_2.value.name)
+                self.assertEqual(0, session.number_of_requests)
+
+        self.assertEqual(1, len(sent))
+
+    def test_lazy_operations_of_sessions_are_coalesced(self):
+        with DocumentStore(self.store.urls, self.store.database) as store:
+            store.conventions.lazy_operations_coalescing_window = datetime.timedelta(milliseconds=500)
+            store.initialize()
+
+            sent = self._record_multi_get_requests(store)
+            names = {}
+            barrier = threading.Barrier(3)
+
+            def __load(i: int):
+                with store.open_session() as session:
+                    lazy_user = session.advanced.lazily.load(f"users/{i}", User)
+                    barrier.wait()
+                    names[i] = lazy_user.value.name
+
+            threads = [threading.Thread(target=__load, args=(i,)) for i in range(3)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+            self.assertEqual({0: "user_0", 1: "user_1", 2: "user_2"}, names)
+            self.assertEqual(1, len(sent))
+            self.assertEqual(3, len(sent[0]))
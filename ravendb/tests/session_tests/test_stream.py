@@ -0,0 +1,53 @@
+import io
+import json
+
+from ravendb.documents.session.misc import StreamQueryStatistics
+from ravendb.tests.test_base import TestBase, User
+
+
+class TestStream(TestBase):
+    def setUp(self):
+        super(TestStream, self).setUp()
+        with self.store.open_session() as session:
+            for i in range(200):
+                session.store(User(f"user_{i}", i), f"users/{i}")
+            session.store(User("Oren", 40), "people/1")
+            session.save_changes()
+
+    def test_stream_query(self):
+        with self.store.open_session() as session:
+            stats = StreamQueryStatistics()
+            results = list(session.advanced.stream(session.query(object_type=User), stats))
+
+            self.assertEqual(201, len(results))
+            self.assertEqual(201, stats.total_results)
+            self.assertIsNotNone(stats.index_name)
+            self.assertTrue(all(isinstance(result.document, User) for result in results))
+            self.assertTrue(all(result.change_vector for result in results))
+
+            # streamed entities are not tracked
+            self.assertEqual(1, session.advanced.number_of_requests)
+            self.assertFalse(session.advanced.is_loaded(results[0].key))
+
+    def test_stream_query_with_filter(self):
+        with self.store.open_session() as session:
+            query = session.query(object_type=User).where_greater_than("age", 189)
+            ages = sorted(result.document.age for result in session.advanced.stream(query))
+            self.assertEqual(list(range(190, 200)), ages)
+
+    def test_stream_starting_with(self):
+        with self.store.open_session() as session:
+            results = list(session.advanced.stream_starting_with("users/", User))
+            self.assertEqual(200, len(results))
+            self.assertTrue(all(result.key.startswith("users/") for result in results))
+
+            results = list(session.advanced.stream_starting_with("users/", User, page_size=10))
+            self.assertEqual(10, len(results))
+
+    def test_stream_into(self):
+        with self.store.open_session() as session:
+            output = io.BytesIO()
+            session.advanced.stream_into(session.query(object_type=User), output)
+
+            results = json.loads(output.getvalue())["Results"]
+            self.assertEqual(201, len(results))
@@ -1,6 +1,12 @@
 from __future__ import annotations
+import io
+import json
 from typing import Dict
 
+from ravendb.documents.commands.batches import PutAttachmentCommandData, PutCommandDataBase, SingleNodeBatchCommand
+from ravendb.documents.conventions import DocumentConventions
+from ravendb.documents.session.misc import TransactionMode
+from ravendb.http.server_node import ServerNode
 from ravendb.tests.test_base import TestBase
 from datetime import datetime
 from ravendb.tools.utils import Utils
@@ -111,6 +117,63 @@ class TestToJson(TestBase):
             self.assertIsNotNone(dog)
             self.assertTrue(isinstance(dog.date, datetime))
 
+    def test_entity_to_dict_matches_json_round_trip(self):
+        dog = Dog("Rex", Owner("Idan", Address("Ru", "Harish", "Israel")), datetime(2020, 1, 2, 3, 4, 5))
+        dog.tags = ("good", "boy")
+        dog.scores = {1: 1.5, "two": None, True: [1, 2]}
+        default_method = self.store.conventions.json_default_method
+
+        expected = json.loads(json.dumps(dog, default=default_method))
+        self.assertEqual(expected, Utils.entity_to_dict(dog, default_method))
+
+        dog.owner.dog = dog
+        with self.assertRaises(ValueError):
+            Utils.entity_to_dict(dog, default_method)
+
+    def test_batch_body_streamed_matches_encoded(self):
+        conventions = DocumentConventions()
+        commands = [
+            PutCommandDataBase(f"dogs/{i}", None, {"name": f"Rex {i}", "@metadata": {"@collection": "Dogs"}})
+            for i in range(5000)
+        ]
+        node = ServerNode("http://127.0.0.1:8080", "db")
+        expected = json.loads(
+            SingleNodeBatchCommand(conventions, commands, mode=TransactionMode.CLUSTER_WIDE).create_request(node).data
+        )
+
+        conventions.stream_batch_requests = True
+        body = (
+            SingleNodeBatchCommand(conventions, commands, mode=TransactionMode.CLUSTER_WIDE).create_request(node).data
+        )
+        chunks = list(body)
+        self.assertGreater(len(chunks), 1)
+        self.assertEqual(expected, json.loads(b"".join(chunks)))
+
+    def test_streamed_batch_body_with_attachments_is_rebuilt_for_a_retry(self):
+        conventions = DocumentConventions()
+        conventions.stream_batch_requests = True
+        node = ServerNode("http://127.0.0.1:8080", "db")
+
+        def _body(command: SingleNodeBatchCommand) -> bytes:
+            request = command.create_request(node)
+            boundary = request.headers["Content-Type"].split("boundary=")[1].encode()
+            return b"".join(request.data).replace(boundary, b"<boundary>")
+
+        put = PutCommandDataBase("dogs/1", None, {"name": "Rex", "@metadata": {"@collection": "Dogs"}})
+        command = SingleNodeBatchCommand(
+            conventions, [put, PutAttachmentCommandData("dogs/1", "photo", io.BytesIO(b"photo"), None, None)]
+        )
+        first = _body(command)
+        self.assertIn(b"\r\n\r\nphoto\r\n", first)
+        self.assertEqual(first, _body(command))
+
+        command = SingleNodeBatchCommand(
+            conventions, [put, PutAttachmentCommandData("dogs/1", "photo", iter([b"photo"]), None, None)]
+        )
+        _body(command)
+        with self.assertRaises(RuntimeError):
+            _body(command)
+
     def _check_dog_type(self, obj):
         self.assertTrue(isinstance(obj, Dog))
         self.assertTrue(isinstance(obj.owner, Owner))
@@ -8,12 +8,20 @@ class TestImports(TestBase):
 
     def test_imports_at_top_level(self):
         from ravendb import AggressiveCacheOptions
+        from ravendb import AggressiveCacheMode
+        from ravendb import AggressiveCacheScope
+        from ravendb import JsonCodec
+        from ravendb import StdlibJsonCodec
+        from ravendb import OrjsonCodec
+        from ravendb import HttpCompression
+        from ravendb import HttpCompressionAlgorithm
         from ravendb import ClusterRequestExecutor
         from ravendb import ClusterTopology
         from ravendb import CurrentIndexAndNode
         from ravendb import CurrentIndexAndNodeAndEtag
         from ravendb import Broadcast
         from ravendb import RaftCommand
+        from ravendb import NodeLatency
         from ravendb import NodeSelector
         from ravendb import LoadBalanceBehavior
         from ravendb import RavenCommand
@@ -179,8 +187,8 @@ class TestImports(TestBase):
         from ravendb import GetDatabaseRecordOperation
 
         # from ravendb import SetupDocumentBase
-        # from ravendb import StreamResultResponse
-        # from ravendb import StreamResult
+        from ravendb import StreamResultResponse
+        from ravendb import StreamResult
         from ravendb import BatchOperation
 
         # from ravendb import GetRevisionOperation
@@ -209,7 +217,7 @@ class TestImports(TestBase):
         from ravendb import MultiGetOperation
         from ravendb import QueryOperation
 
-        # from ravendb import StreamOperation
+        from ravendb import StreamOperation
         from ravendb import DeleteAttachmentOperation
         from ravendb import PutAttachmentOperation
         from ravendb import PatchResult
@@ -401,7 +409,7 @@ class TestImports(TestBase):
         # from ravendb import QueryOptions
         from ravendb import QueryStatistics
 
-        # from ravendb import StreamQueryStatistics
+        from ravendb import StreamQueryStatistics
         from ravendb import RawDocumentQuery
 
         # from ravendb import SessionEvents
@@ -452,6 +460,7 @@ class TestImports(TestBase):
 
         # from ravendb import MetadataObject
         from ravendb import TransactionMode
+        from ravendb import ChangeTrackingMode
         from ravendb import ConditionalLoadResult
 
         # from ravendb import ISessionDocumentCounters
@@ -0,0 +1,210 @@
+from __future__ import annotations
+
+import inspect
+import json
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import Any, Callable, Dict, FrozenSet, Generic, List, Optional, Tuple, Type, TypeVar
+
+from ravendb.tools.utils import Utils
+
+_T = TypeVar("_T")
+
+
+@lru_cache(maxsize=4096)
+def _to_snake_case(name: str) -> str:
+    return name if name == "Id" else Utils.convert_to_snake_case(name)
+
+
+class EntityDeserializer(Generic[_T]):
+    """
+    Builds entities of a single class out of json dicts.
+
+    Behaves like Utils.initialize_object, but the constructor signature is inspected only once per class
+    and snake_case key conversions are memoized, so deserializing a large batch of documents
+    doesn't pay for inspect.getfullargspec and regex work on every single one of them.
+    Instances are cached per (class, convert_to_snake_case) pair, use EntityDeserializer.for_type to get one.
+    """
+
+    __deserializers: Dict[Tuple[type, bool], EntityDeserializer] = {}
+
+    def __init__(self, object_type: Type[_T], convert_to_snake_case: bool = False):
+        self.__object_type = object_type
+        self.__convert_to_snake_case = convert_to_snake_case
+
+        args, _, varkw, defaults, _, _, _ = inspect.getfullargspec(object_type.__init__)
+        parameters = args[1:]
+        defaults = defaults or ()
+        required_count = len(parameters) - len(defaults)
+
+        self.__parameters: Tuple[str, ...] = tuple(parameters)
+        self.__parameters_set: FrozenSet[str] = frozenset(parameters)
+        self.__parameters_with_defaults: Tuple[Tuple[str, Any], ...] = tuple(
+            (name, None if i < required_count else defaults[i - required_count]) for i, name in enumerate(parameters)
+        )
+        self.__accepts_any_keyword = varkw is not None
+        self.__nested_converters: Dict[FrozenSet, List[Tuple[str, Callable[[Any], Any]]]] = {}
+
+    @classmethod
+    def for_type(cls, object_type: Type[_T], convert_to_snake_case: bool = False) -> EntityDeserializer[_T]:
+        cache_key = (object_type, bool(convert_to_snake_case))
+        deserializer = cls.__deserializers.get(cache_key)
+        if deserializer is None:
+            # racing threads may both build it, the result is the same
+            deserializer = cls(object_type, bool(convert_to_snake_case))
+            cls.__deserializers[cache_key] = deserializer
+        return deserializer
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        cls.__deserializers.clear()
+
+    @property
+    def object_type(self) -> Type[_T]:
+        return self.__object_type
+
+    def deserialize(self, document: Dict[str, Any], nested_object_types: Optional[Dict[str, type]] = None) -> _T:
+        source = document
+        if self.__convert_to_snake_case:
+            document = {_to_snake_case(key): value for key, value in document.items()}
+
+        set_needed = False
+        if len(self.__parameters) > len(document):
+            init_kwargs = {name: document.get(name, default) for name, default in self.__parameters_with_defaults}
+        elif self.__accepts_any_keyword:
+            init_kwargs = document
+        else:
+            parameters = self.__parameters_set
+            init_kwargs = {key: value for key, value in document.items() if key in parameters}
+            if not init_kwargs and self.__parameters:
+                set_needed = True
+                init_kwargs = dict.fromkeys(self.__parameters)
+
+        try:
+            entity = self.__object_type(**init_kwargs)
+        except Exception as e:
+            if "Id" not in init_kwargs:
+                init_kwargs["Id"] = None
+                entity = self.__object_type(**init_kwargs)
+            else:
+                raise TypeError(
+                    f"Couldn't initialize object of type '{self.__object_type.__name__}' using dict '{source}'"
+                ) from e
+
+        if set_needed:
+            for key, value in source.items():
+                setattr(entity, key, value)
+
+        if nested_object_types:
+            self.__fill_nested(entity, nested_object_types)
+
+        return entity
+
+    def __fill_nested(self, entity: _T, nested_object_types: Dict[str, type]) -> None:
+        cache_key = frozenset(nested_object_types.items())
+        converters = self.__nested_converters.get(cache_key)
+        if converters is None:
+            converters = [
+                (key, self.__create_converter(object_type)) for key, object_type in nested_object_types.items()
+            ]
+            self.__nested_converters[cache_key] = converters
+
+        for key, converter in converters:
+            value = getattr(entity, key)
+            if value:
+                setattr(entity, key, converter(value))
+
+    @staticmethod
+    def __create_converter(object_type: type) -> Callable[[Any], Any]:
+        if object_type is datetime:
+            convert_one = Utils.string_to_datetime
+        elif object_type is timedelta:
+            convert_one = Utils.string_to_timedelta
+        else:
+            convert_one = EntityDeserializer.for_type(object_type).deserialize
+
+        def __convert(value):
+            if isinstance(value, list):
+                return [convert_one(item) for item in value]
+            return convert_one(value)
+
+        return __convert
+
+
+_JSON_LEAF_TYPES = frozenset((str, int, float, bool, type(None)))
+
+
+class EntitySerializer:
+    """
+    Converts object graphs into json compatible dicts and lists.
+
+    The result is the same as json.loads(json.dumps(entity, default=default_method)), but it's built in a single
+    pass over the graph instead of encoding the whole entity into a string and parsing it back.
+    """
+
+    @staticmethod
+    def to_json_dict(entity: Any, default_method: Callable[[Any], Any]) -> Any:
+        try:
+            return EntitySerializer.__convert(entity, default_method)
+        except RecursionError:
+            raise ValueError("Circular reference detected")
+
+    @staticmethod
+    def __convert(value: Any, default_method: Callable[[Any], Any]) -> Any:
+        value_type = type(value)
+        if value_type is dict:
+            return EntitySerializer.__convert_dict(value, default_method)
+        if value_type is list:
+            return EntitySerializer.__convert_list(value, default_method)
+        if value_type in _JSON_LEAF_TYPES:
+            return value
+
+        # subclasses of json types are encoded by json as their base type, everything else goes through default
+        if isinstance(value, str):
+            return str.__str__(value)
+        if isinstance(value, bool):
+            return bool(value)
+        if isinstance(value, int):
+            return int(value)
+        if isinstance(value, float):
+            return float(value)
+        if isinstance(value, (list, tuple)):
+            return EntitySerializer.__convert_list(value, default_method)
+        if isinstance(value, dict):
+            return EntitySerializer.__convert_dict(value, default_method)
+
+        return EntitySerializer.__convert(default_method(value), default_method)
+
+    @staticmethod
+    def __convert_list(values, default_method: Callable[[Any], Any]) -> list:
+        convert = EntitySerializer.__convert
+        leaf_types = _JSON_LEAF_TYPES
+        return [value if type(value) in leaf_types else convert(value, default_method) for value in values]
+
+    @staticmethod
+    def __convert_dict(values: dict, default_method: Callable[[Any], Any]) -> dict:
+        convert = EntitySerializer.__convert
+        convert_key = EntitySerializer.__convert_key
+        leaf_types = _JSON_LEAF_TYPES
+        return {
+            (key if type(key) is str else convert_key(key)): (
+                value if type(value) in leaf_types else convert(value, default_method)
+            )
+            for key, value in values.items()
+        }
+
+    @staticmethod
+    def __convert_key(key: Any) -> str:
+        if isinstance(key, str):
+            return str.__str__(key)
+        if key is True:
+            return "true"
+        if key is False:
+            return "false"
+        if key is None:
+            return "null"
+        if isinstance(key, int):
+            return int.__repr__(key)
+        if isinstance(key, float):
+            return json.dumps(float(key))
+        raise TypeError(f"keys must be str, int, float, bool or None, not {key.__class__.__name__}")
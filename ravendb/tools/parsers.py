@@ -1,5 +1,8 @@
+import codecs
+import json
+import select
 from decimal import InvalidOperation
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 from ijson.common import integer_or_decimal, IncompleteJSONError
 from ijson.backends.python import UnexpectedSymbol
@@ -244,3 +247,89 @@ class IncrementalJsonParser:
                 result += esc
             start = pos + 1
         return result
+
+
+class JsonMessageReader:
+    """
+    Reads json objects sent one after another over a socket (e.g. subscription messages).
+
+    Received bytes go through an incremental utf-8 decoder into a text buffer, whole messages are decoded from it by
+    the C json scanner, which also tells where each message ends. A message split over many receives isn't re-parsed
+    after every receive - after a failed attempt the next one waits until the buffered data doubles, or until the
+    socket has nothing more to read and the received data ends a json object, so the total work stays linear.
+    """
+
+    _WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+    def __init__(self, sock, receive_buffer_size: int = 32 * 1024):
+        if receive_buffer_size <= 0:
+            raise ValueError("Receive buffer size must be positive")
+        self.socket = sock
+        self._chunk = memoryview(bytearray(receive_buffer_size))
+        self._utf8_decoder = codecs.getincrementaldecoder("utf-8")()
+        self._json_decoder = json.JSONDecoder()
+
+        self._text = ""
+        self._offset = 0  # start of the next message in the text
+        self._received: List[str] = []  # received after the text was last joined
+        self._received_length = 0
+        self._received_ends_object = False
+        self._next_attempt_length = 0  # of the buffered message, grows after every failed attempt
+
+    def next_object(self) -> Any:
+        """
+        Blocks until the next whole message is received and returns it decoded.
+        Raises ConnectionError when the socket is closed.
+        """
+        while True:
+            if self._should_attempt():
+                message = self._try_decode()
+                if message is not None:
+                    return message
+
+            received = self.socket.recv_into(self._chunk)
+            if received == 0:
+                message = self._try_decode()
+                if message is not None:
+                    return message
+                raise ConnectionError("Connection was closed by the remote side")
+            text = self._utf8_decoder.decode(self._chunk[:received])
+            self._received.append(text)
+            self._received_length += len(text)
+            text = text.rstrip()
+            if text:
+                self._received_ends_object = text[-1] == "}"
+
+    def _should_attempt(self) -> bool:
+        buffered = len(self._text) - self._offset + self._received_length
+        if buffered == 0:
+            return False
+        if buffered >= self._next_attempt_length:
+            return True
+        if not self._received or not self._received_ends_object:
+            return False
+
+        # nothing more arrives at the moment, the server might be waiting for us (e.g. for the batch ack)
+        return not select.select([self.socket], [], [], 0)[0]
+
+    def _try_decode(self) -> Optional[Any]:
+        if self._received:
+            self._text = self._text[self._offset :] + "".join(self._received)
+            self._offset = 0
+            self._received.clear()
+            self._received_length = 0
+
+        start = self._WHITESPACE.match(self._text, self._offset).end()
+        if start == len(self._text):
+            self._text = ""
+            self._offset = 0
+            return None
+
+        try:
+            message, self._offset = self._json_decoder.raw_decode(self._text, start)
+        except json.JSONDecodeError:
+            self._next_attempt_length = 2 * (len(self._text) - start)
+            return None
+
+        self._next_attempt_length = 0
+        return message
@@ -15,7 +15,7 @@ except ImportError:
     from collections import Iterable, Sequence
 
 from ravendb.tools.projection import create_entity_with_mapper
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from enum import Enum
 from threading import Timer
 from copy import deepcopy
@@ -29,6 +29,8 @@ _T = TypeVar("_T")
 _TKey = TypeVar("_TKey")
 _TVal = TypeVar("_TVal")
 
+_DATETIME_RE = re.compile(r"(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2})(?:\.(\d+))?(Z|[+-]\d{2}:?\d{2})?")
+
 _default_wildcards = {
     "-",
     "&",
@@ -491,14 +493,13 @@ class Utils(object):
         if object_type is None:
             return _DynamicStructure(**json_dict)
 
+        from ravendb.tools.entity_serializers import EntityDeserializer
+
+        deserializer = EntityDeserializer.for_type(object_type, True)
         if nested_object_types is None:
-            return Utils.initialize_object(json_dict, object_type, True)
+            return deserializer.deserialize(json_dict)
 
-        entity = _DynamicStructure(**json_dict)
-        entity.__class__ = object_type
-        entity = Utils.initialize_object(json_dict, object_type, True)
-        if nested_object_types:
-            Utils.fill_with_nested_object_types(entity, nested_object_types)
+        entity = deserializer.deserialize(json_dict, nested_object_types)
         Utils.deep_convert_to_snake_case(entity)
         return entity
 
@@ -661,12 +662,13 @@ class Utils(object):
 
     @staticmethod
     def datetime_to_string(datetime_obj: datetime, return_none_if_none: bool = True):
-        add_suffix = "0" if datetime_obj != datetime.max else "9"
-        return (
-            datetime_obj.strftime(f"%Y-%m-%dT%H:%M:%S.%f{add_suffix}")
-            if datetime_obj
-            else None if return_none_if_none else ""
-        )
+        if not datetime_obj:
+            return None if return_none_if_none else ""
+        if datetime_obj.tzinfo is not None:
+            # wall clock time, the offset isn't sent
+            datetime_obj = datetime_obj.replace(tzinfo=None)
+        # server's format has 7 fraction digits (ticks)
+        return datetime_obj.isoformat(timespec="microseconds") + ("0" if datetime_obj != datetime.max else "9")
 
     @staticmethod
     def start_a_timer(interval, function, args=None, name=None, daemon=False):
@@ -682,14 +684,29 @@ class Utils(object):
     def string_to_datetime(datetime_str):
         if datetime_str is None:
             return None
-        try:
-            if datetime_str.endswith("Z"):
-                datetime_str = datetime_str[:-1]
-            datetime_s = datetime.strptime(datetime_str, "%Y-%m-%dT%H:%M:%S.%f")
-        except ValueError:
-            datetime_s = datetime.strptime(datetime_str[:-1], "%Y-%m-%dT%H:%M:%S.%f")
 
-        return datetime_s
+        # server's format - yyyy-MM-ddTHH:mm:ss.fffffff with an optional Z, the 7th fraction digit is dropped
+        length = len(datetime_str)
+        if (
+            (length == 27 or length == 28 and datetime_str[27] == "Z")
+            and datetime_str[19] == "."
+            and datetime_str[20:27].isdigit()
+        ):
+            return datetime.fromisoformat(datetime_str[:26])
+
+        match = _DATETIME_RE.fullmatch(datetime_str)
+        if match is None:
+            raise ValueError(f"Invalid date '{datetime_str}', expected yyyy-MM-ddTHH:mm:ss.fffffff")
+
+        date_and_time, fraction, offset = match.groups()
+        result = datetime.fromisoformat(date_and_time)
+        if fraction:
+            result = result.replace(microsecond=int(fraction[:6].ljust(6, "0")))
+        if offset and offset != "Z":
+            hours, minutes = int(offset[1:3]), int(offset[-2:])
+            sign = -1 if offset[0] == "-" else 1
+            result = result.replace(tzinfo=timezone(sign * timedelta(hours=hours, minutes=minutes)))
+        return result
 
     @staticmethod
     def timedelta_tick(td):
@@ -942,7 +959,9 @@ class Utils(object):
 
     @staticmethod
     def entity_to_dict(entity, default_method) -> dict:
-        return json.loads(json.dumps(entity, default=default_method))
+        from ravendb.tools.entity_serializers import EntitySerializer
+
+        return EntitySerializer.to_json_dict(entity, default_method)
 
     @staticmethod
     def add_hours(date: datetime, hours: int):
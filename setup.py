@@ -25,5 +25,11 @@ setup(
         "websocket-client >= 0.46.0",
         "inflect >= 5.4.0",
     ],
+    extras_require={
+        "async": ["aiohttp >= 3.8.0"],
+        "orjson": ["orjson >= 3.6.0"],
+        "zstd": ["zstandard >= 0.18.0"],
+        "numpy": ["numpy >= 1.21.0"],
+    },
     zip_safe=False,
 )